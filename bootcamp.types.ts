@@ -64,6 +64,7 @@ export interface KomponenPenilaian {
   nama: string;                    // Nama komponen (e.g., "Participation", "Mini Project")
   deskripsi: string;               // Deskripsi komponen
   bobot: number;                   // Bobot dalam persen (%)
+  learningOutcomes?: string[];     // Kode LO yang dinilai (e.g., ["LO-1", "LO-3"])
   metode: string;                  // Metode penilaian
   kriteria: string[];              // Kriteria penilaian
 }
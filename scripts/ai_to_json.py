@@ -8,10 +8,14 @@ Handles communication with OpenAI API and parsing responses.
 
 import os
 import sys
+import copy
+import asyncio
 import json
+import hashlib
 import time
 import re
-from typing import Optional
+import threading
+from typing import Any, List, Optional
 
 # Fix encoding for Windows
 if sys.stdout:
@@ -24,6 +28,15 @@ if sys.stdout:
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 PARENT_DIR = os.path.dirname(BASE_DIR)
 
+# Local cache of the prompt prefix and its token count, keyed by content hash
+PROMPT_CACHE_FILE = os.path.join(PARENT_DIR, 'temp', 'prompt_prefix_cache.json')
+# Providers only cache prompts from this many tokens on (OpenAI: 1024)
+MIN_CACHEABLE_TOKENS = 1024
+
+class RequestCancelled(Exception):
+    """Raised when an in-flight OpenAI request is cancelled."""
+
+
 def load_api_key():
     """Load API key from .env.local or environment variable."""
     # Try environment variable first
@@ -70,67 +83,19 @@ def load_api_key():
     return None
 
 
-class BootcampAIGenerator:
-    """Generate Bootcamp Workshop JSON content using OpenAI API."""
-    
-    def __init__(self, api_key: Optional[str] = None):
-        """
-        Initialize Bootcamp AI Generator.
-        
-        Args:
-            api_key: Optional API key. If not provided, will load from .env.local or api_openai.txt
-        """
-        self.api_key = api_key or load_api_key()
-        self.client = None
-        self.model = "gpt-4o-mini"
-        
-        if self.api_key:
-            self._init_client()
-        else:
-            print("❌ No API key found!")
-            print("   Please set OPENAI_API_KEY in one of:")
-            print(f"   1. {os.path.join(PARENT_DIR, '.env.local')}")
-            print(f"   2. {os.path.join(BASE_DIR, 'api_openai.txt')}")
-            print("   3. Environment variable OPENAI_API_KEY")
-    
-    def _init_client(self) -> bool:
-        """Initialize OpenAI client with extended timeout."""
-        try:
-            from openai import OpenAI
-            # Set longer timeout for large generation requests (10 minutes)
-            self.client = OpenAI(api_key=self.api_key, timeout=600.0)
-            print("✅ OpenAI client initialized with 10-minute timeout")
-            return True
-        except Exception as e:
-            print(f"❌ Error initializing OpenAI client: {e}")
-            return False
-    
-    def generate_prompt(self, bootcamp_name: str, durasi: int = 8, 
-                       level: str = "Beginner", tipe: str = "Hybrid",
-                       additional_context: str = "") -> str:
-        """Generate prompt for OpenAI to create complete Bootcamp content."""
-
-        context_section = ""
-        if additional_context.strip():
-            context_section = f"\n## Konteks Tambahan:\n{additional_context}\n"
-
-        prompt_template = """Anda adalah ahli dalam merancang program bootcamp dan pelatihan intensif di bidang teknologi. Buatkan Rencana Program Bootcamp/Workshop lengkap untuk:
-
-## Informasi Bootcamp:
-- Nama: {bootcamp_name}
-- Durasi: {durasi} minggu
-- Level: {level}
-- Tipe: {tipe}
-{context_section}
+# Shared, bootcamp-independent part of every generation prompt. It must stay
+# byte-identical across requests so provider-side prompt caching can reuse it;
+# per-bootcamp fields go in the short suffix after it.
+PROMPT_PREFIX = """Anda adalah ahli dalam merancang program bootcamp dan pelatihan intensif di bidang teknologi. Buatkan Rencana Program Bootcamp/Workshop lengkap untuk bootcamp yang dijelaskan pada bagian "Informasi Bootcamp" di akhir pesan ini.
 
 ## Instruksi:
 Buatkan bootcamp curriculum dalam format JSON dengan struktur PERSIS seperti berikut. PENTING: Hanya output JSON murni tanpa markdown code block.
 
-{{
+{
   "deskripsi": "Deskripsi lengkap bootcamp 5-7 kalimat yang menjelaskan tujuan, cakupan, metodologi, dan manfaat bootcamp ini",
   "deskripsiSingkat": "Tagline menarik 1 kalimat yang merangkum esensi bootcamp",
   
-  "targetPeserta": {{
+  "targetPeserta": {
     "deskripsi": "Deskripsi umum siapa target peserta ideal untuk bootcamp ini",
     "latar_belakang": [
       "Fresh graduate IT/Computer Science",
@@ -147,28 +112,28 @@ Buatkan bootcamp curriculum dalam format JSON dengan struktur PERSIS seperti ber
       "Problem solving mindset",
       "Kemauan belajar mandiri dan kolaboratif"
     ]
-  }},
+  },
   
   "learningOutcomes": [
-    {{
+    {
       "kode": "LO-1",
       "pernyataan": "Peserta mampu membangun full-stack web application dari scratch",
       "kategori": "Technical"
-    }},
-    {{
+    },
+    {
       "kode": "LO-2",
       "pernyataan": "Peserta mampu bekerja dalam tim menggunakan Git workflow",
       "kategori": "Soft Skill"
-    }},
-    {{
+    },
+    {
       "kode": "LO-3",
       "pernyataan": "Peserta memiliki portfolio 3 projects untuk job application",
       "kategori": "Portfolio"
-    }}
+    }
   ],
   
   "minggu": [
-    {{
+    {
       "mingguKe": 1,
       "tema": "Introduction & Fundamentals",
       "learningOutcomes": ["LO-1"],
@@ -177,19 +142,19 @@ Buatkan bootcamp curriculum dalam format JSON dengan struktur PERSIS seperti ber
         "Development environment setup",
         "Version control with Git"
       ],
-      "metodePembelajaran": {{
+      "metodePembelajaran": {
         "metode": "Lecture + Workshop",
         "deskripsi": "Kombinasi lecture untuk konsep fundamental dengan hands-on workshop untuk memastikan pemahaman praktis dan penguasaan tools development modern",
         "aktivitas": "Mengikuti lecture interaktif memahami konsep dasar mengerjakan coding exercises hands-on setup development environment membuat first commit ke GitHub repository"
-      }},
+      },
       "waktu": "Lecture 2x120', Workshop 3x180'",
       "pengalamanBelajar": "Peserta akan setup development environment lengkap belajar Git workflow dasar membuat GitHub account dan repository pertama mengerjakan coding challenges fundamental untuk membangun fondasi programming yang kuat",
-      "penilaian": {{
+      "penilaian": {
         "kriteria": "Kelengkapan setup environment keberhasilan Git operations kualitas coding exercises ketepatan waktu submission aktivitas participation dalam workshop session",
         "bobot": 5
-      }}
-    }},
-    {{
+      }
+    },
+    {
       "mingguKe": 2,
       "tema": "Frontend Development - HTML, CSS, JavaScript",
       "learningOutcomes": ["LO-1"],
@@ -198,13 +163,13 @@ Buatkan bootcamp curriculum dalam format JSON dengan struktur PERSIS seperti ber
         "CSS3 responsive design",
         "JavaScript ES6+ fundamentals"
       ],
-      "metodePembelajaran": {{
+      "metodePembelajaran": {
         "metode": "Workshop + Mini Project",
         "deskripsi": "Workshop intensif frontend development dengan real-world examples diikuti mini project untuk mengaplikasikan semua konsep yang dipelajari dalam project portfolio personal",
         "aktivitas": "Mengikuti live coding workshop membangun responsive web pages mengerjakan JavaScript exercises membuat mini project personal portfolio website dengan HTML CSS JavaScript modern"
-      }},
+      },
       "waktu": "Workshop 4x180', Project Work 2x120'",
-      "project": {{
+      "project": {
         "nama": "Personal Portfolio Website",
         "deskripsi": "Membuat responsive portfolio website menggunakan HTML5, CSS3, dan vanilla JavaScript",
         "deliverables": [
@@ -213,42 +178,45 @@ Buatkan bootcamp curriculum dalam format JSON dengan struktur PERSIS seperti ber
           "Deployed website (Netlify/Vercel)"
         ],
         "teknologi": ["HTML5", "CSS3", "JavaScript ES6+", "Git"]
-      }},
+      },
       "pengalamanBelajar": "Peserta akan menguasai fundamental frontend development membangun responsive website dari scratch mengimplementasikan modern CSS techniques seperti Flexbox Grid menulis clean JavaScript code deploy website pertama ke production environment",
-      "penilaian": {{
+      "penilaian": {
         "kriteria": "Kualitas responsive design clean semantic HTML modern CSS implementation functional JavaScript interactivity code quality deployment success presentasi project creativity dan usability website",
         "bobot": 10
-      }}
-    }}
+      }
+    }
   ],
   
   "assessment": [
-    {{
+    {
       "nama": "Participation & Attendance",
       "deskripsi": "Kehadiran aktif dalam session dan partisipasi dalam diskusi",
       "bobot": 10,
+      "learningOutcomes": ["LO-2"],
       "metode": "Observasi instruktur dan tracking kehadiran",
       "kriteria": [
         "Kehadiran minimum 80% dari total session",
         "Aktif bertanya dan berdiskusi",
         "Membantu sesama peserta"
       ]
-    }},
-    {{
+    },
+    {
       "nama": "Weekly Assignments",
       "deskripsi": "Tugas mingguan untuk memperkuat pemahaman",
       "bobot": 25,
+      "learningOutcomes": ["LO-1"],
       "metode": "Code review dan automated testing",
       "kriteria": [
         "Ketepatan waktu submission",
         "Code quality dan best practices",
         "Functionality dan test coverage"
       ]
-    }},
-    {{
+    },
+    {
       "nama": "Mini Projects",
       "deskripsi": "Project kecil untuk mengaplikasikan skill yang dipelajari",
       "bobot": 30,
+      "learningOutcomes": ["LO-1", "LO-2"],
       "metode": "Project evaluation dan peer review",
       "kriteria": [
         "Implementasi requirement lengkap",
@@ -256,11 +224,12 @@ Buatkan bootcamp curriculum dalam format JSON dengan struktur PERSIS seperti ber
         "UI/UX quality",
         "Documentation quality"
       ]
-    }},
-    {{
+    },
+    {
       "nama": "Final Capstone Project",
       "deskripsi": "Project akhir comprehensive sebagai portfolio piece",
       "bobot": 35,
+      "learningOutcomes": ["LO-1", "LO-3"],
       "metode": "Presentation, demo, dan code review",
       "kriteria": [
         "Technical complexity",
@@ -268,23 +237,23 @@ Buatkan bootcamp curriculum dalam format JSON dengan struktur PERSIS seperti ber
         "Production readiness",
         "Presentation dan demo quality"
       ]
-    }}
+    }
   ],
   
   "instruktur": [
-    {{
+    {
       "nama": "John Doe",
       "expertise": ["Full Stack Development", "System Architecture", "DevOps"],
       "peran": "Lead Instructor"
-    }},
-    {{
+    },
+    {
       "nama": "Jane Smith",
       "expertise": ["Frontend Development", "UI/UX Design", "React"],
       "peran": "Assistant Instructor"
-    }}
+    }
   ],
   
-  "toolsResources": {{
+  "toolsResources": {
     "software": [
       "VS Code / IDE pilihan",
       "Git",
@@ -302,10 +271,10 @@ Buatkan bootcamp curriculum dalam format JSON dengan struktur PERSIS seperti ber
       "Vercel/Netlify account",
       "Discord/Slack workspace"
     ]
-  }},
+  },
   
-  "sertifikasi": {{
-    "nama": "Certificate of Completion - {bootcamp_name}",
+  "sertifikasi": {
+    "nama": "Certificate of Completion - <Nama Bootcamp>",
     "syarat_kelulusan": [
       "Nilai akhir minimal 70%",
       "Kehadiran minimal 80%",
@@ -319,7 +288,7 @@ Buatkan bootcamp curriculum dalam format JSON dengan struktur PERSIS seperti ber
       "Akses ke alumni network",
       "Career coaching session"
     ]
-  }},
+  },
   
   "referensi": [
     "MDN Web Docs - https://developer.mozilla.org",
@@ -328,38 +297,181 @@ Buatkan bootcamp curriculum dalam format JSON dengan struktur PERSIS seperti ber
     "You Don't Know JS (Book Series) - Kyle Simpson",
     "Eloquent JavaScript - Marijn Haverbeke"
   ]
-}}
+}
 
 ## Catatan Penting:
 - Gunakan bahasa Indonesia yang profesional namun friendly
-- Konten harus sangat relevan dengan "{bootcamp_name}"
-- Jumlah minggu harus sesuai durasi: {durasi} minggu
+- Konten harus sangat relevan dengan nama bootcamp
+- Jumlah minggu harus sesuai durasi
 - WAJIB untuk setiap minggu:
   * "metodePembelajaran.deskripsi": minimal 20 kata menjelaskan metode dan pendekatan pembelajaran
   * "metodePembelajaran.aktivitas": minimal 20 kata menjelaskan aktivitas konkret peserta
   * "pengalamanBelajar": minimal 30 kata menjelaskan pengalaman dan skill yang didapat
   * "penilaian.kriteria": minimal 20 kata kriteria penilaian yang jelas dan terukur
 - Total bobot assessment harus 100%
+- Setiap komponen assessment mencantumkan kode LO yang dinilainya di "learningOutcomes"
 - Total bobot penilaian mingguan (jika ada) harus 100%
 - Learning outcomes harus mencakup: Technical skills, Soft skills, dan Portfolio
 - materiPokok harus spesifik dan praktis, bukan generik
-- Sesuaikan dengan level: {level} (Beginner = fundamental, Intermediate = applied, Advanced = advanced topics)
-- Tipe {tipe}: Online (full remote), Offline (full onsite), Hybrid (kombinasi)
+- Sesuaikan dengan level (Beginner = fundamental, Intermediate = applied, Advanced = advanced topics)
+- Sesuaikan dengan tipe: Online (full remote), Offline (full onsite), Hybrid (kombinasi)
 - Variasikan metode pembelajaran: Lecture, Workshop, Project-Based, Case Study, Peer Learning
 - Referensi harus nyata dan dapat diakses (buku, website, course online, dokumentasi)
+"""
 
-Output JSON saja, tanpa markdown formatting atau penjelasan."""
 
-        return prompt_template.format(
-            bootcamp_name=bootcamp_name,
-            durasi=durasi,
-            level=level,
-            tipe=tipe,
-            context_section=context_section
-        )
+def prompt_prefix_info(prefix: str, model: str, cache_path: Optional[str] = PROMPT_CACHE_FILE) -> dict:
+    """
+    Token count of a prompt prefix, cached locally so it is computed once per prefix.
     
-    def parse_json_response(self, response: str) -> dict:
-        """Parse JSON from OpenAI response, handle markdown code blocks and common JSON errors."""
+    Uses tiktoken when installed, otherwise a 4-characters-per-token estimate.
+    
+    Returns:
+        {"hash", "model", "tokens", "method", "chars"}
+    """
+    key = hashlib.sha256(f"{model}\n{prefix}".encode("utf-8")).hexdigest()[:16]
+    cache = {}
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            cache = {}
+    if key in cache:
+        return cache[key]
+    
+    try:
+        import tiktoken
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            encoding = tiktoken.get_encoding("o200k_base")
+        tokens, method = len(encoding.encode(prefix)), "tiktoken"
+    except ImportError:
+        tokens, method = len(prefix) // 4, "estimate"
+    
+    info = {"hash": key, "model": model, "tokens": tokens, "method": method, "chars": len(prefix)}
+    if cache_path:
+        cache[key] = info
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # Concurrent runs (Express, load tests, bulk jobs) must never see a half-written file
+            tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=2)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"⚠️ Could not save prompt prefix cache: {e}")
+    return info
+
+
+class BootcampAIGenerator:
+    """Generate Bootcamp Workshop JSON content using OpenAI API."""
+    
+    SYSTEM_PROMPT = "You are an expert in designing intensive bootcamp and workshop programs in technology and coding."
+    # Top-level sections the generation prompt asks for
+    REQUIRED_SECTIONS = [
+        "deskripsi", "deskripsiSingkat", "targetPeserta", "learningOutcomes", "minggu",
+        "assessment", "instruktur", "toolsResources", "sertifikasi", "referensi"
+    ]
+    WEEK_FIELDS = [
+        "mingguKe", "tema", "learningOutcomes", "materiPokok", "metodePembelajaran",
+        "waktu", "pengalamanBelajar", "penilaian"
+    ]
+    ASSESSMENT_FIELDS = ["nama", "deskripsi", "bobot", "metode", "kriteria"]
+    # How often a cancellable request checks its cancel events (seconds)
+    CANCEL_POLL_INTERVAL = 0.05
+    
+    CONTINUATION_PROMPT = (
+        "Your previous response was cut off because it reached the output limit. "
+        "Continue EXACTLY from the last character you wrote. Do not repeat any earlier text, "
+        "do not restart the JSON, and do not add markdown or explanations."
+    )
+    
+    def __init__(self, api_key: Optional[str] = None, require_key: bool = True):
+        """
+        Initialize Bootcamp AI Generator.
+        
+        Args:
+            api_key: Optional API key. If not provided, will load from .env.local or api_openai.txt
+            require_key: Report a missing key as an error (False when requests
+                         are routed over configured backends, see enable_routing)
+        """
+        self.api_key = api_key or load_api_key()
+        self.client = None
+        self.model = "gpt-4o-mini"
+        self.last_finish_reason = None
+        self.last_usage = None
+        self.usage_log = []
+        self.stream = False
+        self.hedger = None
+        self.router = None
+        self.cancel_event = None
+        
+        if self.api_key:
+            self._init_client()
+        elif require_key:
+            print("❌ No API key found!")
+            print("   Please set OPENAI_API_KEY in one of:")
+            print(f"   1. {os.path.join(PARENT_DIR, '.env.local')}")
+            print(f"   2. {os.path.join(BASE_DIR, 'api_openai.txt')}")
+            print("   3. Environment variable OPENAI_API_KEY")
+    
+    @property
+    def is_ready(self) -> bool:
+        """Whether requests can be sent (OpenAI client or backend router)."""
+        return self.client is not None or self.router is not None
+    
+    def _init_client(self) -> bool:
+        """Initialize OpenAI client with extended timeout."""
+        try:
+            from openai import OpenAI
+            # Set longer timeout for large generation requests (10 minutes)
+            self.client = OpenAI(api_key=self.api_key, timeout=600.0)
+            print("✅ OpenAI client initialized with 10-minute timeout")
+            return True
+        except Exception as e:
+            print(f"❌ Error initializing OpenAI client: {e}")
+            return False
+    
+    def generate_prompt(self, bootcamp_name: str, durasi: int = 8, 
+                       level: str = "Beginner", tipe: str = "Hybrid",
+                       additional_context: str = "") -> str:
+        """Generate prompt for OpenAI to create complete Bootcamp content."""
+        prefix, suffix = self.generate_prompt_parts(bootcamp_name, durasi, level, tipe, additional_context)
+        return prefix + suffix
+    
+    def generate_prompt_parts(self, bootcamp_name: str, durasi: int = 8,
+                              level: str = "Beginner", tipe: str = "Hybrid",
+                              additional_context: str = "") -> tuple:
+        """
+        Split the generation prompt into a shared prefix and a per-bootcamp suffix.
+        
+        Returns:
+            (prefix, suffix) - prefix is PROMPT_PREFIX for every bootcamp
+        """
+        return PROMPT_PREFIX, "\n" + self._bootcamp_info(
+            bootcamp_name, durasi, level, tipe, additional_context
+        ) + "\nOutput JSON saja, tanpa markdown formatting atau penjelasan."
+    
+    @staticmethod
+    def _bootcamp_info(bootcamp_name: str, durasi: int, level: str, tipe: str,
+                       additional_context: str = "") -> str:
+        """Per-bootcamp part of a prompt."""
+        context_section = ""
+        if additional_context.strip():
+            context_section = f"\n## Konteks Tambahan:\n{additional_context}\n"
+        
+        return f"""## Informasi Bootcamp:
+- Nama: {bootcamp_name}
+- Durasi: {durasi} minggu
+- Level: {level}
+- Tipe: {tipe}
+{context_section}"""
+    
+    @staticmethod
+    def _strip_code_fence(response: str) -> str:
+        """Remove a surrounding ```json ... ``` block if present."""
         text = response.strip()
         
         # Handle ```json ... ``` format
@@ -371,6 +483,13 @@ Output JSON saja, tanpa markdown formatting atau penjelasan."""
                 lines = lines[:-1]
             text = "\n".join(lines).strip()
         
+        return text
+    
+    @classmethod
+    def parse_json_response(cls, response: str) -> dict:
+        """Parse JSON from OpenAI response, handle markdown code blocks and common JSON errors."""
+        text = cls._strip_code_fence(response)
+        
         # Try direct parsing first
         try:
             return json.loads(text)
@@ -446,52 +565,117 @@ Output JSON saja, tanpa markdown formatting atau penjelasan."""
                     0
                 )
     
-    def send_message(self, prompt: str, max_retries: int = 3) -> Optional[str]:
+    def send_message(self, prompt: str, max_retries: int = 3,
+                     max_continuations: int = 3) -> Optional[str]:
         """
         Send message to OpenAI and get response.
         
+        If the model stops because it hit its output limit (finish_reason
+        "length"), a continuation is requested from the exact cut point and
+        the pieces are stitched together instead of regenerating everything.
+        
         Args:
             prompt: The prompt to send
             max_retries: Maximum number of retries on failure
+            max_continuations: Maximum continuation requests after truncation
             
         Returns:
             Response text or None if failed
         """
-        if not self.client:
-            print("❌ OpenAI client not initialized")
+        if not self.is_ready:
+            print("❌ No OpenAI client or backends configured")
+            return None
+        
+        messages = [
+            {"role": "system", "content": self.SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+        
+        result = self._request_with_retry(messages, max_retries, hedge=True)
+        if result is None:
             return None
+        content, finish_reason = result
         
+        continuations = 0
+        while finish_reason == "length" and continuations < max_continuations:
+            continuations += 1
+            print(f"⚠️ Response truncated at {len(content)} chars (finish_reason=length)")
+            print(f"   Requesting continuation {continuations}/{max_continuations}...")
+            
+            continuation_messages = messages + [
+                {"role": "assistant", "content": content},
+                {"role": "user", "content": self.CONTINUATION_PROMPT}
+            ]
+            result = self._request_with_retry(continuation_messages, max_retries)
+            if result is None:
+                print("❌ Continuation failed - returning truncated response")
+                break
+            more, finish_reason = result
+            content = self._stitch_continuation(content, more)
+            print(f"✅ Stitched continuation ({len(content)} chars total)")
+        
+        self.last_finish_reason = finish_reason
+        if finish_reason == "length":
+            print("⚠️ Response still truncated after all continuation attempts")
+        
+        return content
+    
+    def _request_with_retry(self, messages: list, max_retries: int = 3,
+                            hedge: bool = False) -> Optional[tuple]:
+        """
+        Send one chat completion request with exponential backoff.
+        
+        Args:
+            messages: Chat messages to send
+            max_retries: Maximum number of retries on failure
+            hedge: Allow a hedged duplicate request (if hedging is enabled)
+        
+        Returns:
+            (content, finish_reason) tuple or None if failed
+        """
         for attempt in range(max_retries):
+            if self._cancel_requested():
+                print("🛑 Request cancelled")
+                return None
             try:
                 print(f"🤖 Sending message to OpenAI (attempt {attempt + 1}/{max_retries})...")
-                print(f"   Model: {self.model}")
+                if not self.router:
+                    print(f"   Model: {self.model}")
                 
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": "You are an expert in designing intensive bootcamp and workshop programs in technology and coding."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0.7
-                )
+                if hedge and self.hedger:
+                    result = self.hedger.run(
+                        lambda cancel, first: self._request_once(messages, cancel, first),
+                        self._is_usable_response,
+                        streaming=self.stream
+                    )
+                else:
+                    result = self._request_once(messages, self.cancel_event)
                 
-                if response.choices and len(response.choices) > 0:
-                    content = response.choices[0].message.content
-                    if content:
-                        print(f"✅ Received response from OpenAI ({len(content)} chars)")
-                        return content
+                if result:
+                    print(f"✅ Received response from OpenAI ({len(result[0])} chars)")
+                    return result
                 
                 print("⚠️ Empty response from OpenAI")
                 return None
                 
+            except RequestCancelled:
+                print("🛑 Request cancelled")
+                return None
+                
             except Exception as e:
                 error_str = str(e)
                 print(f"❌ Error on attempt {attempt + 1}: {error_str}")
                 
                 if attempt < max_retries - 1:
+                    if self.router and self.router.has_healthy():
+                        # Another backend can take the retry right away
+                        continue
                     wait_time = (2 ** attempt) * 3
                     print(f"⏳ Waiting {wait_time} seconds before retry...")
-                    time.sleep(wait_time)
+                    if self.cancel_event is not None:
+                        self.cancel_event.wait(wait_time)
+                    else:
+                        time.sleep(wait_time)
                 else:
                     print("❌ All retry attempts failed")
                     import traceback
@@ -500,31 +684,761 @@ Output JSON saja, tanpa markdown formatting atau penjelasan."""
         
         return None
     
+    def _request_once(self, messages: list, cancel_event: Optional[threading.Event] = None,
+                      first_token_event: Optional[threading.Event] = None) -> Optional[tuple]:
+        """
+        Send a single chat completion request, through the backend router if enabled.
+        
+        Returns:
+            (content, finish_reason) tuple or None for an empty response
+        """
+        if not self.router:
+            return self._request_backend(self.client, self.model, messages, cancel_event, first_token_event)
+        
+        backend = self.router.choose()
+        print(f"   Backend: {backend.name} ({backend.model})")
+        start = time.perf_counter()
+        try:
+            result = self._request_backend(backend.client, backend.model, messages,
+                                           cancel_event, first_token_event)
+        except RequestCancelled:
+            self.router.release(backend)
+            raise
+        except Exception:
+            self.router.record(backend, time.perf_counter() - start, False)
+            raise
+        self.router.record(backend, time.perf_counter() - start, True)
+        return result
+    
+    def _request_backend(self, client, model: str, messages: list,
+                         cancel_event: Optional[threading.Event] = None,
+                         first_token_event: Optional[threading.Event] = None) -> Optional[tuple]:
+        """
+        Send a single chat completion request.
+        
+        A request that can be cancelled (cancel_event or the generator's own
+        cancel_event) runs on an async client in a private event loop, so it
+        can be aborted at any point, including while still waiting for the
+        response headers.
+        
+        Args:
+            client: OpenAI client to use
+            model: Model name
+            messages: Chat messages to send
+            cancel_event: Set to abort the request (raises RequestCancelled)
+            first_token_event: Set when the first streamed token arrives
+        
+        Returns:
+            (content, finish_reason) tuple or None for an empty response
+        """
+        cancel_events = [e for e in (cancel_event, self.cancel_event) if e is not None]
+        if cancel_events:
+            return asyncio.run(self._request_cancellable(client, model, messages,
+                                                         cancel_events, first_token_event))
+        
+        start = time.perf_counter()
+        if not self.stream:
+            response = client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=0.7
+            )
+            return self._completion_result(response, start)
+        
+        stream = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=0.7,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        state = self._new_stream_state(start)
+        try:
+            for chunk in stream:
+                self._add_chunk(state, chunk, first_token_event)
+        finally:
+            stream.close()
+        return self._stream_result(state)
+    
+    async def _request_cancellable(self, client, model: str, messages: list,
+                                   cancel_events: List[threading.Event],
+                                   first_token_event: Optional[threading.Event] = None) -> Optional[tuple]:
+        """
+        Run the request as a task and cancel it once any cancel event is set.
+        
+        Cancelling the task closes the connection, so the request is aborted
+        within CANCEL_POLL_INTERVAL whatever stage it is in.
+        """
+        from openai import AsyncOpenAI
+        
+        async with AsyncOpenAI(api_key=client.api_key, base_url=client.base_url,
+                               timeout=client.timeout, max_retries=client.max_retries) as async_client:
+            task = asyncio.ensure_future(self._request_async(async_client, model, messages, first_token_event))
+            while not task.done():
+                if any(event.is_set() for event in cancel_events):
+                    task.cancel()
+                    await asyncio.wait({task})
+                    raise RequestCancelled("Request cancelled")
+                await asyncio.wait({task}, timeout=self.CANCEL_POLL_INTERVAL)
+            return task.result()
+    
+    async def _request_async(self, client, model: str, messages: list,
+                             first_token_event: Optional[threading.Event] = None) -> Optional[tuple]:
+        """Async counterpart of the plain request path in _request_backend."""
+        start = time.perf_counter()
+        if not self.stream:
+            response = await client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=0.7
+            )
+            return self._completion_result(response, start)
+        
+        stream = await client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=0.7,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        state = self._new_stream_state(start)
+        try:
+            async for chunk in stream:
+                self._add_chunk(state, chunk, first_token_event)
+        finally:
+            await stream.close()
+        return self._stream_result(state)
+    
+    def _completion_result(self, response, start: float) -> Optional[tuple]:
+        """(content, finish_reason) of a non-streamed response, recording its usage."""
+        self._record_usage(response, time.perf_counter() - start)
+        if response.choices and len(response.choices) > 0:
+            choice = response.choices[0]
+            if choice.message.content:
+                return choice.message.content, choice.finish_reason
+        return None
+    
+    @staticmethod
+    def _new_stream_state(start: float) -> dict:
+        return {"start": start, "parts": [], "finish_reason": None, "usage_chunk": None, "first_token": None}
+    
+    @staticmethod
+    def _add_chunk(state: dict, chunk, first_token_event: Optional[threading.Event] = None):
+        """Accumulate one streamed chunk into state."""
+        if getattr(chunk, "usage", None):
+            state["usage_chunk"] = chunk
+        if not chunk.choices:
+            return
+        choice = chunk.choices[0]
+        if choice.delta and choice.delta.content:
+            if not state["parts"]:
+                state["first_token"] = time.perf_counter() - state["start"]
+                if first_token_event is not None:
+                    first_token_event.set()
+            state["parts"].append(choice.delta.content)
+        if choice.finish_reason:
+            state["finish_reason"] = choice.finish_reason
+    
+    def _stream_result(self, state: dict) -> Optional[tuple]:
+        """(content, finish_reason) of a finished stream, recording its usage."""
+        if state["usage_chunk"] is not None:
+            self._record_usage(state["usage_chunk"], time.perf_counter() - state["start"],
+                               state["first_token"])
+        content = "".join(state["parts"])
+        return (content, state["finish_reason"]) if content else None
+    
+    def _cancel_requested(self, cancel_event: Optional[threading.Event] = None) -> bool:
+        """Whether this request or the whole generation has been cancelled."""
+        return any(event is not None and event.is_set() for event in (cancel_event, self.cancel_event))
+    
+    def with_cancel(self, cancel_event: threading.Event) -> "BootcampAIGenerator":
+        """
+        Copy of this generator (sharing its configuration) whose requests are
+        all aborted once cancel_event is set.
+        """
+        job_generator = copy.copy(self)
+        job_generator.cancel_event = cancel_event
+        job_generator.usage_log = []
+        return job_generator
+    
+    def _is_usable_response(self, result: Optional[tuple]) -> bool:
+        """A hedged response wins if it is valid JSON or a truncation we can continue."""
+        if not result:
+            return False
+        content, finish_reason = result
+        if finish_reason == "length":
+            return True
+        try:
+            json.loads(self._strip_code_fence(content))
+            return True
+        except json.JSONDecodeError:
+            return False
+    
+    def enable_hedging(self, quantile: float = 0.9, budget: float = 0.1,
+                       initial_deadline: Optional[float] = 120.0,
+                       history_path: Optional[str] = None):
+        """
+        Hedge slow requests with a speculative duplicate.
+        
+        Args:
+            quantile: Latency quantile from recent history used as the deadline
+            budget: Maximum fraction of requests that may be hedged
+            initial_deadline: Deadline (seconds) until enough history is collected
+            history_path: Latency history file (default: temp/latency_history.json)
+        """
+        from hedging import RequestHedger, DEFAULT_HISTORY_FILE
+        self.hedger = RequestHedger(
+            quantile=quantile,
+            budget=budget,
+            history_path=history_path or DEFAULT_HISTORY_FILE,
+            initial_deadline=initial_deadline
+        )
+        print(f"⚡ Hedging enabled (p{int(quantile * 100)} deadline, {budget:.0%} budget)")
+    
+    def enable_routing(self, config: Any, **router_options):
+        """
+        Route requests over several OpenAI-compatible backends.
+        
+        Works without an OpenAI key as long as every backend has its own
+        api_key or base_url; the generator's key is only the default.
+        
+        Args:
+            config: Backends JSON file or list (see backends.py)
+            **router_options: BackendRouter options (failure_threshold, cooldown, ...)
+        """
+        from backends import BackendRouter, load_backends
+        self.router = BackendRouter(load_backends(config, self.api_key), **router_options)
+        names = ', '.join(f"{b.name} ({b.model})" for b in self.router.backends)
+        print(f"🔌 Routing enabled over {len(self.router.backends)} backends: {names}")
+    
+    def _record_usage(self, response, latency: Optional[float] = None,
+                      first_token: Optional[float] = None):
+        """
+        Keep token usage of the last response and log it per call.
+        
+        Cached input tokens come from usage.prompt_tokens_details.cached_tokens
+        (0 when the provider does not report prompt caching).
+        """
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = (getattr(details, "cached_tokens", 0) if details is not None else 0) or 0
+        self.last_usage = {
+            "prompt_tokens": getattr(usage, "prompt_tokens", 0),
+            "cached_tokens": cached,
+            "completion_tokens": getattr(usage, "completion_tokens", 0),
+            "total_tokens": getattr(usage, "total_tokens", 0)
+        }
+        self.usage_log.append(dict(self.last_usage, latency=latency, first_token=first_token))
+        print(f"   Tokens: {self.last_usage['prompt_tokens']} in ({cached} cached) / "
+              f"{self.last_usage['completion_tokens']} out")
+    
+    def usage_report(self) -> str:
+        """Summarize cached vs uncached input tokens and latency over all calls."""
+        if not self.usage_log:
+            return "No token usage recorded"
+        prompt = sum(u["prompt_tokens"] for u in self.usage_log)
+        cached = sum(u["cached_tokens"] for u in self.usage_log)
+        completion = sum(u["completion_tokens"] for u in self.usage_log)
+        lines = [
+            f"Calls: {len(self.usage_log)}",
+            f"Input tokens: {prompt} ({cached} cached, {prompt - cached} uncached, "
+            f"{cached / prompt * 100 if prompt else 0:.1f}% cache hit)",
+            f"Output tokens: {completion}"
+        ]
+        for label, hit in [("cache hit", True), ("cache miss", False)]:
+            calls = [u for u in self.usage_log if (u["cached_tokens"] > 0) == hit]
+            latencies = [u["latency"] for u in calls if u["latency"] is not None]
+            first_tokens = [u["first_token"] for u in calls if u["first_token"] is not None]
+            if not latencies:
+                continue
+            line = f"Calls with {label}: {len(calls)}, avg latency {sum(latencies) / len(latencies):.2f}s"
+            if first_tokens:
+                line += f", avg first token {sum(first_tokens) / len(first_tokens):.2f}s"
+            lines.append(line)
+        return "\n".join(lines)
+    
+    @staticmethod
+    def _stitch_continuation(content: str, continuation: str, max_overlap: int = 200) -> str:
+        """
+        Join a truncated response with its continuation.
+        
+        Strips a markdown fence the model may open the continuation with and
+        drops text it repeated from the end of the previous part.
+        """
+        more = continuation
+        if more.lstrip().startswith("```"):
+            more = more.lstrip().split("\n", 1)[1] if "\n" in more.lstrip() else ""
+        
+        # Short overlaps (a quote, a brace) are too likely to be coincidental
+        for size in range(min(max_overlap, len(content), len(more)), 11, -1):
+            if content.endswith(more[:size]):
+                more = more[size:]
+                break
+        
+        return content + more
+    
+    @classmethod
+    def salvage_json_sections(cls, response: str) -> dict:
+        """
+        Recover the valid top-level sections of a malformed JSON response.
+        
+        Sections are decoded one by one until the first broken value. If the
+        broken value is an array (e.g. "minggu"), its complete leading items
+        are kept so only the rest has to be regenerated.
+        
+        Args:
+            response: Raw response text
+            
+        Returns:
+            Dictionary with every section that could be decoded (may be empty)
+        """
+        text = cls._strip_code_fence(response)
+        decoder = json.JSONDecoder()
+        separator = re.compile(r'[\s,]*')
+        colon = re.compile(r'\s*:\s*')
+        data = {}
+        
+        pos = text.find('{')
+        if pos == -1:
+            return data
+        pos += 1
+        
+        while True:
+            pos = separator.match(text, pos).end()
+            if pos >= len(text) or text[pos] == '}':
+                break
+            value_pos = None
+            try:
+                key, pos = decoder.raw_decode(text, pos)
+                if not isinstance(key, str):
+                    break
+                match = colon.match(text, pos)
+                if not match:
+                    break
+                value_pos = match.end()
+                value, pos = decoder.raw_decode(text, value_pos)
+            except json.JSONDecodeError:
+                if value_pos is not None and text.startswith('[', value_pos):
+                    items = cls._salvage_json_array(text, value_pos, decoder)
+                    if items:
+                        data[key] = items
+                break
+            data[key] = value
+        
+        return data
+    
+    @staticmethod
+    def _salvage_json_array(text: str, pos: int, decoder: json.JSONDecoder) -> list:
+        """Decode the complete leading items of a broken JSON array starting at pos."""
+        items = []
+        separator = re.compile(r'[\s,]*')
+        pos += 1
+        while True:
+            pos = separator.match(text, pos).end()
+            if pos >= len(text) or text[pos] == ']':
+                break
+            try:
+                item, pos = decoder.raw_decode(text, pos)
+            except json.JSONDecodeError:
+                break
+            items.append(item)
+        return items
+    
+    @classmethod
+    def _is_valid_week(cls, week: Any) -> bool:
+        """Check that a minggu entry has every field the DOCX export needs."""
+        if not isinstance(week, dict) or not isinstance(week.get("mingguKe"), int):
+            return False
+        if any(field not in week for field in cls.WEEK_FIELDS):
+            return False
+        metode = week["metodePembelajaran"]
+        penilaian = week["penilaian"]
+        return (isinstance(metode, dict)
+                and all(k in metode for k in ("metode", "deskripsi", "aktivitas"))
+                and isinstance(penilaian, dict)
+                and all(k in penilaian for k in ("kriteria", "bobot")))
+    
+    @staticmethod
+    def _has_valid_lo_refs(assessments: list, learning_outcomes: Any) -> bool:
+        """Check that assessment learningOutcomes (optional) only name defined LO codes."""
+        codes = {lo.get("kode") for lo in learning_outcomes or [] if isinstance(lo, dict)}
+        for item in assessments:
+            refs = item.get("learningOutcomes")
+            if refs is None:
+                continue
+            if not isinstance(refs, list) or not all(isinstance(r, str) and r in codes for r in refs):
+                return False
+        return True
+    
+    @classmethod
+    def validate_bootcamp_data(cls, data: dict, durasi: int) -> List[str]:
+        """
+        Find broken or missing sections of generated Bootcamp data.
+        
+        Args:
+            data: Parsed (possibly partial) Bootcamp data
+            durasi: Expected number of weeks
+            
+        Returns:
+            JSON paths of the sections to regenerate, e.g.
+            ["referensi", "minggu[6]", "assessment"]
+        """
+        issues = []
+        for key in cls.REQUIRED_SECTIONS:
+            if key != "minggu" and data.get(key) in (None, "", [], {}):
+                issues.append(key)
+        
+        weeks = data.get("minggu")
+        valid_weeks = set()
+        if isinstance(weeks, list):
+            valid_weeks = {w["mingguKe"] for w in weeks if cls._is_valid_week(w)}
+        for week_num in range(1, durasi + 1):
+            if week_num not in valid_weeks:
+                issues.append(f"minggu[{week_num - 1}]")
+        
+        assessments = data.get("assessment")
+        if "assessment" not in issues:
+            if (not isinstance(assessments, list)
+                    or not all(isinstance(a, dict) and all(f in a for f in cls.ASSESSMENT_FIELDS)
+                               for a in assessments)
+                    or sum(a["bobot"] for a in assessments
+                           if isinstance(a.get("bobot"), (int, float))) != 100
+                    or not cls._has_valid_lo_refs(assessments, data.get("learningOutcomes"))):
+                issues.append("assessment")
+        
+        return issues
+    
+    def generate_section_prompt(self, data: dict, path: str, bootcamp_name: str,
+                                durasi: int = 8, level: str = "Beginner",
+                                tipe: str = "Hybrid", additional_context: str = "") -> str:
+        """
+        Generate a focused prompt that regenerates one section only.
+        
+        The prompt starts with the same PROMPT_PREFIX as the full generation
+        prompt (whose JSON example shows the section structure), so repair
+        calls reuse the provider's cached prefix.
+        
+        Args:
+            data: The valid parts of the curriculum, used as context
+            path: JSON path of the section ("minggu[3]", "assessment", ...)
+            bootcamp_name, durasi, level, tipe, additional_context: As in generate_prompt
+            
+        Returns:
+            Prompt string
+        """
+        summary = []
+        for lo in data.get("learningOutcomes", []) or []:
+            if isinstance(lo, dict):
+                summary.append(f"- {lo.get('kode')} ({lo.get('kategori')}): {lo.get('pernyataan')}")
+        for week in data.get("minggu", []) or []:
+            if self._is_valid_week(week):
+                summary.append(f"- Minggu {week['mingguKe']}: {week['tema']}")
+        for item in data.get("assessment", []) or []:
+            if isinstance(item, dict) and "nama" in item:
+                summary.append(f"- Assessment: {item['nama']} ({item.get('bobot')}%)")
+        summary_text = "\n".join(summary) or "- (belum ada)"
+        
+        week_match = re.fullmatch(r"minggu\[(\d+)\]", path)
+        if week_match:
+            week_num = int(week_match.group(1)) + 1
+            target = (f"SATU objek JSON untuk minggu ke-{week_num} (dari {durasi} minggu), "
+                      f"dengan struktur PERSIS seperti satu elemen \"minggu\" pada contoh di atas")
+        else:
+            target = (f'objek JSON dengan satu key "{path}", dengan struktur PERSIS seperti '
+                      f'"{path}" pada contoh di atas')
+            if path == "assessment":
+                target += " (total bobot harus 100%)"
+        
+        info = self._bootcamp_info(bootcamp_name, durasi, level, tipe, additional_context)
+        return f"""{PROMPT_PREFIX}
+{info}
+## Kurikulum yang sudah ada (ringkasan):
+{summary_text}
+
+## Tugas Saat Ini:
+Bagian lain kurikulum sudah ada. JANGAN membuat kurikulum lengkap: buatkan HANYA {target}, konsisten dengan kurikulum di atas.
+Output JSON saja, tanpa markdown formatting atau penjelasan."""
+    
+    def repair_sections(self, data: dict, issues: List[str], bootcamp_name: str,
+                        durasi: int = 8, level: str = "Beginner", tipe: str = "Hybrid",
+                        additional_context: str = "", max_workers: int = 4) -> List[str]:
+        """
+        Regenerate only the broken or missing sections and merge them into data.
+        
+        Each section is requested with a small focused prompt, concurrently,
+        so a bad week costs one short call instead of a full regeneration.
+        
+        Args:
+            data: Partial Bootcamp data (updated in place)
+            issues: JSON paths from validate_bootcamp_data
+            bootcamp_name, durasi, level, tipe, additional_context: As in generate_prompt
+            max_workers: Maximum concurrent repair requests
+            
+        Returns:
+            JSON paths from issues that are still broken after the repair
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        print(f"🩹 Repairing {len(issues)} section(s): {', '.join(issues)}")
+        
+        def repair(path: str):
+            prompt = self.generate_section_prompt(
+                data, path, bootcamp_name, durasi, level, tipe, additional_context
+            )
+            response = self.send_message(prompt, max_retries=2)
+            if not response:
+                return path, None
+            try:
+                return path, self.parse_json_response(response)
+            except json.JSONDecodeError:
+                return path, None
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(repair, issues))
+        
+        weeks = {w["mingguKe"]: w for w in data.get("minggu", []) or [] if self._is_valid_week(w)}
+        for path, section in results:
+            if section is None:
+                continue
+            week_match = re.fullmatch(r"minggu\[(\d+)\]", path)
+            if week_match:
+                if isinstance(section, dict) and isinstance(section.get("minggu"), (dict, list)):
+                    section = section["minggu"]
+                if isinstance(section, list) and len(section) == 1:
+                    section = section[0]
+                if not isinstance(section, dict):
+                    print(f"⚠️ {path}: expected one week object, got {type(section).__name__}")
+                    continue
+                section["mingguKe"] = int(week_match.group(1)) + 1
+                if self._is_valid_week(section):
+                    weeks[section["mingguKe"]] = section
+            else:
+                data[path] = section.get(path, section) if isinstance(section, dict) else section
+        data["minggu"] = [weeks[num] for num in sorted(weeks)]
+        
+        # Only the requested paths: other sections were not touched
+        remaining = [path for path in self.validate_bootcamp_data(data, durasi) if path in issues]
+        if remaining:
+            print(f"⚠️ Still broken after repair: {', '.join(remaining)}")
+        else:
+            print("✅ All broken sections repaired")
+        return remaining
+    
+    @staticmethod
+    def distribute_weights(weights: List[float], total: int = 100) -> List[int]:
+        """Scale weights to integers summing to total (largest remainder method)."""
+        weight_sum = sum(weights)
+        if weight_sum <= 0:
+            weights = [1] * len(weights)
+            weight_sum = len(weights)
+        exact = [w * total / weight_sum for w in weights]
+        result = [int(x) for x in exact]
+        by_remainder = sorted(range(len(exact)), key=lambda i: exact[i] - result[i], reverse=True)
+        for i in by_remainder[:total - sum(result)]:
+            result[i] += 1
+        return result
+    
+    def _rebalance_weekly_weights(self, weeks: List[dict], generated: set, rescale: bool = False):
+        """
+        Make weekly penilaian.bobot sum to 100 after weeks were added, replaced or removed.
+        
+        Generated weeks share whatever the kept weeks leave over. If that is not
+        enough for them (or weeks were only removed), the difference is taken from
+        or given to the kept project weeks (or the last kept week), so every other
+        kept week stays byte-identical (the latest project week is used first).
+        rescale=True rescales all weeks instead.
+        """
+        if not weeks or not all(isinstance(w["penilaian"].get("bobot"), (int, float)) for w in weeks):
+            return
+        if sum(w["penilaian"]["bobot"] for w in weeks) == 100:
+            return
+        
+        new_weeks = [w for w in weeks if w["mingguKe"] in generated]
+        kept = [w for w in weeks if w["mingguKe"] not in generated]
+        budget = 100 - sum(w["penilaian"]["bobot"] for w in kept)
+        # Latest project week first, then the other project weeks, then the rest from the end
+        donors = sorted(kept, key=lambda w: (not w.get("project"), -w["mingguKe"]))
+        before = {w["mingguKe"]: w["penilaian"]["bobot"] for w in kept}
+        
+        if not rescale and kept:
+            if new_weeks:
+                # Top up from the donors when the kept weeks leave less than 1 per new week
+                wanted = max(sum(w["penilaian"]["bobot"] for w in new_weeks), len(new_weeks))
+                take = 0 if budget >= len(new_weeks) else wanted - budget
+            else:
+                take = -budget  # negative: freed bobot goes to the first donor
+            if take <= sum(max(0, w["penilaian"]["bobot"] - 1) for w in donors):
+                if take < 0:
+                    donors[0]["penilaian"]["bobot"] -= take
+                remaining = max(take, 0)
+                for week in donors:
+                    if remaining <= 0:
+                        break
+                    share = min(remaining, max(0, week["penilaian"]["bobot"] - 1))
+                    week["penilaian"]["bobot"] -= share
+                    remaining -= share
+                if new_weeks:
+                    for week, bobot in zip(new_weeks, self.distribute_weights(
+                            [w["penilaian"]["bobot"] for w in new_weeks], budget + take)):
+                        week["penilaian"]["bobot"] = bobot
+                self._report_rebalance(kept, before, len(new_weeks))
+                return
+            print("⚠️ Kept weeks leave no bobot for the new weeks - rescaling all weeks")
+        
+        for week, bobot in zip(weeks, self.distribute_weights([w["penilaian"]["bobot"] for w in weeks])):
+            week["penilaian"]["bobot"] = bobot
+        self._report_rebalance(kept, before, len(new_weeks))
+    
+    @staticmethod
+    def _report_rebalance(kept: List[dict], before: dict, new_count: int):
+        changed = [f"{w['mingguKe']} ({before[w['mingguKe']]} → {w['penilaian']['bobot']})"
+                   for w in kept if w["penilaian"]["bobot"] != before[w["mingguKe"]]]
+        print(f"⚖️ Rebalanced weekly bobot: {new_count} generated week(s)"
+              + (f", kept week(s) changed: {', '.join(changed)}" if changed else ", kept weeks unchanged"))
+    
+    def evolve_bootcamp_json(self, existing: dict, changes: dict,
+                             bootcamp_name: Optional[str] = None) -> Optional[dict]:
+        """
+        Extend or resize an existing curriculum without regenerating it.
+        
+        Only added or affected minggu entries (and any sections named in
+        "replace_sections") are generated; everything else is kept as is, so
+        untouched content serializes byte-identically.
+        
+        Args:
+            existing: Existing Bootcamp data
+            changes: Change spec with any of:
+                durasi (int), level (str), tipe (str), add_teknologi (list of str),
+                replace_weeks (list of week numbers), replace_sections (list of
+                top-level keys), context (str). If add_teknologi is the only
+                change to the weeks, the project weeks (or the last week) are
+                regenerated to include the new technologies. rescale_weights
+                (bool) rescales every week's bobot instead of only adjusting the
+                generated weeks and the project (or last) week.
+            bootcamp_name: Name used in prompts (default: identitas.nama)
+            
+        Returns:
+            Updated Bootcamp data or None if failed
+        """
+        data = copy.deepcopy(existing)
+        identitas = data.get("identitas", {})
+        bootcamp_name = bootcamp_name or identitas.get("nama", "Bootcamp")
+        old_weeks = [w for w in data.get("minggu", []) if self._is_valid_week(w)]
+        old_durasi = identitas.get("durasi") or len(old_weeks)
+        old_level = identitas.get("level", "Beginner")
+        
+        durasi = changes.get("durasi", old_durasi)
+        level = changes.get("level", old_level)
+        tipe = changes.get("tipe", identitas.get("tipe", "Hybrid"))
+        replace_weeks = set(changes.get("replace_weeks", []))
+        if level != old_level and not replace_weeks:
+            print(f"⚠️ Level changed {old_level} → {level} without replace_weeks: all weeks are affected")
+            replace_weeks = set(range(1, durasi + 1))
+        
+        print(f"\n🧬 Evolving Bootcamp Curriculum: {bootcamp_name}")
+        print("=" * 60)
+        
+        if not self.is_ready:
+            print("❌ Cannot evolve - no OpenAI client or backends configured")
+            return None
+        
+        def kept(replace: set) -> List[dict]:
+            return [w for w in old_weeks if w["mingguKe"] <= durasi and w["mingguKe"] not in replace]
+        
+        kept_weeks = kept(replace_weeks)
+        if changes.get("add_teknologi") and len(kept_weeks) == durasi:
+            # New technologies have to land somewhere: the project weeks, or the last week
+            replace_weeks = {w["mingguKe"] for w in kept_weeks if w.get("project")} or {durasi}
+            print(f"⚠️ add_teknologi without replace_weeks: regenerating week(s) {sorted(replace_weeks)}")
+            kept_weeks = kept(replace_weeks)
+        kept_numbers = {w["mingguKe"] for w in kept_weeks}
+        generated = {n for n in range(1, durasi + 1) if n not in kept_numbers}
+        data["minggu"] = kept_weeks
+        
+        replace_sections = [key for key in changes.get("replace_sections", []) if key != "minggu"]
+        for key in replace_sections:
+            data.pop(key, None)
+        
+        if "identitas" in data:
+            data["identitas"] = dict(identitas, durasi=durasi, level=level, tipe=tipe)
+        
+        notes = []
+        if durasi != old_durasi:
+            notes.append(f"Durasi berubah dari {old_durasi} menjadi {durasi} minggu; "
+                         f"minggu baru harus melanjutkan progres minggu sebelumnya.")
+        if level != old_level:
+            notes.append(f"Level berubah dari {old_level} menjadi {level}.")
+        if changes.get("add_teknologi"):
+            notes.append(f"Tambahkan teknologi berikut: {', '.join(changes['add_teknologi'])}.")
+        if changes.get("context"):
+            notes.append(changes["context"])
+        
+        paths = replace_sections + [f"minggu[{n - 1}]" for n in sorted(generated)]
+        print(f"   Kept weeks: {len(kept_weeks)}, generating: {sorted(generated) or 'none'}")
+        if paths:
+            remaining = self.repair_sections(data, paths, bootcamp_name, durasi, level, tipe, "\n".join(notes))
+            if remaining:
+                print(f"❌ Failed to generate: {', '.join(remaining)}")
+                return None
+        
+        weeks = data.get("minggu", [])
+        
+        if generated or len(weeks) != len(old_weeks):
+            self._rebalance_weekly_weights(weeks, generated, rescale=changes.get("rescale_weights", False))
+        
+        assessments = data.get("assessment")
+        if (isinstance(assessments, list) and assessments
+                and all(isinstance(a.get("bobot"), (int, float)) for a in assessments)
+                and sum(a["bobot"] for a in assessments) != 100):
+            for item, bobot in zip(assessments, self.distribute_weights([a["bobot"] for a in assessments])):
+                item["bobot"] = bobot
+            print("⚖️ Rebalanced assessment bobot to 100%")
+        
+        # Keep the original key order so untouched sections serialize identically
+        ordered = {key: data[key] for key in existing if key in data}
+        ordered.update({key: value for key, value in data.items() if key not in ordered})
+        
+        print(f"✅ Curriculum evolved: {len(weeks)} weeks ({len(generated)} generated)")
+        return ordered
+    
     def generate_bootcamp_json(self, bootcamp_name: str, durasi: int = 8,
                                level: str = "Beginner", tipe: str = "Hybrid",
-                               additional_context: str = "") -> Optional[dict]:
+                               additional_context: str = "",
+                               repair: bool = True) -> Optional[dict]:
         """
         Generate complete Bootcamp content as JSON.
         
+        Malformed or incomplete sections are detected by JSON path and
+        regenerated with focused prompts while the valid parts are kept.
+        
         Args:
             bootcamp_name: Name of the bootcamp
             durasi: Duration in weeks
             level: Beginner/Intermediate/Advanced
             tipe: Online/Offline/Hybrid
             additional_context: Additional context for AI generation
+            repair: Regenerate broken/missing sections instead of failing
             
         Returns:
-            Dictionary with Bootcamp data or None if failed
+            Dictionary with Bootcamp data or None if failed (including when
+            sections are still broken after repair)
         """
         print(f"\n📝 Generating Bootcamp Curriculum for: {bootcamp_name}")
         print("=" * 60)
         
-        if not self.client:
-            print("❌ Cannot generate - OpenAI client not initialized")
+        if not self.is_ready:
+            print("❌ Cannot generate - no OpenAI client or backends configured")
             return None
         
-        prompt = self.generate_prompt(bootcamp_name, durasi, level, tipe, additional_context)
-        response = self.send_message(prompt)
+        prefix, suffix = self.generate_prompt_parts(bootcamp_name, durasi, level, tipe, additional_context)
+        prefix_info = prompt_prefix_info(prefix, self.model)
+        print(f"🧩 Prompt prefix: {prefix_info['tokens']} tokens ({prefix_info['method']}, "
+              f"shared), suffix: {len(suffix)} chars")
+        if prefix_info["tokens"] < MIN_CACHEABLE_TOKENS:
+            print(f"   ⚠️ Prefix is below {MIN_CACHEABLE_TOKENS} tokens - provider will not cache it")
+        response = self.send_message(prefix + suffix)
         
         if not response:
             print("❌ Failed to get response from OpenAI")
@@ -532,18 +1446,30 @@ Output JSON saja, tanpa markdown formatting atau penjelasan."""
         
         try:
             bootcamp_data = self.parse_json_response(response)
-            print("✅ Bootcamp JSON generated successfully!")
-            print(f"   - Learning Outcomes: {len(bootcamp_data.get('learningOutcomes', []))} items")
-            print(f"   - Weekly Schedule: {len(bootcamp_data.get('minggu', []))} weeks")
-            print(f"   - Assessment Components: {len(bootcamp_data.get('assessment', []))} items")
-            print(f"   - Instructors: {len(bootcamp_data.get('instruktur', []))} people")
-            print(f"   - References: {len(bootcamp_data.get('referensi', []))} items")
-            return bootcamp_data
         except json.JSONDecodeError as e:
             print(f"❌ Failed to parse JSON: {e}")
-            print(f"Response preview: {response[:500]}...")
-            return None
-
+            bootcamp_data = self.salvage_json_sections(response) if repair else {}
+            if not bootcamp_data:
+                print(f"Response preview: {response[:500]}...")
+                return None
+            print(f"🩹 Salvaged valid sections: {', '.join(bootcamp_data)}")
+        
+        if repair:
+            issues = self.validate_bootcamp_data(bootcamp_data, durasi)
+            if issues:
+                remaining = self.repair_sections(bootcamp_data, issues, bootcamp_name, durasi,
+                                                 level, tipe, additional_context)
+                if remaining:
+                    print(f"❌ Incomplete curriculum, still broken: {', '.join(remaining)}")
+                    return None
+        
+        print("✅ Bootcamp JSON generated successfully!")
+        print(f"   - Learning Outcomes: {len(bootcamp_data.get('learningOutcomes', []))} items")
+        print(f"   - Weekly Schedule: {len(bootcamp_data.get('minggu', []))} weeks")
+        print(f"   - Assessment Components: {len(bootcamp_data.get('assessment', []))} items")
+        print(f"   - Instructors: {len(bootcamp_data.get('instruktur', []))} people")
+        print(f"   - References: {len(bootcamp_data.get('referensi', []))} items")
+        return bootcamp_data
 
 # Standalone usage
 if __name__ == "__main__":
@@ -556,30 +1482,87 @@ if __name__ == "__main__":
     parser.add_argument("--tipe", default="Hybrid", choices=["Online", "Offline", "Hybrid"], help="Bootcamp type")
     parser.add_argument("--context", default="", help="Additional context for generation")
     parser.add_argument("--output", default="bootcamp_generated.json", help="Output JSON file")
+    parser.add_argument("--evolve", default=None, metavar="EXISTING_JSON",
+                        help="Extend/resize an existing curriculum instead of generating from scratch")
+    parser.add_argument("--changes", default="{}",
+                        help="Change spec for --evolve as JSON or a JSON file path "
+                             "(durasi, level, tipe, add_teknologi, replace_weeks, replace_sections, "
+                             "rescale_weights, context)")
+    parser.add_argument("--no-repair", action="store_true",
+                        help="Fail instead of regenerating broken/missing sections")
+    parser.add_argument("--stream", action="store_true", help="Stream the response (enables first-token hedging)")
+    parser.add_argument("--hedge", action="store_true", help="Launch a hedged request when the response is slow")
+    parser.add_argument("--hedge-quantile", type=float, default=0.9, help="Latency quantile used as hedge deadline")
+    parser.add_argument("--hedge-budget", type=float, default=0.1, help="Maximum fraction of hedged requests")
+    parser.add_argument("--backends", default=None,
+                        help="JSON file with OpenAI-compatible backends to route requests over")
+    parser.add_argument("--profile", nargs="?", const="cprofile", choices=["cprofile", "sample"],
+                        help="Profile the generation (default: cprofile; 'sample' for a sampling profile)")
+    parser.add_argument("--profile-output", default=None,
+                        help="Profile output file (default: <output>.prof or <output>.collapsed)")
     
     args = parser.parse_args()
     
     print("🚀 Bootcamp AI Generator")
     print("=" * 60)
     
-    generator = BootcampAIGenerator()
+    generator = BootcampAIGenerator(require_key=not args.backends)
     
-    if not generator.client:
+    if args.backends:
+        try:
+            generator.enable_routing(args.backends)
+        except ValueError as e:
+            print(f"\n❌ Invalid backends config: {e}")
+            sys.exit(1)
+    
+    if not generator.is_ready:
         print("\n❌ Failed to initialize - check API key")
         sys.exit(1)
     
-    bootcamp_data = generator.generate_bootcamp_json(
-        bootcamp_name=args.name,
-        durasi=args.durasi,
-        level=args.level,
-        tipe=args.tipe,
-        additional_context=args.context
-    )
+    generator.stream = args.stream
+    if args.hedge:
+        generator.enable_hedging(quantile=args.hedge_quantile, budget=args.hedge_budget)
+    
+    def run_generation():
+        if args.evolve:
+            with open(args.evolve, 'r', encoding='utf-8') as f:
+                existing = json.load(f)
+            if os.path.exists(args.changes):
+                with open(args.changes, 'r', encoding='utf-8') as f:
+                    changes = json.load(f)
+            else:
+                changes = json.loads(args.changes)
+            return generator.evolve_bootcamp_json(existing, changes)
+        return generator.generate_bootcamp_json(
+            bootcamp_name=args.name,
+            durasi=args.durasi,
+            level=args.level,
+            tipe=args.tipe,
+            additional_context=args.context,
+            repair=not args.no_repair
+        )
+    
+    if args.profile:
+        from profiling import run_profiled, default_profile_output
+        bootcamp_data = run_profiled(
+            run_generation,
+            args.profile,
+            args.profile_output or default_profile_output(args.output, args.profile),
+            target=generator,
+            section_names=["generate_prompt_parts", "send_message", "parse_json_response"]
+        )
+    else:
+        bootcamp_data = run_generation()
     
     if bootcamp_data:
         with open(args.output, 'w', encoding='utf-8') as f:
             json.dump(bootcamp_data, f, ensure_ascii=False, indent=2)
         print(f"\n✅ JSON saved to: {args.output}")
+        print("\n" + generator.usage_report())
+        if generator.hedger:
+            print("\n" + generator.hedger.history.report())
+        if generator.router:
+            print("\n" + generator.router.report())
     else:
         print("\n❌ Failed to generate Bootcamp JSON")
         sys.exit(1)
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Multi-Backend Routing for Bootcamp AI Generator
+================================================
+Route chat completion requests over several OpenAI-compatible endpoints
+or models (e.g. OpenAI plus a local server as fallback). Rolling latency
+and error rate are tracked per backend; a circuit breaker takes a sick
+backend out of rotation and lets a single trial request through after a
+cooldown. Each request goes to the fastest healthy backend.
+
+Backends are configured as a JSON list:
+
+    [
+      {"name": "openai", "model": "gpt-4o-mini"},
+      {"name": "local", "base_url": "http://127.0.0.1:8800/v1", "model": "mock", "api_key": "local"}
+    ]
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+from collections import deque
+from typing import Any, List, Optional
+
+from hedging import percentile
+
+# Fix encoding for Windows
+if sys.stdout:
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+    except:
+        pass
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class NoBackendAvailable(Exception):
+    """Raised when every backend's circuit is open."""
+
+
+class Backend:
+    """One OpenAI-compatible endpoint/model with rolling health statistics."""
+
+    def __init__(self, name: str, model: str, base_url: Optional[str] = None,
+                 api_key: Optional[str] = None, window: int = 50):
+        """
+        Args:
+            name: Label used in logs and reports
+            model: Model name sent with each request
+            base_url: API base URL (None = OpenAI default / OPENAI_BASE_URL)
+            api_key: API key for this endpoint
+            window: Number of recent requests kept for latency and error rate
+        """
+        self.name = name
+        self.model = model
+        self.base_url = base_url
+        self.api_key = api_key
+        self.latencies: deque = deque(maxlen=window)
+        self.outcomes: deque = deque(maxlen=window)
+        self.state = CLOSED
+        self.opened_at: Optional[float] = None
+        self.consecutive_failures = 0
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            from openai import OpenAI
+            # Failures go back to the router instead of the client's own retries,
+            # so a sick backend is skipped right away
+            self._client = OpenAI(api_key=self.api_key, base_url=self.base_url,
+                                  timeout=600.0, max_retries=0)
+        return self._client
+
+    @property
+    def latency_p50(self) -> Optional[float]:
+        return percentile(list(self.latencies), 0.5)
+
+    @property
+    def error_rate(self) -> float:
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+
+class BackendRouter:
+    """Pick the fastest healthy backend and keep its circuit breaker up to date."""
+
+    def __init__(self, backends: List[Backend], failure_threshold: int = 3,
+                 error_rate_threshold: float = 0.5, min_samples: int = 5,
+                 cooldown: float = 30.0):
+        """
+        Args:
+            backends: Configured backends (earlier entries are tried first while untested)
+            failure_threshold: Consecutive failures that open the circuit
+            error_rate_threshold: Rolling error rate that opens the circuit
+            min_samples: Requests in the window before the error rate is used
+            cooldown: Seconds a circuit stays open before a trial request
+        """
+        if not backends:
+            raise ValueError("At least one backend is required")
+        self.backends = backends
+        self.failure_threshold = failure_threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.min_samples = min_samples
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+
+    def _available(self, backend: Backend, now: float) -> bool:
+        if backend.state == CLOSED:
+            return True
+        if backend.state == OPEN and now - backend.opened_at >= self.cooldown:
+            backend.state = HALF_OPEN
+            print(f"🔌 Backend {backend.name}: circuit half-open, sending trial request")
+        # Half-open: one trial request at a time
+        return backend.state == HALF_OPEN and backend.in_flight == 0
+
+    def choose(self) -> Backend:
+        """
+        Reserve the fastest healthy backend for one request.
+
+        Backends that just failed rank after those that did not; otherwise the
+        rolling p50 latency, scaled by requests already in flight, decides.
+        Untested backends (no latency yet) are tried first.
+
+        Raises:
+            NoBackendAvailable: If every circuit is open
+        """
+        with self._lock:
+            now = time.perf_counter()
+            candidates = [b for b in self.backends if self._available(b, now)]
+            if not candidates:
+                raise NoBackendAvailable("All backends are unavailable (circuits open)")
+            backend = min(candidates, key=lambda b: (
+                b.consecutive_failures > 0, (b.latency_p50 or 0.0) * (1 + b.in_flight)
+            ))
+            backend.in_flight += 1
+            return backend
+
+    def has_healthy(self) -> bool:
+        """Whether some backend could take a request right now without a recent failure."""
+        with self._lock:
+            now = time.perf_counter()
+            return any(self._available(b, now) and b.consecutive_failures == 0 for b in self.backends)
+
+    def release(self, backend: Backend):
+        """Release a reservation without recording an outcome (e.g. cancelled request)."""
+        with self._lock:
+            backend.in_flight -= 1
+
+    def record(self, backend: Backend, latency: float, ok: bool):
+        """Record a finished request and update the backend's circuit."""
+        with self._lock:
+            backend.in_flight -= 1
+            backend.requests += 1
+            backend.outcomes.append(ok)
+            if ok:
+                backend.latencies.append(latency)
+                backend.consecutive_failures = 0
+                if backend.state == HALF_OPEN:
+                    backend.state = CLOSED
+                    backend.outcomes.clear()
+                    print(f"🔌 Backend {backend.name}: circuit closed")
+                return
+
+            backend.failures += 1
+            backend.consecutive_failures += 1
+            sick = (backend.consecutive_failures >= self.failure_threshold
+                    or (len(backend.outcomes) >= self.min_samples
+                        and backend.error_rate >= self.error_rate_threshold))
+            if backend.state == HALF_OPEN or (backend.state == CLOSED and sick):
+                backend.state = OPEN
+                backend.opened_at = time.perf_counter()
+                print(f"🔌 Backend {backend.name}: circuit open for {self.cooldown:g}s "
+                      f"({backend.consecutive_failures} consecutive failures, "
+                      f"{backend.error_rate:.0%} error rate)")
+
+    def report(self) -> str:
+        """Per-backend requests, error rate, latency and circuit state."""
+        lines = [f"{'Backend':<16} {'model':<16} {'state':<10} {'req':>5} {'err %':>6} "
+                 f"{'p50 (s)':>8} {'p90 (s)':>8}", "-" * 75]
+        with self._lock:
+            for b in self.backends:
+                latencies = list(b.latencies)
+                p50, p90 = percentile(latencies, 0.5), percentile(latencies, 0.9)
+                lines.append(f"{b.name:<16} {b.model:<16} {b.state:<10} {b.requests:>5} "
+                             f"{b.error_rate * 100:>6.1f} "
+                             f"{(f'{p50:.2f}' if p50 is not None else '-'):>8} "
+                             f"{(f'{p90:.2f}' if p90 is not None else '-'):>8}")
+        return "\n".join(lines)
+
+
+def load_backends(config: Any, default_api_key: Optional[str] = None) -> List[Backend]:
+    """
+    Build backends from a JSON config file path or an already loaded list.
+
+    Each entry needs "model" and may set "name", "base_url", "api_key" or
+    "api_key_env" (name of an environment variable holding the key).
+    Only entries without a key and without base_url (i.e. OpenAI itself)
+    need default_api_key; local OpenAI-compatible servers get a placeholder.
+
+    Raises:
+        ValueError: If an OpenAI entry has no key at all
+    """
+    if isinstance(config, str):
+        with open(config, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    backends = []
+    for i, entry in enumerate(config, 1):
+        api_key = entry.get("api_key")
+        if not api_key and entry.get("api_key_env"):
+            api_key = os.environ.get(entry["api_key_env"])
+        name = entry.get("name") or f"backend-{i}"
+        api_key = api_key or default_api_key
+        if not api_key:
+            if not entry.get("base_url"):
+                raise ValueError(f"Backend '{name}' needs an api_key, api_key_env or OPENAI_API_KEY")
+            # The client insists on a key; local servers ignore it
+            api_key = "local"
+        backends.append(Backend(
+            name=name,
+            model=entry["model"],
+            base_url=entry.get("base_url"),
+            api_key=api_key,
+            window=entry.get("window", 50)
+        ))
+    return backends
+
+
+# Standalone usage
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Probe configured backends through the router")
+    parser.add_argument("config", nargs="?", help="Backends JSON file")
+    parser.add_argument("--requests", type=int, default=10, help="Number of probe requests")
+    parser.add_argument("--cooldown", type=float, default=30.0, help="Circuit breaker cooldown in seconds")
+    parser.add_argument("--self-check", action="store_true",
+                        help="Route generator requests over local mock servers (fast, slow, broken) "
+                             "and check the router's choices; needs no API key")
+
+    args = parser.parse_args()
+    if not args.config and not args.self_check:
+        parser.error("config is required unless --self-check is given")
+
+    print("🔌 Backend Router Probe")
+    print("=" * 60)
+
+    if args.self_check:
+        from ai_to_json import BootcampAIGenerator
+        from mock_openai_server import start_mock_server
+
+        servers = {
+            "broken": start_mock_server(latency=0.05, error_rate=1.0),
+            "slow": start_mock_server(latency=0.3),
+            "fast": start_mock_server(latency=0.05),
+        }
+        # Local entries only, no api_key: must work without OPENAI_API_KEY
+        config = [{"name": name, "base_url": url, "model": "mock"}
+                  for name, (_, url) in servers.items()]
+        generator = BootcampAIGenerator(require_key=False)
+        generator.enable_routing(config, failure_threshold=1, cooldown=60)
+
+        answered = sum(1 for _ in range(args.requests)
+                       if generator.send_message("ping", max_retries=3))
+        by_name = {b.name: b for b in generator.router.backends}
+        print("\n" + generator.router.report())
+
+        problems = []
+        if answered != args.requests:
+            problems.append(f"{args.requests - answered} of {args.requests} requests failed")
+        if by_name["broken"].state != OPEN:
+            problems.append(f"broken backend circuit is {by_name['broken'].state}, expected {OPEN}")
+        if by_name["fast"].requests <= by_name["slow"].requests:
+            problems.append(f"fast backend got {by_name['fast'].requests} requests, "
+                            f"slow got {by_name['slow'].requests}")
+        for server, _ in servers.values():
+            server.shutdown()
+
+        for problem in problems:
+            print(f"❌ {problem}")
+        if problems:
+            sys.exit(1)
+        print("\n✅ Self-check passed")
+        sys.exit(0)
+
+    router = BackendRouter(load_backends(args.config, os.environ.get("OPENAI_API_KEY")),
+                           cooldown=args.cooldown)
+    for i in range(args.requests):
+        try:
+            backend = router.choose()
+        except NoBackendAvailable as e:
+            print(f"❌ Probe {i + 1}: {e}")
+            continue
+        start = time.perf_counter()
+        try:
+            backend.client.chat.completions.create(
+                model=backend.model,
+                messages=[{"role": "user", "content": "ping"}],
+                max_tokens=1
+            )
+            router.record(backend, time.perf_counter() - start, True)
+            print(f"✅ Probe {i + 1}: {backend.name} {time.perf_counter() - start:.2f}s")
+        except Exception as e:
+            router.record(backend, time.perf_counter() - start, False)
+            print(f"❌ Probe {i + 1}: {backend.name} {e}")
+
+    print("\n" + router.report())
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Scaling Benchmark for json_to_docx
+===================================
+Convert synthetic curricula of increasing size (see synthetic_curriculum.py)
+and measure wall time and memory per `_add_*` section plus the final save.
+Results can be stored as a baseline; later runs are compared against it and
+sections slower or heavier than the threshold are flagged as regressions
+(non-zero exit code).
+
+Memory is measured twice: the Python heap peak (tracemalloc) and RSS
+growth, which also covers lxml's C allocations for the document tree. The
+memory run goes in a fresh process, separate from the timing runs, since
+tracemalloc slows every allocation down.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import platform
+import tracemalloc
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from statistics import median
+from typing import Any, Dict, List, Optional
+
+from json_to_docx import BootcampToDocx
+from profiling import SectionProfiler
+from synthetic_curriculum import SIZES, generate_size
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Fix encoding for Windows
+if sys.stdout:
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+    except:
+        pass
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PARENT_DIR = os.path.dirname(BASE_DIR)
+DEFAULT_BASELINE_FILE = os.path.join(PARENT_DIR, 'temp', 'docx_benchmark_baseline.json')
+DEFAULT_RESULTS_FILE = os.path.join(PARENT_DIR, 'temp', 'docx_benchmark_results.jsonl')
+
+SAVE_SECTION = 'save'
+# Differences below these are noise, whatever the ratio
+MIN_WALL_DELTA = 0.005  # seconds
+MIN_PEAK_DELTA = 64 * 1024  # bytes
+MIN_RSS_DELTA = 512 * 1024  # bytes (page and allocator granularity)
+
+
+def _rss() -> int:
+    """Current resident set size in bytes (0 if it cannot be read)."""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def _convert(data: Dict[str, Any], profiler: SectionProfiler,
+             rss: Optional[Dict[str, int]] = None) -> Dict[str, float]:
+    """
+    Sequential convert() on in-memory data with every section measured.
+    
+    Args:
+        data: Curriculum
+        profiler: Receives wall time (and tracemalloc peak) per section
+        rss: If given, receives RSS growth per section
+    
+    Returns:
+        {"wall", "peak", "rss"} of the final save
+    """
+    converter = BootcampToDocx()
+    profiler.instrument(converter, BootcampToDocx.SECTION_METHODS)
+    for method_name in BootcampToDocx.SECTION_METHODS:
+        method = getattr(converter, method_name)
+        rss_before = _rss() if rss is not None else 0
+        method(data)
+        if rss is not None:
+            rss[method_name] = _rss() - rss_before
+
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        profiler.peak_seen = max(profiler.peak_seen, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        mem_before = tracemalloc.get_traced_memory()[0]
+    rss_before = _rss()
+    start = time.perf_counter()
+    converter.doc.save(io.BytesIO())
+    wall = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] - mem_before if tracing else 0
+    return {"wall": wall, "peak": peak, "rss": _rss() - rss_before}
+
+
+def _memory_pass(data: Dict[str, Any]) -> Dict[str, Dict[str, int]]:
+    """
+    Memory run, meant for a fresh process so RSS growth is not hidden by
+    memory freed in earlier runs. "peak" is the Python heap peak
+    (tracemalloc); "rss" also counts lxml's C allocations, which hold the
+    document tree.
+    """
+    profiler = SectionProfiler()
+    rss: Dict[str, int] = {}
+    rss_start = _rss()
+    tracemalloc.start()
+    try:
+        save = _convert(data, profiler, rss)
+        total_peak = max(profiler.peak_seen, tracemalloc.get_traced_memory()[1])
+    finally:
+        tracemalloc.stop()
+
+    memory = {name: {"peak": rec["peak"], "rss": rss.get(name, 0)} for name, rec in profiler.records.items()}
+    memory[SAVE_SECTION] = {"peak": save["peak"], "rss": save["rss"]}
+    memory["total"] = {"peak": total_peak, "rss": _rss() - rss_start}
+    return memory
+
+
+def benchmark_size(data: Dict[str, Any], repeats: int = 3) -> Dict[str, Dict[str, float]]:
+    """
+    Measure one curriculum.
+
+    Timing runs happen here; the memory run happens in a fresh process.
+
+    Returns:
+        {section: {"wall": median seconds, "peak": bytes, "rss": bytes}}, including "save" and "total"
+    """
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        memory = pool.submit(_memory_pass, data).result()
+
+    walls: Dict[str, List[float]] = {}
+    for _ in range(repeats):
+        profiler = SectionProfiler()
+        save = _convert(data, profiler)
+        for name, rec in profiler.records.items():
+            walls.setdefault(name, []).append(rec["wall"])
+        walls.setdefault(SAVE_SECTION, []).append(save["wall"])
+
+    results = {name: dict(memory.get(name, {"peak": 0, "rss": 0}), wall=median(values))
+               for name, values in walls.items()}
+    results["total"] = dict(memory["total"], wall=sum(r["wall"] for r in results.values()))
+    return results
+
+
+def run_benchmark(sizes: List[str], repeats: int = 3, seed: int = 0) -> Dict[str, Any]:
+    """Benchmark every named size; returns a run record."""
+    run = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeats": repeats,
+        "sizes": {}
+    }
+    for size in sizes:
+        print(f"⏱️ Size {size}: {SIZES[size]}")
+        run["sizes"][size] = {"params": SIZES[size],
+                              "sections": benchmark_size(generate_size(size, seed), repeats)}
+    return run
+
+
+def compare(run: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.2) -> List[Dict[str, Any]]:
+    """
+    Sections whose wall time, heap peak or RSS growth grew by more than threshold.
+
+    Sizes or sections missing from the baseline are skipped.
+    """
+    regressions = []
+    for size, result in run["sizes"].items():
+        base_sections = baseline.get("sizes", {}).get(size, {}).get("sections", {})
+        for section, current in result["sections"].items():
+            base = base_sections.get(section)
+            if not base:
+                continue
+            for metric, min_delta in (("wall", MIN_WALL_DELTA), ("peak", MIN_PEAK_DELTA),
+                                      ("rss", MIN_RSS_DELTA)):
+                if metric not in base or metric not in current:
+                    continue
+                old, new = base[metric], current[metric]
+                if new - old > min_delta and new > old * (1 + threshold):
+                    regressions.append({"size": size, "section": section, "metric": metric,
+                                        "baseline": old, "current": new,
+                                        "change": (new - old) / old if old else float("inf")})
+    return regressions
+
+
+def format_run(run: Dict[str, Any], baseline: Dict[str, Any] = None) -> str:
+    """Table of wall time (ms) and RSS growth (KB) per section and size."""
+    sizes = list(run["sizes"])
+    sections = BootcampToDocx.SECTION_METHODS + [SAVE_SECTION, "total"]
+    header = f"{'Section':<24}" + "".join(f" {size + ' ms':>10} {size + ' KB':>10}" for size in sizes)
+    lines = [header, "-" * len(header)]
+    for section in sections:
+        cells = []
+        for size in sizes:
+            rec = run["sizes"][size]["sections"].get(section)
+            if rec is None:
+                cells.append(f" {'-':>10} {'-':>10}")
+                continue
+            cells.append(f" {rec['wall'] * 1000:>10.1f} {rec['rss'] / 1024:>10.0f}")
+        lines.append(f"{section:<24}" + "".join(cells))
+    if baseline:
+        lines.append(f"Baseline: {baseline.get('timestamp', '?')} (Python {baseline.get('python', '?')})")
+    return "\n".join(lines)
+
+
+def load_json(path: str) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_json(path: str, payload: Dict[str, Any]):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+# Standalone usage
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark json_to_docx on synthetic curricula")
+    parser.add_argument("--sizes", default="xs,s,m,l",
+                        help=f"Comma-separated sizes to run (available: {', '.join(SIZES)})")
+    parser.add_argument("--repeats", type=int, default=3, help="Timing runs per size (median is kept)")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic data seed")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_FILE, help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Relative slowdown/memory growth flagged as regression (0.2 = 20%%)")
+    parser.add_argument("--results", default=DEFAULT_RESULTS_FILE, help="JSONL file to append results to")
+
+    args = parser.parse_args()
+
+    sizes = [size.strip() for size in args.sizes.split(",") if size.strip()]
+    unknown = [size for size in sizes if size not in SIZES]
+    if unknown:
+        print(f"❌ Unknown size(s): {', '.join(unknown)} (available: {', '.join(SIZES)})")
+        sys.exit(1)
+
+    print("🏁 json_to_docx Scaling Benchmark")
+    print("=" * 60)
+
+    run = run_benchmark(sizes, args.repeats, args.seed)
+    baseline = load_json(args.baseline) if os.path.exists(args.baseline) else None
+
+    print("\n" + format_run(run, baseline))
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.results)), exist_ok=True)
+    with open(args.results, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(run) + "\n")
+
+    regressions = compare(run, baseline, args.threshold) if baseline else []
+    if args.save_baseline:
+        save_json(args.baseline, run)
+        print(f"\n✅ Baseline saved to: {args.baseline}")
+    elif baseline is None:
+        print(f"\nℹ️ No baseline at {args.baseline} - run with --save-baseline to create one")
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for r in regressions:
+            unit, scale = ("ms", 1000) if r["metric"] == "wall" else ("KB", 1 / 1024)
+            print(f"   {r['size']:<3} {r['section']:<24} {r['metric']:<5} "
+                  f"{r['baseline'] * scale:.1f} -> {r['current'] * scale:.1f} {unit} ({r['change']:+.0%})")
+        sys.exit(1)
+    if baseline is not None:
+        print(f"\n✅ No regressions beyond {args.threshold:.0%}")
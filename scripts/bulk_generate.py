@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Offline Bulk Generation via Batch Jobs
+=======================================
+Generate many curricula through the OpenAI-compatible batch API instead of
+one synchronous request each: prompts are written to one batch-input JSONL
+file, submitted as a batch job and polled until it finishes. Every step is
+checkpointed so an interrupted run resumes where it stopped. Results are
+parsed and validated in parallel worker processes.
+
+Test locally with the mock server, which emulates the batch lifecycle:
+
+    python3 scripts/mock_openai_server.py --port 8800 --batch-duration 10
+    OPENAI_BASE_URL=http://127.0.0.1:8800/v1 OPENAI_API_KEY=mock \\
+        python3 scripts/bulk_generate.py jobs.jsonl --poll-interval 2
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from ai_to_json import BootcampAIGenerator
+
+# Fix encoding for Windows
+if sys.stdout:
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+    except:
+        pass
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PARENT_DIR = os.path.dirname(BASE_DIR)
+
+TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+def load_jobs(jobs_file: str) -> List[Dict[str, Any]]:
+    """Read job specs: one JSON object per line with name, durasi, level, tipe, context, output."""
+    jobs = []
+    with open(jobs_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                jobs.append(json.loads(line))
+    return jobs
+
+
+def default_checkpoint(jobs_file: str) -> str:
+    stem = os.path.splitext(os.path.basename(jobs_file))[0]
+    return os.path.join(PARENT_DIR, 'temp', f"bulk_{stem}.checkpoint.json")
+
+
+def _process_result(args: Tuple[str, Dict[str, Any], str]) -> Dict[str, Any]:
+    """
+    Worker: parse and validate one batch output line and save the curriculum.
+
+    Returns:
+        {"custom_id", "status" (ok/invalid/failed), "output", "issues", "error"}
+    """
+    line, job, output_file = args
+    record = json.loads(line)
+    result = {"custom_id": record.get("custom_id"), "status": "failed",
+              "output": None, "issues": [], "error": None}
+
+    response = record.get("response") or {}
+    if record.get("error") or response.get("status_code") != 200:
+        error = record.get("error") or response.get("body", {}).get("error") or {}
+        result["error"] = error.get("message", f"HTTP {response.get('status_code')}")
+        return result
+
+    body = response["body"]
+    choice = body["choices"][0] if body.get("choices") else {}
+    content = (choice.get("message") or {}).get("content") or ""
+    if choice.get("finish_reason") == "length":
+        result["issues"].append("truncated")
+
+    try:
+        data = BootcampAIGenerator.parse_json_response(content)
+    except json.JSONDecodeError as e:
+        data = BootcampAIGenerator.salvage_json_sections(content)
+        if not data:
+            result["error"] = f"Invalid JSON: {e}"
+            return result
+
+    result["issues"] += BootcampAIGenerator.validate_bootcamp_data(data, job.get("durasi", 8))
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    result["output"] = output_file
+    result["status"] = "invalid" if result["issues"] else "ok"
+    return result
+
+
+class BulkGenerator:
+    """Run a jobs file through one batch job, with a resumable checkpoint."""
+
+    def __init__(self, generator: BootcampAIGenerator, jobs_file: str,
+                 checkpoint_path: Optional[str] = None, output_dir: str = ".",
+                 poll_interval: float = 60.0, workers: Optional[int] = None):
+        """
+        Args:
+            generator: Provides the client, model and prompts
+            jobs_file: JSONL job specs (see load_jobs)
+            checkpoint_path: Checkpoint file (default: temp/bulk_<jobs>.checkpoint.json)
+            output_dir: Directory for jobs without an output path
+            poll_interval: Seconds between batch status checks
+            workers: Parse/validate processes (default: CPU count)
+        """
+        self.generator = generator
+        self.jobs_file = jobs_file
+        self.jobs = load_jobs(jobs_file)
+        self.checkpoint_path = checkpoint_path or default_checkpoint(jobs_file)
+        self.output_dir = output_dir
+        self.poll_interval = poll_interval
+        self.workers = workers or os.cpu_count() or 1
+
+        with open(jobs_file, 'rb') as f:
+            jobs_hash = hashlib.sha256(f.read()).hexdigest()[:16]
+        self.state: Dict[str, Any] = {"jobs_file": os.path.abspath(jobs_file), "jobs_hash": jobs_hash}
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            if saved.get("jobs_hash") != jobs_hash:
+                raise ValueError(f"Checkpoint {self.checkpoint_path} belongs to a different jobs file; "
+                                 f"delete it or pass --restart")
+            self.state = saved
+            print(f"♻️ Resuming from checkpoint ({self.state.get('stage', 'start')})")
+
+    def save_checkpoint(self, stage: str):
+        self.state["stage"] = stage
+        os.makedirs(os.path.dirname(os.path.abspath(self.checkpoint_path)), exist_ok=True)
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def output_path(self, index: int) -> str:
+        job = self.jobs[index]
+        return job.get("output") or os.path.join(self.output_dir, f"bootcamp_job_{index + 1}.json")
+
+    def write_batch_input(self) -> str:
+        """Serialize one chat completion request per job into the batch-input JSONL."""
+        path = os.path.splitext(self.checkpoint_path)[0] + ".input.jsonl"
+        with open(path, 'w', encoding='utf-8') as f:
+            for i, job in enumerate(self.jobs):
+                prompt = self.generator.generate_prompt(
+                    job["name"], job.get("durasi", 8), job.get("level", "Beginner"),
+                    job.get("tipe", "Hybrid"), job.get("context", "")
+                )
+                request = {
+                    "custom_id": f"job-{i}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.generator.model,
+                        "messages": [
+                            {"role": "system", "content": self.generator.SYSTEM_PROMPT},
+                            {"role": "user", "content": prompt}
+                        ],
+                        "temperature": 0.7
+                    }
+                }
+                f.write(json.dumps(request, ensure_ascii=False) + "\n")
+        return path
+
+    def submit(self):
+        """Write, upload and submit the batch input (skipping steps already done)."""
+        client = self.generator.client
+        if "input_file" not in self.state:
+            self.state["input_file"] = self.write_batch_input()
+            self.save_checkpoint("written")
+            print(f"📝 Batch input: {self.state['input_file']} ({len(self.jobs)} requests)")
+        if "input_file_id" not in self.state:
+            with open(self.state["input_file"], 'rb') as f:
+                self.state["input_file_id"] = client.files.create(file=f, purpose="batch").id
+            self.save_checkpoint("uploaded")
+            print(f"📤 Uploaded batch input: {self.state['input_file_id']}")
+        if "batch_id" not in self.state:
+            batch = client.batches.create(
+                input_file_id=self.state["input_file_id"],
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+                metadata={"jobs_file": os.path.basename(self.jobs_file)}
+            )
+            self.state["batch_id"] = batch.id
+            self.save_checkpoint("submitted")
+            print(f"🚀 Submitted batch: {batch.id}")
+
+    def poll(self):
+        """Wait for the batch to reach a terminal status."""
+        client = self.generator.client
+        while True:
+            batch = client.batches.retrieve(self.state["batch_id"])
+            counts = batch.request_counts
+            progress = f"{counts.completed + counts.failed}/{counts.total}" if counts else "?"
+            print(f"⏳ Batch {batch.id}: {batch.status} ({progress})")
+            self.state["status"] = batch.status
+            self.state["output_file_id"] = batch.output_file_id
+            self.state["error_file_id"] = batch.error_file_id
+            self.save_checkpoint("polling")
+            if batch.status in TERMINAL_STATUSES:
+                return
+            time.sleep(self.poll_interval)
+
+    def download(self) -> List[str]:
+        """Fetch the output and error files once; returns result lines."""
+        client = self.generator.client
+        results_path = os.path.splitext(self.checkpoint_path)[0] + ".output.jsonl"
+        if self.state.get("results_file") != results_path:
+            with open(results_path, 'wb') as f:
+                for key in ("output_file_id", "error_file_id"):
+                    if self.state.get(key):
+                        content = client.files.content(self.state[key]).read()
+                        f.write(content if content.endswith(b"\n") or not content else content + b"\n")
+            self.state["results_file"] = results_path
+            self.save_checkpoint("downloaded")
+        with open(results_path, 'r', encoding='utf-8') as f:
+            return [line for line in f if line.strip()]
+
+    def process(self, lines: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Parse and validate results in parallel, skipping ones already processed."""
+        processed = self.state.setdefault("processed", {})
+        tasks = []
+        for line in lines:
+            custom_id = json.loads(line).get("custom_id", "")
+            if custom_id in processed:
+                continue
+            index = int(custom_id.split("-", 1)[1])
+            tasks.append((line, self.jobs[index], self.output_path(index)))
+
+        if tasks:
+            print(f"🔍 Parsing and validating {len(tasks)} results with {self.workers} worker(s)...")
+            if self.workers == 1:
+                for result in map(_process_result, tasks):
+                    processed[result["custom_id"]] = result
+            else:
+                with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                    for result in pool.map(_process_result, tasks, chunksize=8):
+                        processed[result["custom_id"]] = result
+            self.save_checkpoint("processed")
+        return processed
+
+    def run(self) -> Dict[str, Dict[str, Any]]:
+        """Submit (or resume), poll, download and process; returns results by custom_id."""
+        if self.state.get("status") not in TERMINAL_STATUSES:
+            self.submit()
+            self.poll()
+        if self.state["status"] != "completed":
+            print(f"⚠️ Batch ended with status {self.state['status']} - processing partial results")
+        return self.process(self.download())
+
+    def repair(self, results: Dict[str, Dict[str, Any]]):
+        """Repair invalid results with focused synchronous requests (see repair_sections)."""
+        for custom_id, result in results.items():
+            if result["status"] != "invalid":
+                continue
+            job = self.jobs[int(custom_id.split("-", 1)[1])]
+            with open(result["output"], 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            issues = [i for i in result["issues"] if i != "truncated"]
+            remaining = self.generator.repair_sections(
+                data, issues, job["name"], job.get("durasi", 8), job.get("level", "Beginner"),
+                job.get("tipe", "Hybrid"), job.get("context", "")
+            ) if issues else []
+            with open(result["output"], 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            result.update(issues=remaining, status="invalid" if remaining else "ok")
+        self.save_checkpoint("repaired")
+
+
+def self_check() -> List[str]:
+    """
+    Interrupt and resume a small bulk run against an in-process mock server.
+
+    The run is stopped after submit and again after download; each resume
+    must pick up from the checkpoint without uploading, submitting,
+    polling or downloading again.
+
+    Returns:
+        Problems found (empty when the check passed)
+    """
+    import tempfile
+    from mock_openai_server import start_mock_server
+
+    server, base_url = start_mock_server(latency=0.0, batch_duration=1.0)
+    os.environ["OPENAI_BASE_URL"] = base_url
+    calls = server.state.calls
+    problems = []
+
+    def expect(step: str, endpoint: str, count: int):
+        if calls.get(endpoint, 0) != count:
+            problems.append(f"{step}: {endpoint} called {calls.get(endpoint, 0)}x, expected {count}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        jobs_file = os.path.join(tmp, "jobs.jsonl")
+        with open(jobs_file, 'w', encoding='utf-8') as f:
+            for name, durasi in (("Data Science", 4), ("Web Development", 6), ("UI/UX Design", 8)):
+                f.write(json.dumps({"name": name, "durasi": durasi}) + "\n")
+        checkpoint = os.path.join(tmp, "jobs.checkpoint.json")
+        generator = BootcampAIGenerator(api_key="mock")
+
+        def resume() -> BulkGenerator:
+            return BulkGenerator(generator, jobs_file, checkpoint, tmp, poll_interval=0.2, workers=1)
+
+        print("\n▶️ Run 1: submit, then stop")
+        resume().submit()
+        expect("run 1", "files.create", 1)
+        expect("run 1", "batches.create", 1)
+
+        print("\n▶️ Run 2: resume, poll and download, then stop")
+        bulk = resume()
+        bulk.submit()
+        bulk.poll()
+        bulk.download()
+        expect("run 2", "files.create", 1)
+        expect("run 2", "batches.create", 1)
+        polls, downloads = calls.get("batches.retrieve", 0), calls.get("files.content", 0)
+        if not downloads:
+            problems.append("run 2: batch output was not downloaded")
+
+        print("\n▶️ Run 3: resume and process")
+        results = resume().run()
+        expect("run 3", "batches.retrieve", polls)
+        expect("run 3", "files.content", downloads)
+        ok = sum(1 for r in results.values() if r["status"] == "ok")
+        if ok != 3:
+            problems.append(f"run 3: {ok} of 3 results ok")
+
+        print("\n▶️ Run 4: resume a finished run")
+        outputs = {r["output"]: os.path.getmtime(r["output"]) for r in results.values() if r["output"]}
+        resume().run()
+        if any(os.path.getmtime(path) != mtime for path, mtime in outputs.items()):
+            problems.append("run 4: finished results were processed again")
+        expect("run 4", "batches.retrieve", polls)
+        expect("run 4", "files.content", downloads)
+
+    server.shutdown()
+    return problems
+
+
+# Standalone usage
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate many curricula with one batch job")
+    parser.add_argument("jobs", nargs="?",
+                        help="JSONL file, one job per line: {name, durasi, level, tipe, context, output}")
+    parser.add_argument("--output-dir", default=".", help="Directory for jobs without an output path")
+    parser.add_argument("--checkpoint", default=None,
+                        help="Checkpoint file (default: temp/bulk_<jobs>.checkpoint.json)")
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint")
+    parser.add_argument("--poll-interval", type=float, default=60.0, help="Seconds between status checks")
+    parser.add_argument("--workers", type=int, default=None, help="Parse/validate processes (default: CPU count)")
+    parser.add_argument("--repair", action="store_true",
+                        help="Repair invalid results with focused synchronous requests")
+    parser.add_argument("--self-check", action="store_true",
+                        help="Interrupt and resume a small run against a local mock server "
+                             "and check that finished steps are skipped; needs no API key")
+
+    args = parser.parse_args()
+    if not args.jobs and not args.self_check:
+        parser.error("jobs is required unless --self-check is given")
+
+    print("📦 Bootcamp Bulk Generator")
+    print("=" * 60)
+
+    if args.self_check:
+        problems = self_check()
+        for problem in problems:
+            print(f"❌ {problem}")
+        if problems:
+            sys.exit(1)
+        print("\n✅ Self-check passed")
+        sys.exit(0)
+
+    generator = BootcampAIGenerator()
+    if not generator.client:
+        print("\n❌ Failed to initialize - check API key")
+        sys.exit(1)
+
+    checkpoint = args.checkpoint or default_checkpoint(args.jobs)
+    if args.restart and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    bulk = BulkGenerator(generator, args.jobs, checkpoint, args.output_dir,
+                         args.poll_interval, args.workers)
+    results = bulk.run()
+    if args.repair:
+        bulk.repair(results)
+
+    counts = {"ok": 0, "invalid": 0, "failed": 0}
+    for custom_id in sorted(results, key=lambda c: int(c.split("-", 1)[1])):
+        result = results[custom_id]
+        counts[result["status"]] += 1
+        name = bulk.jobs[int(custom_id.split("-", 1)[1])]["name"]
+        if result["status"] == "ok":
+            print(f"✅ {name}: {result['output']}")
+        elif result["status"] == "invalid":
+            print(f"⚠️ {name}: {result['output']} (issues: {', '.join(result['issues'])})")
+        else:
+            print(f"❌ {name}: {result['error']}")
+    missing = len(bulk.jobs) - len(results)
+    print(f"\n📊 {counts['ok']} ok, {counts['invalid']} with issues, {counts['failed']} failed"
+          + (f", {missing} without result" if missing else ""))
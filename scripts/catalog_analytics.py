@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Catalog Analytics for Bootcamp Curricula
+=========================================
+Stream over many curriculum JSON files (directories, .zip or .tar.gz
+archives) and aggregate catalog-wide statistics: technology frequency,
+assessment bobot distribution, materiPokok per week and learning outcomes
+per kategori. Files are parsed incrementally (ijson when installed) and
+processed in parallel; only the running aggregates are kept in memory.
+"""
+
+import io
+import os
+import sys
+import csv
+import json
+import tarfile
+import zipfile
+from collections import Counter
+from multiprocessing import Pool
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Fix encoding for Windows
+if sys.stdout:
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+    except:
+        pass
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+
+# Source tasks: ("file", path), ("zip", archive, member) or ("bytes", name, data)
+Task = Tuple[Any, ...]
+
+
+def iter_sources(paths: List[str]) -> Iterator[Task]:
+    """Yield one task per curriculum JSON found in the given paths."""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    if name.endswith(".json"):
+                        yield ("file", os.path.join(root, name))
+        elif path.endswith(".zip"):
+            with zipfile.ZipFile(path) as archive:
+                for member in archive.namelist():
+                    if member.endswith(".json"):
+                        yield ("zip", path, member)
+        elif path.endswith(TAR_SUFFIXES):
+            # Tar archives are read sequentially; members are handed over as bytes
+            with tarfile.open(path, "r:*") as archive:
+                for member in archive:
+                    if member.isfile() and member.name.endswith(".json"):
+                        yield ("bytes", member.name, archive.extractfile(member).read())
+        elif path.endswith(".json"):
+            yield ("file", path)
+
+
+def walk_events(value: Any, prefix: str = "") -> Iterator[Tuple[str, str, Any]]:
+    """Produce ijson-style (prefix, event, value) tuples from a loaded object."""
+    if isinstance(value, dict):
+        yield prefix, "start_map", None
+        for key, item in value.items():
+            yield from walk_events(item, f"{prefix}.{key}" if prefix else key)
+        yield prefix, "end_map", None
+    elif isinstance(value, list):
+        yield prefix, "start_array", None
+        item_prefix = f"{prefix}.item" if prefix else "item"
+        for item in value:
+            yield from walk_events(item, item_prefix)
+        yield prefix, "end_array", None
+    elif isinstance(value, str):
+        yield prefix, "string", value
+    elif isinstance(value, bool):
+        yield prefix, "boolean", value
+    elif value is None:
+        yield prefix, "null", None
+    else:
+        yield prefix, "number", value
+
+
+class CatalogStats:
+    """Mergeable running aggregates over curriculum parse events."""
+
+    def __init__(self):
+        self.files = 0
+        self.errors = 0
+        self.weeks = 0
+        self.materi = 0
+        self.learning_outcomes = 0
+        self.projects = 0
+        self.technologies: Counter = Counter()
+        self.assessment_bobot: Counter = Counter()
+        self.lo_kategori: Counter = Counter()
+        self.durasi: Counter = Counter()
+
+    def consume(self, events: Iterator[Tuple[str, str, Any]]):
+        """Update the aggregates from one file's parse events."""
+        for prefix, event, value in events:
+            if prefix == "minggu.item" and event == "start_map":
+                self.weeks += 1
+            elif prefix == "minggu.item.materiPokok.item":
+                self.materi += 1
+            elif prefix == "minggu.item.project" and event == "start_map":
+                self.projects += 1
+            elif prefix == "minggu.item.project.teknologi.item" and event == "string":
+                self.technologies[value.strip()] += 1
+            elif prefix == "assessment.item.bobot" and event == "number":
+                bobot = float(value)
+                self.assessment_bobot[int(bobot) if bobot.is_integer() else bobot] += 1
+            elif prefix == "learningOutcomes.item" and event == "start_map":
+                self.learning_outcomes += 1
+            elif prefix == "learningOutcomes.item.kategori" and event == "string":
+                self.lo_kategori[value.strip()] += 1
+            elif prefix == "identitas.durasi" and event == "number":
+                self.durasi[int(value)] += 1
+        self.files += 1
+
+    def merge(self, other: "CatalogStats"):
+        self.files += other.files
+        self.errors += other.errors
+        self.weeks += other.weeks
+        self.materi += other.materi
+        self.learning_outcomes += other.learning_outcomes
+        self.projects += other.projects
+        self.technologies.update(other.technologies)
+        self.assessment_bobot.update(other.assessment_bobot)
+        self.lo_kategori.update(other.lo_kategori)
+        self.durasi.update(other.durasi)
+
+    def summary(self) -> Dict[str, Any]:
+        bobot_total = sum(self.assessment_bobot.values())
+        return {
+            "files": self.files,
+            "errors": self.errors,
+            "weeks": self.weeks,
+            "avg_weeks_per_curriculum": round(self.weeks / self.files, 2) if self.files else 0,
+            "avg_materi_per_week": round(self.materi / self.weeks, 2) if self.weeks else 0,
+            "avg_learning_outcomes": round(self.learning_outcomes / self.files, 2) if self.files else 0,
+            "projects": self.projects,
+            "distinct_technologies": len(self.technologies),
+            "assessment_components": bobot_total,
+            "avg_assessment_bobot": round(sum(b * n for b, n in self.assessment_bobot.items()) / bobot_total, 2)
+            if bobot_total else 0
+        }
+
+
+def open_task(task: Task, zip_cache: Dict[str, zipfile.ZipFile]):
+    """
+    Open a source task from iter_sources as a binary file object.
+
+    Zip archives are opened once and kept in zip_cache; the caller closes them.
+    """
+    kind = task[0]
+    if kind == "file":
+        return open(task[1], "rb")
+    if kind == "zip":
+        archive = zip_cache.get(task[1])
+        if archive is None:
+            archive = zip_cache[task[1]] = zipfile.ZipFile(task[1])
+        return archive.open(task[2])
+    return io.BytesIO(task[2])
+
+
+def analyze_chunk(args: Tuple[List[Task], str]) -> CatalogStats:
+    """Worker: aggregate a chunk of sources into one CatalogStats."""
+    tasks, parser = args
+    stats = CatalogStats()
+    zip_cache: Dict[str, zipfile.ZipFile] = {}
+    for task in tasks:
+        # A file that fails mid-parse must not leave partial counts behind
+        file_stats = CatalogStats()
+        try:
+            with open_task(task, zip_cache) as f:
+                if parser == "ijson":
+                    file_stats.consume(ijson.parse(f))
+                else:
+                    file_stats.consume(walk_events(json.load(f)))
+        except Exception:
+            stats.errors += 1
+            continue
+        stats.merge(file_stats)
+    for archive in zip_cache.values():
+        archive.close()
+    return stats
+
+
+def _chunks(tasks: Iterator[Task], size: int) -> Iterator[List[Task]]:
+    chunk = []
+    for task in tasks:
+        chunk.append(task)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def analyze_catalog(paths: List[str], workers: Optional[int] = None, chunk_size: int = 64,
+                    parser: str = "auto") -> CatalogStats:
+    """
+    Aggregate statistics over every curriculum in paths.
+
+    Chunks are submitted in bounded batches so memory stays flat even when
+    tar members are read into memory.
+
+    Args:
+        paths: Directories, JSON files, .zip or tar archives
+        workers: Worker processes (default: CPU count, 1 = no pool)
+        chunk_size: Files per worker task
+        parser: "ijson", "json" or "auto" (ijson when installed)
+
+    Returns:
+        Merged CatalogStats
+    """
+    if parser == "auto":
+        parser = "ijson" if ijson is not None else "json"
+    if parser == "ijson" and ijson is None:
+        raise ValueError("ijson is not installed (pip install ijson)")
+
+    workers = workers or os.cpu_count() or 1
+    total = CatalogStats()
+    chunks = ((chunk, parser) for chunk in _chunks(iter_sources(paths), chunk_size))
+
+    if workers == 1:
+        for job in chunks:
+            total.merge(analyze_chunk(job))
+        return total
+
+    with Pool(workers) as pool:
+        batch = []
+        for job in chunks:
+            batch.append(job)
+            if len(batch) == workers * 4:
+                for stats in pool.imap_unordered(analyze_chunk, batch):
+                    total.merge(stats)
+                batch = []
+        for stats in pool.imap_unordered(analyze_chunk, batch):
+            total.merge(stats)
+    return total
+
+
+def write_tables(stats: CatalogStats, output_dir: str, fmt: str = "csv") -> List[str]:
+    """Write the aggregate tables as CSV files or one JSON file."""
+    os.makedirs(output_dir, exist_ok=True)
+    tables = {
+        "technologies": (["teknologi", "count"], stats.technologies.most_common()),
+        "assessment_bobot": (["bobot", "count"], sorted(stats.assessment_bobot.items())),
+        "lo_kategori": (["kategori", "count"], stats.lo_kategori.most_common()),
+        "durasi": (["durasi", "count"], sorted(stats.durasi.items()))
+    }
+
+    if fmt == "json":
+        path = os.path.join(output_dir, "catalog_stats.json")
+        payload = {"summary": stats.summary()}
+        payload.update({name: [dict(zip(header, row)) for row in rows]
+                        for name, (header, rows) in tables.items()})
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+        return [path]
+
+    written = []
+    for name, (header, rows) in tables.items():
+        path = os.path.join(output_dir, f"{name}.csv")
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+        written.append(path)
+    path = os.path.join(output_dir, "summary.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(stats.summary(), f, ensure_ascii=False, indent=2)
+    written.append(path)
+    return written
+
+
+# Standalone usage
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Catalog-wide statistics over curriculum JSON files")
+    parser.add_argument("paths", nargs="+", help="Directories, JSON files, .zip or .tar.gz archives")
+    parser.add_argument("--output-dir", "-o", default="catalog_stats", help="Directory for result tables")
+    parser.add_argument("--format", default="csv", choices=["csv", "json"], help="Table format")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=64, help="Files per worker task")
+    parser.add_argument("--parser", default="auto", choices=["auto", "ijson", "json"],
+                        help="Incremental ijson parser or json.load per file")
+    parser.add_argument("--top", type=int, default=10, help="Rows to print per table")
+
+    args = parser.parse_args()
+
+    print("📊 Bootcamp Catalog Analytics")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    stats = analyze_catalog(args.paths, args.workers, args.chunk_size, args.parser)
+    elapsed = time.perf_counter() - start
+
+    summary = stats.summary()
+    print(f"✅ Processed {summary['files']} files in {elapsed:.2f}s ({summary['errors']} errors)")
+    print(f"   - Avg weeks per curriculum: {summary['avg_weeks_per_curriculum']}")
+    print(f"   - Avg materiPokok per week: {summary['avg_materi_per_week']}")
+    print(f"   - Avg learning outcomes: {summary['avg_learning_outcomes']}")
+    print(f"   - Avg assessment bobot: {summary['avg_assessment_bobot']}%")
+
+    print(f"\nTop {args.top} teknologi:")
+    for tech, count in stats.technologies.most_common(args.top):
+        print(f"   {tech:<40} {count:>8}")
+    print("\nLearning outcomes per kategori:")
+    for kategori, count in stats.lo_kategori.most_common():
+        print(f"   {kategori:<40} {count:>8}")
+
+    for path in write_tables(stats, args.output_dir, args.format):
+        print(f"✅ Saved: {path}")
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Hedged Requests for Bootcamp AI Generator
+==========================================
+Tail-latency reduction for OpenAI calls. If a request has not answered
+(or, when streaming, produced its first token) by a deadline learned from
+recent latency history, an identical second request is launched and the
+first valid response wins. A hedge budget caps the extra cost.
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PARENT_DIR = os.path.dirname(BASE_DIR)
+DEFAULT_HISTORY_FILE = os.path.join(PARENT_DIR, 'temp', 'latency_history.json')
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile (q in 0..1) or None for an empty list."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+class LatencyHistory:
+    """
+    Rolling window of recent request latencies, persisted between runs.
+
+    Every CLI invocation is a fresh process, so the history lives in a small
+    JSON file to let the hedge deadline be learned across generations.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_HISTORY_FILE, window: int = 200):
+        self.path = path
+        self.window = window
+        self.data: Dict[str, Any] = {
+            "unhedged": [],     # primary request latency (what we would see without hedging)
+            "hedged": [],       # latency until the winning response
+            "first_token": [],  # primary time-to-first-token when streaming
+            "censored": [],     # primary still running when the hedge won (lower bounds only)
+            "requests": 0,
+            "hedges": 0,
+            "hedge_wins": 0
+        }
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.data.update(json.load(f))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️ Could not read latency history {self.path}: {e}")
+
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f)
+        os.replace(tmp_path, self.path)
+
+    def add(self, key: str, value: float):
+        values = self.data[key]
+        values.append(round(value, 3))
+        del values[:-self.window]
+
+    def quantile(self, key: str, q: float, min_samples: int = 10) -> Optional[float]:
+        values = self.data[key]
+        if len(values) < min_samples:
+            return None
+        return percentile(values, q)
+
+    def report(self) -> str:
+        """Summarize p50/p90/p99 latency with and without hedging."""
+        lines = [f"{'Latency':<22} {'n':>5} {'p50 (s)':>9} {'p90 (s)':>9} {'p99 (s)':>9}", "-" * 58]
+        for key, label in [("unhedged", "Without hedging"), ("hedged", "With hedging"),
+                           ("first_token", "First token")]:
+            values = self.data[key]
+            if not values:
+                continue
+            p50, p90, p99 = (percentile(values, q) for q in (0.5, 0.9, 0.99))
+            lines.append(f"{label:<22} {len(values):>5} {p50:>9.2f} {p90:>9.2f} {p99:>9.2f}")
+        if self.data["censored"]:
+            lines.append(f"Primary still running when the hedge won: {len(self.data['censored'])} "
+                         f"time(s) (lower bounds, not in the percentiles)")
+        requests = self.data["requests"] or 1
+        lines.append(f"Hedges: {self.data['hedges']}/{self.data['requests']} requests "
+                     f"({self.data['hedges'] / requests * 100:.1f}%), "
+                     f"hedge won {self.data['hedge_wins']} time(s)")
+        return "\n".join(lines)
+
+
+class _TimedEvent(threading.Event):
+    """Event that remembers when it was first set."""
+
+    def __init__(self):
+        super().__init__()
+        self.set_at: Optional[float] = None
+
+    def set(self):
+        if self.set_at is None:
+            self.set_at = time.perf_counter()
+        super().set()
+
+
+class RequestHedger:
+    """Run a request with an optional speculative duplicate."""
+
+    def __init__(self, quantile: float = 0.9, budget: float = 0.1,
+                 history_path: Optional[str] = DEFAULT_HISTORY_FILE,
+                 min_samples: int = 10, initial_deadline: Optional[float] = None,
+                 poll_interval: float = 0.05):
+        """
+        Args:
+            quantile: Latency quantile used as the hedge deadline (e.g. 0.9 = p90)
+            budget: Maximum fraction of requests that may be hedged
+            history_path: JSON file for latency history (None = in-memory only)
+            min_samples: History size required before the learned deadline is used
+            initial_deadline: Deadline in seconds while history is too short (None = no hedging)
+            poll_interval: How often the deadline is checked
+        """
+        self.quantile = quantile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.initial_deadline = initial_deadline
+        self.poll_interval = poll_interval
+        self.history = LatencyHistory(history_path)
+        self._lock = threading.Lock()
+
+    def deadline(self, streaming: bool = False) -> Optional[float]:
+        """Current hedge deadline in seconds, learned from history."""
+        key = "first_token" if streaming else "unhedged"
+        learned = self.history.quantile(key, self.quantile, self.min_samples)
+        return learned if learned is not None else self.initial_deadline
+
+    def _can_hedge(self) -> bool:
+        """
+        Whether the budget allows another hedge.
+
+        The request count is floored at 1 / budget, so the first hedge is
+        allowed right away instead of after 1 / budget requests.
+        """
+        if self.budget <= 0:
+            return False
+        data = self.history.data
+        allowed = math.ceil(round(self.budget * max(data["requests"] + 1, 1 / self.budget), 9))
+        return data["hedges"] < allowed
+
+    def run(self, request_fn: Callable[[threading.Event, threading.Event], Any],
+            is_valid: Callable[[Any], bool], streaming: bool = False) -> Any:
+        """
+        Run request_fn, hedging it if it is slower than the deadline.
+
+        Args:
+            request_fn: Called as request_fn(cancel_event, first_token_event). It must
+                abort once cancel_event is set (the losing attempt is cancelled) and
+                set first_token_event when streaming output starts.
+            is_valid: Whether a result is good enough to win
+            streaming: Apply the deadline to the first token instead of the full response
+
+        Returns:
+            The winning result (or the last result if none was valid)
+
+        Raises:
+            The primary request's exception if every attempt failed
+        """
+        results: queue.Queue = queue.Queue()
+        attempts: List[Dict[str, Any]] = []
+        start = time.perf_counter()
+
+        def launch(label: str):
+            attempt = {"label": label, "cancel": threading.Event(),
+                       "first": _TimedEvent(), "start": time.perf_counter()}
+            attempts.append(attempt)
+
+            def target():
+                try:
+                    results.put((label, request_fn(attempt["cancel"], attempt["first"]), None))
+                except Exception as e:
+                    results.put((label, None, e))
+
+            threading.Thread(target=target, daemon=True).start()
+
+        launch("primary")
+        primary = attempts[0]
+        deadline = self.deadline(streaming)
+
+        # Wait for the primary until the deadline
+        if deadline is not None:
+            while results.empty() and time.perf_counter() - start < deadline:
+                if streaming and primary["first"].is_set():
+                    break
+                time.sleep(self.poll_interval)
+            with self._lock:
+                slow = results.empty() and not (streaming and primary["first"].is_set())
+                if slow and self._can_hedge():
+                    self.history.data["hedges"] += 1
+                    print(f"⚡ No response after {deadline:.1f}s (p{int(self.quantile * 100)}), "
+                          f"launching hedged request")
+                    launch("hedge")
+
+        winner = None
+        fallback = None
+        errors = {}
+        primary_done = False
+        pending = len(attempts)
+        while pending:
+            label, result, error = results.get()
+            pending -= 1
+            elapsed = time.perf_counter() - start
+            if label == "primary":
+                primary_done = True
+                if error is None:
+                    with self._lock:
+                        self.history.add("unhedged", elapsed)
+            if error is not None:
+                errors[label] = error
+                continue
+            if is_valid(result):
+                winner = (label, result, elapsed)
+                break
+            fallback = result
+
+        with self._lock:
+            data = self.history.data
+            data["requests"] += 1
+            if primary["first"].set_at is not None:
+                self.history.add("first_token", primary["first"].set_at - primary["start"])
+            if winner:
+                label, result, elapsed = winner
+                self.history.add("hedged", elapsed)
+                if label == "hedge":
+                    data["hedge_wins"] += 1
+                    if not primary_done:
+                        # Primary is cancelled below: its latency is only known to be at
+                        # least this long, so it stays out of the "unhedged" percentiles
+                        self.history.add("censored", time.perf_counter() - primary["start"])
+                    print(f"⚡ Hedged request won after {elapsed:.1f}s")
+            try:
+                self.history.save()
+            except OSError as e:
+                print(f"⚠️ Could not save latency history: {e}")
+
+        for attempt in attempts:
+            attempt["cancel"].set()
+
+        if winner:
+            return winner[1]
+        if fallback is not None:
+            return fallback
+        raise errors.get("primary") or next(iter(errors.values()))
+
+
+# Standalone usage
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Show hedged request latency report")
+    parser.add_argument("--history", default=DEFAULT_HISTORY_FILE, help="Latency history JSON file")
+
+    args = parser.parse_args()
+
+    if not os.path.exists(args.history):
+        print(f"❌ No latency history found at {args.history}")
+        sys.exit(1)
+
+    print("⚡ Hedged Request Latency Report")
+    print("=" * 60)
+    print(LatencyHistory(args.history).report())
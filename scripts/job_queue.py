@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Priority Job Queue for Bootcamp Generation
+===========================================
+Run generation jobs on a fixed number of slots (concurrent OpenAI calls).
+Interactive jobs are scheduled ahead of batch jobs; batch jobs age while
+they wait so a busy UI cannot starve them. Jobs can be cancelled at any
+time: a queued job is dropped, a running job has its in-flight OpenAI
+request aborted and its slot released.
+
+The queue lives inside one Python process; express_api.js does not use it
+(each API request still runs ai_to_json.py in its own process).
+"""
+
+import os
+import sys
+import json
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from hedging import percentile
+
+# Fix encoding for Windows
+if sys.stdout:
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+    except:
+        pass
+
+# Lane -> base priority (lower runs first)
+LANES = {"interactive": 0, "batch": 1}
+
+PENDING, RUNNING, DONE, FAILED, CANCELLED = "pending", "running", "done", "failed", "cancelled"
+
+
+class GenerationJob:
+    """One queued unit of work and its timing."""
+
+    def __init__(self, job_id: int, name: str, lane: str,
+                 func: Callable[[threading.Event], Any]):
+        self.id = job_id
+        self.name = name
+        self.lane = lane
+        self.func = func
+        self.state = PENDING
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.cancel_event = threading.Event()
+        self.submitted_at = time.perf_counter()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.cancelled_at: Optional[float] = None
+        self._done = threading.Event()
+
+    @property
+    def queue_wait(self) -> Optional[float]:
+        if self.started_at is None:
+            return None
+        return self.started_at - self.submitted_at
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job has finished, failed or been cancelled."""
+        return self._done.wait(timeout)
+
+
+class PriorityJobQueue:
+    """
+    Fixed-slot scheduler with priority lanes, aging and cooperative cancellation.
+
+    Aging is linear: a job's effective priority improves by one lane per
+    `aging` seconds of waiting. Since every job ages at the same rate, the
+    order is fixed at submit time (base * aging + submitted_at), so a plain
+    heap is enough.
+    """
+
+    def __init__(self, workers: int = 2, aging: float = 60.0):
+        """
+        Args:
+            workers: Number of slots (concurrent jobs)
+            aging: Seconds of waiting that promote a job by one lane
+        """
+        self.aging = aging
+        self.jobs: List[GenerationJob] = []
+        self._heap: List[tuple] = []
+        self._ids = itertools.count(1)
+        self._cond = threading.Condition()
+        self._closed = False
+        self._threads = [threading.Thread(target=self._worker, daemon=True) for _ in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, func: Callable[[threading.Event], Any], lane: str = "batch",
+               name: str = "") -> GenerationJob:
+        """
+        Queue func(cancel_event) in a lane.
+
+        func must return promptly once cancel_event is set.
+        """
+        if lane not in LANES:
+            raise ValueError(f"Unknown lane '{lane}' (expected one of {', '.join(LANES)})")
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Queue is shut down")
+            job = GenerationJob(next(self._ids), name or f"job-{len(self.jobs) + 1}", lane, func)
+            self.jobs.append(job)
+            heapq.heappush(self._heap, (LANES[lane] * self.aging + job.submitted_at, job.id, job))
+            self._cond.notify()
+        return job
+
+    def submit_generation(self, generator, lane: str = "batch", name: str = "",
+                          **kwargs) -> GenerationJob:
+        """Queue generator.generate_bootcamp_json(**kwargs) as a cancellable job."""
+        return self.submit(
+            lambda cancel_event: generator.with_cancel(cancel_event).generate_bootcamp_json(**kwargs),
+            lane, name or kwargs.get("bootcamp_name", "")
+        )
+
+    def cancel(self, job: GenerationJob) -> bool:
+        """
+        Cancel a job. A queued job never starts; a running job is signalled
+        and its slot is released once func returns.
+
+        Returns:
+            False if the job had already finished
+        """
+        with self._cond:
+            if job.state in (DONE, FAILED, CANCELLED):
+                return False
+            job.cancelled_at = time.perf_counter()
+            job.cancel_event.set()
+            if job.state == PENDING:
+                # Left in the heap; workers skip it
+                self._finish(job, CANCELLED)
+        return True
+
+    def _finish(self, job: GenerationJob, state: str):
+        job.state = state
+        job.finished_at = time.perf_counter()
+        job._done.set()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while not self._heap and not self._closed:
+                    self._cond.wait()
+                if not self._heap:
+                    return
+                _, _, job = heapq.heappop(self._heap)
+                if job.state != PENDING:
+                    continue
+                job.state = RUNNING
+                job.started_at = time.perf_counter()
+
+            try:
+                result, error = job.func(job.cancel_event), None
+            except Exception as e:
+                result, error = None, e
+
+            with self._cond:
+                job.result, job.error = result, error
+                if job.cancel_event.is_set():
+                    self._finish(job, CANCELLED)
+                else:
+                    self._finish(job, FAILED if error is not None or result is None else DONE)
+
+    def join(self):
+        """Wait for every submitted job."""
+        for job in list(self.jobs):
+            job.wait()
+
+    def shutdown(self, cancel_pending: bool = False):
+        """Stop the workers once the queue is drained (or cancel what is left)."""
+        with self._cond:
+            if cancel_pending:
+                for job in self.jobs:
+                    if job.state in (PENDING, RUNNING):
+                        job.cancelled_at = time.perf_counter()
+                        job.cancel_event.set()
+                        if job.state == PENDING:
+                            self._finish(job, CANCELLED)
+            self._closed = True
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue wait per lane, run time, cancellations and cancel-to-release latency."""
+        with self._cond:
+            jobs = list(self.jobs)
+        lanes = {}
+        for lane in LANES:
+            lane_jobs = [j for j in jobs if j.lane == lane]
+            waits = [j.queue_wait for j in lane_jobs if j.queue_wait is not None]
+            runs = [j.finished_at - j.started_at for j in lane_jobs
+                    if j.started_at is not None and j.finished_at is not None]
+            lanes[lane] = {
+                "jobs": len(lane_jobs),
+                "done": sum(j.state == DONE for j in lane_jobs),
+                "failed": sum(j.state == FAILED for j in lane_jobs),
+                "cancelled": sum(j.state == CANCELLED for j in lane_jobs),
+                "queue_wait_p50": percentile(waits, 0.5),
+                "queue_wait_p90": percentile(waits, 0.9),
+                "queue_wait_max": max(waits) if waits else None,
+                "run_p50": percentile(runs, 0.5)
+            }
+        cancelled = [j for j in jobs if j.state == CANCELLED]
+        # How long a running job kept its slot after cancel() was called
+        releases = [j.finished_at - j.cancelled_at for j in cancelled
+                    if j.started_at is not None and j.cancelled_at is not None]
+        return {
+            "lanes": lanes,
+            "cancelled_queued": sum(j.started_at is None for j in cancelled),
+            "cancelled_running": len(releases),
+            "cancel_release_p50": percentile(releases, 0.5),
+            "cancel_release_max": max(releases) if releases else None
+        }
+
+    def report(self) -> str:
+        """Human-readable metrics table."""
+        metrics = self.metrics()
+
+        def fmt(value: Optional[float]) -> str:
+            return f"{value:.2f}" if value is not None else "-"
+
+        lines = [f"{'Lane':<12} {'jobs':>5} {'done':>5} {'fail':>5} {'cancel':>7} "
+                 f"{'wait p50':>9} {'wait p90':>9} {'wait max':>9} {'run p50':>8}", "-" * 78]
+        for lane, m in metrics["lanes"].items():
+            lines.append(f"{lane:<12} {m['jobs']:>5} {m['done']:>5} {m['failed']:>5} {m['cancelled']:>7} "
+                         f"{fmt(m['queue_wait_p50']):>9} {fmt(m['queue_wait_p90']):>9} "
+                         f"{fmt(m['queue_wait_max']):>9} {fmt(m['run_p50']):>8}")
+        lines.append(f"Cancelled: {metrics['cancelled_queued']} queued, {metrics['cancelled_running']} running "
+                     f"(slot released after p50 {fmt(metrics['cancel_release_p50'])}s, "
+                     f"max {fmt(metrics['cancel_release_max'])}s)")
+        return "\n".join(lines)
+
+
+# Standalone usage
+if __name__ == "__main__":
+    import argparse
+    from ai_to_json import BootcampAIGenerator
+
+    parser = argparse.ArgumentParser(description="Run generation jobs with priority lanes")
+    parser.add_argument("jobs", help="JSONL file, one job per line: {name, durasi, level, tipe, "
+                                     "context, lane, output}")
+    parser.add_argument("--workers", type=int, default=2, help="Concurrent generation slots")
+    parser.add_argument("--aging", type=float, default=60.0,
+                        help="Seconds of waiting that promote a batch job to the interactive lane")
+    parser.add_argument("--output-dir", default=".", help="Directory for jobs without an output path")
+
+    args = parser.parse_args()
+
+    print("🚦 Bootcamp Generation Queue")
+    print("=" * 60)
+
+    generator = BootcampAIGenerator()
+    if not generator.client:
+        print("\n❌ Failed to initialize - check API key")
+        sys.exit(1)
+
+    queue = PriorityJobQueue(workers=args.workers, aging=args.aging)
+    outputs = {}
+    with open(args.jobs, 'r', encoding='utf-8') as f:
+        for line_num, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            spec = json.loads(line)
+            job = queue.submit_generation(
+                generator,
+                lane=spec.get("lane", "batch"),
+                bootcamp_name=spec["name"],
+                durasi=spec.get("durasi", 8),
+                level=spec.get("level", "Beginner"),
+                tipe=spec.get("tipe", "Hybrid"),
+                additional_context=spec.get("context", "")
+            )
+            outputs[job.id] = spec.get("output") or os.path.join(args.output_dir, f"bootcamp_job_{line_num}.json")
+
+    try:
+        queue.join()
+    except KeyboardInterrupt:
+        print("\n🛑 Cancelling all jobs...")
+        queue.shutdown(cancel_pending=True)
+
+    for job in queue.jobs:
+        if job.state == DONE:
+            with open(outputs[job.id], 'w', encoding='utf-8') as f:
+                json.dump(job.result, f, ensure_ascii=False, indent=2)
+            print(f"✅ [{job.lane}] {job.name}: {outputs[job.id]}")
+        else:
+            print(f"❌ [{job.lane}] {job.name}: {job.state}")
+
+    print("\n" + queue.report())
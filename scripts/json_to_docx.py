@@ -5,9 +5,13 @@ JSON to DOCX Converter for Bootcamp Workshop
 Convert bootcamp JSON data to professional DOCX document.
 """
 
+import io
+import os
+import re
 import json
 import sys
-from typing import Dict, Any, List
+import zipfile
+from typing import Dict, Any, List, Optional, Set
 # Fix encoding for Windows
 if sys.stdout:
     try:
@@ -21,12 +25,65 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 
+from docx.oxml import parse_xml
+from docx.opc.oxml import serialize_part_xml
+from lxml import etree
+
+from lo_index import LearningOutcomeIndex
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Below this many weeks the process pool's startup costs more than it saves
+PARALLEL_MIN_WEEKS = 26
+
 
 class BootcampToDocx:
     """Convert Bootcamp JSON to DOCX document."""
     
+    # Section renderers in document order
+    SECTION_METHODS = [
+        '_add_cover_page',
+        '_add_description',
+        '_add_target_peserta',
+        '_add_learning_outcomes',
+        '_add_weekly_schedule',
+        '_add_assessment',
+        '_add_lo_coverage',
+        '_add_instructors',
+        '_add_tools_resources',
+        '_add_certification',
+        '_add_facilities',
+        '_add_investment',
+        '_add_references',
+    ]
+    
+    # Sections of a default export, in document order; the LO coverage
+    # matrix is only rendered when asked for with --sections / sections=
+    DEFAULT_SECTIONS = [m for m in SECTION_METHODS if m != '_add_lo_coverage']
+    
+    # Top-level JSON keys each section reads
+    SECTION_KEYS = {
+        '_add_cover_page': ['identitas', 'deskripsiSingkat'],
+        '_add_description': ['deskripsi'],
+        '_add_target_peserta': ['targetPeserta'],
+        '_add_learning_outcomes': ['learningOutcomes'],
+        '_add_weekly_schedule': ['minggu'],
+        '_add_assessment': ['assessment'],
+        '_add_lo_coverage': ['learningOutcomes', 'minggu', 'assessment'],
+        '_add_instructors': ['instruktur'],
+        '_add_tools_resources': ['toolsResources'],
+        '_add_certification': ['sertifikasi'],
+        '_add_facilities': ['fasilitas'],
+        '_add_investment': ['investasi'],
+        '_add_references': ['referensi'],
+    }
+    
     def __init__(self):
         self.doc = Document()
+        self._lo_index = None
         self._setup_styles()
     
     def _setup_styles(self):
@@ -72,6 +129,12 @@ class BootcampToDocx:
         
         tblPr.append(tblBorders)
     
+    def _get_lo_index(self, data: Dict[str, Any]) -> LearningOutcomeIndex:
+        """Return the LO cross-reference index, built once per curriculum."""
+        if self._lo_index is None or self._lo_index.data is not data:
+            self._lo_index = LearningOutcomeIndex(data)
+        return self._lo_index
+    
     def _add_cover_page(self, data: Dict[str, Any]):
         """Add cover page."""
         # Title
@@ -151,15 +214,7 @@ class BootcampToDocx:
         if not los:
             return
         
-        # Group by category
-        categories = {}
-        for lo in los:
-            cat = lo.get('kategori', 'Other')
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(lo)
-        
-        for category, items in categories.items():
+        for category, items in self._get_lo_index(data).by_category.items():
             self._add_heading(f'{category} Skills:', level=2)
             for lo in items:
                 p = self.doc.add_paragraph(style='List Bullet')
@@ -172,78 +227,80 @@ class BootcampToDocx:
         """Add weekly schedule section."""
         self._add_heading('Jadwal Pembelajaran Mingguan', level=1)
         
-        minggu_list = data.get('minggu', [])
+        for minggu in data.get('minggu', []):
+            self._add_week(minggu)
+    
+    def _add_week(self, minggu: Dict[str, Any]):
+        """Add one week of the weekly schedule."""
+        week_num = minggu['mingguKe']
         
-        for minggu in minggu_list:
-            week_num = minggu['mingguKe']
-            
-            # Week header
-            self._add_heading(f"Minggu {week_num}: {minggu['tema']}", level=2)
-            
-            # Learning outcomes for this week
+        # Week header
+        self._add_heading(f"Minggu {week_num}: {minggu['tema']}", level=2)
+        
+        # Learning outcomes for this week
+        p = self.doc.add_paragraph()
+        p.add_run('Learning Outcomes: ').bold = True
+        p.add_run(', '.join(minggu.get('learningOutcomes', [])))
+        
+        # Materi Pokok
+        if 'materiPokok' in minggu:
+            self.doc.add_paragraph()
+            self._add_paragraph('Materi Pokok:', bold=True)
+            for materi in minggu['materiPokok']:
+                self.doc.add_paragraph(materi, style='List Bullet')
+        
+        # Metode Pembelajaran
+        if 'metodePembelajaran' in minggu:
+            metode = minggu['metodePembelajaran']
+            self.doc.add_paragraph()
             p = self.doc.add_paragraph()
-            p.add_run('Learning Outcomes: ').bold = True
-            p.add_run(', '.join(minggu.get('learningOutcomes', [])))
-            
-            # Materi Pokok
-            if 'materiPokok' in minggu:
-                self.doc.add_paragraph()
-                self._add_paragraph('Materi Pokok:', bold=True)
-                for materi in minggu['materiPokok']:
-                    self.doc.add_paragraph(materi, style='List Bullet')
+            p.add_run('Metode: ').bold = True
+            p.add_run(metode['metode'])
             
-            # Metode Pembelajaran
-            if 'metodePembelajaran' in minggu:
-                metode = minggu['metodePembelajaran']
-                self.doc.add_paragraph()
-                p = self.doc.add_paragraph()
-                p.add_run('Metode: ').bold = True
-                p.add_run(metode['metode'])
-                
-                self._add_paragraph(f"Deskripsi: {metode['deskripsi']}")
-                self._add_paragraph(f"Aktivitas: {metode['aktivitas']}")
-            
-            # Waktu
-            if 'waktu' in minggu:
-                p = self.doc.add_paragraph()
-                p.add_run('Alokasi Waktu: ').bold = True
-                p.add_run(minggu['waktu'])
-            
-            # Project (if any)
-            if 'project' in minggu:
-                project = minggu['project']
-                self.doc.add_paragraph()
-                self._add_heading(f"📦 Project: {project['nama']}", level=3)
-                self._add_paragraph(project['deskripsi'])
-                
-                self._add_paragraph('Deliverables:', bold=True)
-                for deliverable in project.get('deliverables', []):
-                    self.doc.add_paragraph(deliverable, style='List Bullet')
-                
-                p = self.doc.add_paragraph()
-                p.add_run('Teknologi: ').bold = True
-                p.add_run(', '.join(project.get('teknologi', [])))
+            self._add_paragraph(f"Deskripsi: {metode['deskripsi']}")
+            self._add_paragraph(f"Aktivitas: {metode['aktivitas']}")
+        
+        # Waktu
+        if 'waktu' in minggu:
+            p = self.doc.add_paragraph()
+            p.add_run('Alokasi Waktu: ').bold = True
+            p.add_run(minggu['waktu'])
+        
+        # Project (if any)
+        if 'project' in minggu:
+            project = minggu['project']
+            self.doc.add_paragraph()
+            self._add_heading(f"📦 Project: {project['nama']}", level=3)
+            self._add_paragraph(project['deskripsi'])
             
-            # Pengalaman Belajar
-            if 'pengalamanBelajar' in minggu:
-                self.doc.add_paragraph()
-                p = self.doc.add_paragraph()
-                p.add_run('Pengalaman Belajar: ').bold = True
-                p.add_run(minggu['pengalamanBelajar'])
+            self._add_paragraph('Deliverables:', bold=True)
+            for deliverable in project.get('deliverables', []):
+                self.doc.add_paragraph(deliverable, style='List Bullet')
             
-            # Penilaian
-            if 'penilaian' in minggu:
-                penilaian = minggu['penilaian']
-                self.doc.add_paragraph()
-                p = self.doc.add_paragraph()
-                p.add_run('Kriteria Penilaian: ').bold = True
-                p.add_run(penilaian['kriteria'])
-                
-                p = self.doc.add_paragraph()
-                p.add_run('Bobot: ').bold = True
-                p.add_run(f"{penilaian['bobot']}%")
+            p = self.doc.add_paragraph()
+            p.add_run('Teknologi: ').bold = True
+            p.add_run(', '.join(project.get('teknologi', [])))
+        
+        # Pengalaman Belajar
+        if 'pengalamanBelajar' in minggu:
+            self.doc.add_paragraph()
+            p = self.doc.add_paragraph()
+            p.add_run('Pengalaman Belajar: ').bold = True
+            p.add_run(minggu['pengalamanBelajar'])
+        
+        # Penilaian
+        if 'penilaian' in minggu:
+            penilaian = minggu['penilaian']
+            self.doc.add_paragraph()
+            p = self.doc.add_paragraph()
+            p.add_run('Kriteria Penilaian: ').bold = True
+            p.add_run(penilaian['kriteria'])
             
-            self.doc.add_paragraph()  # Space between weeks
+            p = self.doc.add_paragraph()
+            p.add_run('Bobot: ').bold = True
+            p.add_run(f"{penilaian['bobot']}%")
+        
+        self.doc.add_paragraph()  # Space between weeks
     
     def _add_assessment(self, data: Dict[str, Any]):
         """Add assessment section."""
@@ -278,6 +335,46 @@ class BootcampToDocx:
         
         self.doc.add_paragraph()
     
+    def _add_lo_coverage(self, data: Dict[str, Any]):
+        """Add learning outcome coverage matrix."""
+        index = self._get_lo_index(data)
+        if not index.outcomes:
+            return
+        
+        self._add_heading('Matriks Cakupan Learning Outcomes', level=1)
+        
+        table = self.doc.add_table(rows=len(index.outcomes) + 1, cols=5)
+        self._add_table_border(table)
+        
+        header_cells = table.rows[0].cells
+        headers = ['Kode', 'Minggu', 'Project', 'Penilaian', 'Status']
+        for i, header in enumerate(headers):
+            header_cells[i].text = header
+            header_cells[i].paragraphs[0].runs[0].font.bold = True
+        
+        for i, code in enumerate(index.outcomes, 1):
+            row = table.rows[i]
+            weeks = index.weeks[code]
+            row.cells[0].text = code
+            row.cells[1].text = ', '.join(str(w) for w in weeks) or '-'
+            row.cells[2].text = '\n'.join(dict.fromkeys(index.projects[code])) or '-'
+            row.cells[3].text = '\n'.join(dict.fromkeys(index.assessments[code])) or '-'
+            row.cells[4].text = '✅ Tercakup' if weeks else '⚠️ Belum tercakup'
+        
+        uncovered = index.uncovered()
+        if uncovered:
+            self.doc.add_paragraph()
+            p = self.doc.add_paragraph()
+            p.add_run('⚠️ Learning outcomes belum tercakup: ').bold = True
+            p.add_run(', '.join(uncovered))
+        
+        if index.dangling:
+            p = self.doc.add_paragraph()
+            p.add_run('⚠️ Kode LO tidak terdefinisi: ').bold = True
+            p.add_run('; '.join(f"{code} ({', '.join(refs)})" for code, refs in index.dangling.items()))
+        
+        self.doc.add_paragraph()
+    
     def _add_instructors(self, data: Dict[str, Any]):
         """Add instructors section."""
         self._add_heading('Tim Instruktur', level=1)
@@ -398,39 +495,334 @@ class BootcampToDocx:
         
         self.doc.add_paragraph()
     
-    def convert(self, json_file: str, output_file: str):
+    @classmethod
+    def resolve_sections(cls, names: List[str]) -> List[str]:
+        """
+        Map section names to renderer methods, in document order.
+        
+        Accepts method names ("_add_weekly_schedule") or short names
+        ("weekly_schedule"); "default" stands for DEFAULT_SECTIONS (e.g.
+        "default,lo_coverage"). Empty names are ignored.
+        
+        Raises:
+            ValueError: For an unknown section name or an empty selection
+        """
+        valid = ', '.join(m[len('_add_'):] for m in cls.SECTION_METHODS)
+        names = [name.strip() for name in names if name.strip()]
+        if not names:
+            raise ValueError(f"No sections selected (valid: {valid})")
+        requested = set()
+        for name in names:
+            if name == 'default':
+                requested.update(cls.DEFAULT_SECTIONS)
+                continue
+            method_name = name if name.startswith('_add_') else f'_add_{name}'
+            if method_name not in cls.SECTION_METHODS:
+                raise ValueError(f"Unknown section '{name}' (valid: {valid})")
+            requested.add(method_name)
+        return [m for m in cls.SECTION_METHODS if m in requested]
+    
+    def _render_tasks(self, data: Dict[str, Any], workers: int,
+                      sections: Optional[List[str]] = None) -> List[tuple]:
+        """
+        Split the document into independently renderable tasks, in order.
+        
+        The weekly schedule is split into week groups so long programs spread
+        over all workers; every other section is one task.
+        """
+        tasks = []
+        weeks = data.get('minggu', [])
+        group_size = max(1, -(-len(weeks) // (workers * 2)))
+        for method_name in sections or self.DEFAULT_SECTIONS:
+            if method_name != '_add_weekly_schedule':
+                tasks.append(('section', method_name))
+                continue
+            tasks.append(('weekly_heading',))
+            for start in range(0, len(weeks), group_size):
+                tasks.append(('weeks', start, start + group_size))
+        return tasks
+    
+    @staticmethod
+    def effective_workers(data: Dict[str, Any], workers: int) -> int:
+        """
+        Number of render processes actually worth starting.
+        
+        Capped at the CPU count; 1 (sequential) on a single CPU or for
+        programs shorter than PARALLEL_MIN_WEEKS.
+        """
+        workers = min(workers, os.cpu_count() or 1)
+        if len(data.get('minggu', [])) < PARALLEL_MIN_WEEKS:
+            return 1
+        return max(1, workers)
+    
+    def _render_parallel(self, data: Dict[str, Any], workers: int,
+                         sections: Optional[List[str]] = None):
+        """
+        Render sections in a process pool and splice the XML into this document.
+        
+        Every worker starts from the same default template and styles, so the
+        spliced body is identical to the sequential output.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        
+        tasks = self._render_tasks(data, workers, sections)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker,
+                                 initargs=(data,)) as pool:
+            fragments = list(pool.map(_render_task, tasks))
+        
+        splice_fragments(self.doc, [xml for fragment in fragments for xml in fragment])
+    
+    def render_fragment(self, data: Dict[str, Any], task: tuple) -> List[bytes]:
+        """
+        Render one task and return the new body elements as XML.
+        
+        Args:
+            data: Bootcamp data
+            task: ('section', method_name), ('weekly_heading',) or ('weeks', start, end)
+            
+        Returns:
+            Serialized body child elements, in document order
+        """
+        body = self.doc.element.body
+        before = len(body)
+        if task[0] == 'section':
+            getattr(self, task[1])(data)
+        elif task[0] == 'weekly_heading':
+            self._add_heading('Jadwal Pembelajaran Mingguan', level=1)
+        else:
+            for minggu in data.get('minggu', [])[task[1]:task[2]]:
+                self._add_week(minggu)
+        # New elements are inserted before the trailing sectPr
+        new_elements = list(body)[before - 1:len(body) - 1]
+        return [etree.tostring(element) for element in new_elements]
+    
+    def convert(self, json_file: str, output_file: str, workers: int = 1,
+                sections: Optional[List[str]] = None):
         """
         Convert JSON file to DOCX.
         
         Args:
             json_file: Path to input JSON file
             output_file: Path to output DOCX file
+            workers: Render sections in up to this many processes (1 = sequential,
+                     see effective_workers)
+            sections: Render only these sections (see resolve_sections); only
+                      the top-level keys they need are loaded
         """
         print(f"📄 Converting {json_file} to {output_file}")
         
         # Load JSON data
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if sections is not None:
+            sections = self.resolve_sections(sections)
+            keys = {key for method_name in sections for key in self.SECTION_KEYS[method_name]}
+            data = load_top_level_keys(json_file, keys)
+            print(f"   Sections: {', '.join(m[len('_add_'):] for m in sections)}")
+        else:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         
         # Build document
-        self._add_cover_page(data)
-        self._add_description(data)
-        self._add_target_peserta(data)
-        self._add_learning_outcomes(data)
-        self._add_weekly_schedule(data)
-        self._add_assessment(data)
-        self._add_instructors(data)
-        self._add_tools_resources(data)
-        self._add_certification(data)
-        self._add_facilities(data)
-        self._add_investment(data)
-        self._add_references(data)
+        if workers > 1:
+            requested, workers = workers, self.effective_workers(data, workers)
+            if workers < requested:
+                print(f"   Workers: {workers} (requested {requested}; "
+                      f"{os.cpu_count() or 1} CPU(s), {len(data.get('minggu', []))} weeks)")
+        if workers > 1:
+            self._render_parallel(data, workers, sections)
+        else:
+            for method_name in sections or self.DEFAULT_SECTIONS:
+                getattr(self, method_name)(data)
         
         # Save document
         self.doc.save(output_file)
         print(f"✅ DOCX saved to: {output_file}")
 
 
+def load_top_level_keys(json_file: str, keys: Set[str]) -> Dict[str, Any]:
+    """
+    Load only the given top-level keys of a curriculum JSON file.
+    
+    With ijson installed the file is parsed incrementally and objects are
+    built for the requested keys only; otherwise the whole file is parsed
+    with json.load and the other keys are dropped, which saves nothing on
+    loading.
+    """
+    if ijson is None:
+        with open(json_file, 'r', encoding='utf-8') as f:
+            return {key: value for key, value in json.load(f).items() if key in keys}
+    
+    builders = {}
+    with open(json_file, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if not prefix:
+                continue
+            key = prefix.split('.', 1)[0]
+            if key not in keys:
+                continue
+            builder = builders.get(key)
+            if builder is None:
+                builder = builders[key] = ijson.ObjectBuilder()
+            builder.event(event, value)
+    return {key: builder.value for key, builder in builders.items()}
+
+
+class CohortVariantRenderer:
+    """
+    Render many cohort variants of one curriculum from a single base render.
+    
+    Only the cover page (identitas), instructors and investment sections
+    differ between cohorts. The rest of the body is rendered once into a
+    serialized document.xml with a slot per cohort section; each variant
+    renders just those sections and writes them into the slots.
+    """
+    
+    # Cohort-specific section -> top-level key it renders
+    VARIANT_SECTIONS = {
+        '_add_cover_page': 'identitas',
+        '_add_instructors': 'instruktur',
+        '_add_investment': 'investasi',
+    }
+    _SLOT = re.compile(rb'<w:p><w:r><w:t>@@VARIANT:(\w+)@@</w:t></w:r></w:p>')
+    
+    def __init__(self, data: Dict[str, Any], sections: Optional[List[str]] = None):
+        """
+        Args:
+            data: Base Bootcamp data shared by every cohort
+            sections: Render only these sections (see BootcampToDocx.resolve_sections)
+        """
+        self.data = data
+        if sections is not None:
+            sections = BootcampToDocx.resolve_sections(sections)
+        
+        base = BootcampToDocx()
+        for method_name in sections or BootcampToDocx.DEFAULT_SECTIONS:
+            if method_name in self.VARIANT_SECTIONS:
+                base.doc.add_paragraph(f"@@VARIANT:{method_name}@@")
+            else:
+                getattr(base, method_name)(data)
+        
+        buffer = io.BytesIO()
+        base.doc.save(buffer)
+        with zipfile.ZipFile(buffer) as package:
+            self._parts = [(info, package.read(info.filename)) for info in package.infolist()]
+        
+        document_xml = dict((info.filename, content) for info, content in self._parts)['word/document.xml']
+        pieces = self._SLOT.split(document_xml)
+        self._chunks = pieces[0::2]
+        self._slots = [name.decode() for name in pieces[1::2]]
+        
+        # Scratch document for the per-cohort sections
+        self._scratch = BootcampToDocx()
+    
+    def merge(self, overrides: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Apply one cohort's overrides to the base data.
+        
+        identitas is merged field by field (kode, kapasitas, tipe, ...);
+        instruktur and investasi are replaced.
+        
+        Raises:
+            ValueError: If overrides touch a section shared by all cohorts
+        """
+        shared = set(overrides) - set(self.VARIANT_SECTIONS.values()) - {'output'}
+        if shared:
+            raise ValueError(f"Cohort overrides may only change identitas, instruktur and investasi "
+                             f"(got {', '.join(sorted(shared))})")
+        data = dict(self.data)
+        if 'identitas' in overrides:
+            data['identitas'] = dict(self.data.get('identitas', {}), **overrides['identitas'])
+        for key in ('instruktur', 'investasi'):
+            if key in overrides:
+                data[key] = overrides[key]
+        return data
+    
+    def _render_section(self, method_name: str, data: Dict[str, Any]) -> bytes:
+        """Render one section on the scratch document and return its body XML."""
+        body = self._scratch.doc.element.body
+        for child in list(body):
+            if child is not body.sectPr:
+                body.remove(child)
+        getattr(self._scratch, method_name)(data)
+        xml = serialize_part_xml(self._scratch.doc.element)
+        start = xml.index(b'<w:body>') + len(b'<w:body>')
+        end = xml.rindex(b'<w:sectPr')
+        return xml[start:end]
+    
+    def render(self, overrides: Dict[str, Any], output_file: str):
+        """Write one cohort variant to output_file."""
+        data = self.merge(overrides)
+        parts = [self._chunks[0]]
+        for method_name, chunk in zip(self._slots, self._chunks[1:]):
+            parts.append(self._render_section(method_name, data))
+            parts.append(chunk)
+        document_xml = b''.join(parts)
+        
+        with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED) as package:
+            for info, content in self._parts:
+                package.writestr(info, document_xml if info.filename == 'word/document.xml' else content)
+    
+    def render_all(self, variants: List[Dict[str, Any]], output_dir: str) -> List[str]:
+        """
+        Write every cohort variant.
+        
+        Args:
+            variants: Cohort overrides; an optional "output" key names the file
+                      (default: <identitas.kode>.docx)
+            output_dir: Directory for the generated files
+            
+        Returns:
+            Paths of the written files
+            
+        Raises:
+            ValueError: If a file name is not a plain name inside output_dir
+        """
+        names = []
+        for i, overrides in enumerate(variants, 1):
+            kode = overrides.get('identitas', {}).get('kode') or f"cohort_{i}"
+            name = str(overrides.get('output') or f"{kode}.docx")
+            if '/' in name or '\\' in name or name in ('', '.', '..'):
+                raise ValueError(f"Cohort {i}: output '{name}' must be a file name without directories")
+            names.append(name)
+        
+        os.makedirs(output_dir, exist_ok=True)
+        written = []
+        for overrides, name in zip(variants, names):
+            output_file = os.path.join(output_dir, name)
+            self.render(overrides, output_file)
+            written.append(output_file)
+        return written
+
+
+def splice_fragments(doc, fragments: List[bytes]):
+    """Append serialized body elements to a document, before its sectPr."""
+    body = doc.element.body
+    sect_pr = body.sectPr
+    for xml in fragments:
+        element = parse_xml(xml)
+        if sect_pr is not None:
+            sect_pr.addprevious(element)
+        else:
+            body.append(element)
+        # Drop the namespace declarations the fragment carried on its own
+        etree.cleanup_namespaces(element)
+
+
+_worker_data = None
+_worker_converter = None
+
+
+def _init_render_worker(data: Dict[str, Any]):
+    """Process pool initializer: receive the curriculum once per worker."""
+    global _worker_data, _worker_converter
+    _worker_data = data
+    _worker_converter = BootcampToDocx()
+
+
+def _render_task(task: tuple) -> List[bytes]:
+    """Process pool entry point: render one task on the worker's document."""
+    return _worker_converter.render_fragment(_worker_data, task)
+
+
 # Standalone usage
 if __name__ == "__main__":
     import argparse
@@ -438,11 +830,61 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Convert Bootcamp JSON to DOCX")
     parser.add_argument("--input", "-i", default="bootcamp_generated.json", help="Input JSON file")
     parser.add_argument("--output", "-o", default="bootcamp_curriculum.docx", help="Output DOCX file")
+    parser.add_argument("--workers", "-w", type=int, default=1,
+                        help="Render sections in parallel processes (default: 1 = sequential)")
+    parser.add_argument("--sections", default=None,
+                        help="Comma-separated sections to render (e.g. weekly_schedule,assessment); "
+                             f"one of: {', '.join(m[len('_add_'):] for m in BootcampToDocx.SECTION_METHODS)}. "
+                             "lo_coverage is only rendered when listed; 'default' adds the default set "
+                             "(e.g. default,lo_coverage)")
+    parser.add_argument("--variants", default=None,
+                        help="JSON list of cohort overrides (identitas/instruktur/investasi); "
+                             "renders the shared body once and writes one DOCX per cohort")
+    parser.add_argument("--output-dir", default=".", help="Directory for --variants output files")
+    parser.add_argument("--profile", nargs="?", const="cprofile", choices=["cprofile", "sample"],
+                        help="Profile the conversion (default: cprofile; 'sample' for a sampling profile)")
+    parser.add_argument("--profile-output", default=None,
+                        help="Profile output file (default: <output>.prof or <output>.collapsed)")
     
     args = parser.parse_args()
+    if args.profile and args.workers > 1:
+        # Sections render in worker processes, out of the profiler's reach
+        parser.error("--profile cannot be combined with --workers > 1")
     
     print("DOCX Converter Started...")
     print("=" * 60)
     
+    sections = None
+    if args.sections is not None:
+        try:
+            sections = BootcampToDocx.resolve_sections(args.sections.split(','))
+        except ValueError as e:
+            parser.error(f"--sections: {e}")
+    
+    if args.variants:
+        with open(args.input, 'r', encoding='utf-8') as f:
+            base_data = json.load(f)
+        with open(args.variants, 'r', encoding='utf-8') as f:
+            variants = json.load(f)
+        print(f"📄 Rendering {len(variants)} cohort variants of {args.input}")
+        renderer = CohortVariantRenderer(base_data, sections)
+        try:
+            written = renderer.render_all(variants, args.output_dir)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        for path in written:
+            print(f"✅ DOCX saved to: {path}")
+        sys.exit(0)
     converter = BootcampToDocx()
-    converter.convert(args.input, args.output)
+    if args.profile:
+        from profiling import run_profiled, default_profile_output
+        run_profiled(
+            lambda: converter.convert(args.input, args.output, args.workers, sections),
+            args.profile,
+            args.profile_output or default_profile_output(args.output, args.profile),
+            target=converter,
+            section_names=BootcampToDocx.SECTION_METHODS
+        )
+    else:
+        converter.convert(args.input, args.output, args.workers, sections)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Learning Outcome Cross-Reference Index
+=======================================
+Index from LO code to the weeks, projects and assessments that cover it,
+built in one pass per curriculum. Used by json_to_docx.py for the LO
+coverage matrix and usable standalone for coverage queries over a catalog.
+"""
+
+import sys
+import json
+from typing import Any, Dict, List
+
+# Fix encoding for Windows
+if sys.stdout:
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+    except:
+        pass
+
+
+class LearningOutcomeIndex:
+    """Map LO codes to the weeks, projects and assessments that reference them."""
+
+    def __init__(self, data: Dict[str, Any]):
+        """
+        Build the index.
+
+        Args:
+            data: Bootcamp data. Weeks reference LOs via minggu[].learningOutcomes,
+                  assessment components via assessment[].learningOutcomes
+                  (optional; older curricula have no links there).
+        """
+        self.data = data
+        self.outcomes: Dict[str, Dict[str, Any]] = {}
+        self.by_category: Dict[str, List[Dict[str, Any]]] = {}
+        self.weeks: Dict[str, List[int]] = {}
+        self.projects: Dict[str, List[str]] = {}
+        self.assessments: Dict[str, List[str]] = {}
+        self.dangling: Dict[str, List[str]] = {}
+
+        for lo in data.get('learningOutcomes', []):
+            code = lo.get('kode')
+            if not code:
+                continue
+            self.outcomes[code] = lo
+            self.by_category.setdefault(lo.get('kategori', 'Other'), []).append(lo)
+            self.weeks[code] = []
+            self.projects[code] = []
+            self.assessments[code] = []
+
+        for minggu in data.get('minggu', []):
+            week_num = minggu.get('mingguKe')
+            where = f"Minggu {week_num}"
+            for code in minggu.get('learningOutcomes', []):
+                if code not in self.outcomes:
+                    self.dangling.setdefault(code, []).append(where)
+                    continue
+                self.weeks[code].append(week_num)
+                if 'project' in minggu:
+                    self.projects[code].append(minggu['project'].get('nama', ''))
+
+        for assessment in data.get('assessment', []):
+            for code in assessment.get('learningOutcomes', []):
+                if code not in self.outcomes:
+                    self.dangling.setdefault(code, []).append(assessment.get('nama', 'Assessment'))
+                    continue
+                self.assessments[code].append(assessment.get('nama', 'Assessment'))
+
+    def uncovered(self) -> List[str]:
+        """LO codes that no week covers."""
+        return [code for code, weeks in self.weeks.items() if not weeks]
+
+    def coverage(self, code: str) -> Dict[str, Any]:
+        """Weeks, projects and assessments for one LO code."""
+        return {
+            'kode': code,
+            'defined': code in self.outcomes,
+            'weeks': self.weeks.get(code, []),
+            'projects': self.projects.get(code, []),
+            'assessments': self.assessments.get(code, []),
+            'dangling_refs': self.dangling.get(code, [])
+        }
+
+
+# Standalone usage
+if __name__ == "__main__":
+    import argparse
+    from catalog_analytics import iter_sources, open_task
+
+    parser = argparse.ArgumentParser(description="Query learning outcome coverage across curricula")
+    parser.add_argument("paths", nargs="+", help="Curriculum JSON files, directories or archives")
+    parser.add_argument("--lo", default=None, help="Show coverage of this LO code in every curriculum")
+    parser.add_argument("--issues-only", action="store_true",
+                        help="Only list curricula with uncovered or dangling LO codes")
+
+    args = parser.parse_args()
+
+    print("🎯 Learning Outcome Coverage")
+    print("=" * 60)
+
+    zip_cache = {}
+    checked = with_issues = 0
+    for task in iter_sources(args.paths):
+        name = task[-1] if task[0] != "bytes" else task[1]
+        try:
+            with open_task(task, zip_cache) as f:
+                index = LearningOutcomeIndex(json.load(f))
+        except Exception as e:
+            print(f"❌ {name}: {e}")
+            continue
+        checked += 1
+
+        uncovered = index.uncovered()
+        if uncovered or index.dangling:
+            with_issues += 1
+        elif args.issues_only:
+            continue
+
+        if args.lo:
+            cov = index.coverage(args.lo)
+            weeks = ', '.join(str(w) for w in cov['weeks']) or '-'
+            print(f"{name}: {args.lo} weeks [{weeks}], projects {len(cov['projects'])}, "
+                  f"assessments {len(cov['assessments'])}")
+        else:
+            print(f"{name}: {len(index.outcomes)} LOs")
+        if uncovered:
+            print(f"   ⚠️ Uncovered: {', '.join(uncovered)}")
+        for code, refs in index.dangling.items():
+            print(f"   ⚠️ Dangling {code} in {', '.join(refs)}")
+
+    for archive in zip_cache.values():
+        archive.close()
+    print(f"\n✅ Checked {checked} curricula, {with_issues} with LO issues")
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Load Testing Harness for Bootcamp Generate/Convert Path
+========================================================
+Drives ai_to_json.py / json_to_docx.py the way express_api.js does (one
+interpreter per request, same timeouts) against a local mock model backend
+and reports throughput, latency percentiles, error rate and peak RSS/CPU
+per concurrency level. Results are appended to a JSONL file so runs can be
+compared over time.
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# Fix encoding for Windows
+if sys.stdout:
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+    except:
+        pass
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PARENT_DIR = os.path.dirname(BASE_DIR)
+DEFAULT_RESULTS_FILE = os.path.join(PARENT_DIR, 'temp', 'load_test_results.jsonl')
+SAMPLE_JSON = os.path.join(PARENT_DIR, 'templates', 'bootcamp_schema.json')
+
+# Same limits as express_api.js
+TIMEOUTS = {"generate": 300.0, "convert": 60.0}
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from hedging import percentile
+
+HAVE_PROC = os.path.isdir("/proc/self")
+
+
+def _proc_tree(root: int) -> List[int]:
+    """PIDs of root and all its descendants, from /proc (Linux)."""
+    parents: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        parents.setdefault(ppid, []).append(int(entry))
+    tree, pending = [], [root]
+    while pending:
+        pid = pending.pop()
+        tree.append(pid)
+        pending.extend(parents.get(pid, []))
+    return tree
+
+
+def _proc_peak_rss(pid: int) -> int:
+    """Peak RSS (VmHWM) of one process in bytes, 0 if it is gone."""
+    try:
+        with open(f"/proc/{pid}/status", "r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+class ResourceSampler:
+    """
+    Sample combined RSS and CPU of this process and its children.
+    
+    With psutil the current RSS of the process tree is summed per sample.
+    Without psutil on Linux each sample sums the peak RSS (VmHWM) of the
+    processes alive at that moment. Elsewhere only getrusage is available,
+    whose children figure is the largest child since the harness started,
+    not per level (reported as peak_rss_cumulative).
+    """
+
+    def __init__(self, interval: float = 0.1):
+        self.interval = interval
+        self.peak_rss = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._cpu_start = 0.0
+
+    @staticmethod
+    def _cpu_seconds() -> float:
+        if resource is None:
+            return 0.0
+        usage = [resource.getrusage(who) for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN)]
+        return sum(u.ru_utime + u.ru_stime for u in usage)
+
+    def start(self):
+        self._cpu_start = self._cpu_seconds()
+        self._stop.clear()
+        if psutil is not None or HAVE_PROC:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        if psutil is None:
+            while not self._stop.wait(self.interval):
+                rss = sum(_proc_peak_rss(pid) for pid in _proc_tree(os.getpid()))
+                self.peak_rss = max(self.peak_rss, rss)
+            return
+        me = psutil.Process()
+        while not self._stop.wait(self.interval):
+            try:
+                processes = [me] + me.children(recursive=True)
+                rss = 0
+                for proc in processes:
+                    try:
+                        rss += proc.memory_info().rss
+                    except psutil.Error:
+                        pass
+                self.peak_rss = max(self.peak_rss, rss)
+            except psutil.Error:
+                pass
+
+    def stop(self) -> Dict[str, Optional[float]]:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        peak_rss = self.peak_rss
+        cumulative = psutil is None and not HAVE_PROC and resource is not None
+        if cumulative:
+            # Largest single process since the harness started, not this level's peak
+            unit = 1 if sys.platform == "darwin" else 1024  # ru_maxrss is KB on Linux
+            peak_rss = unit * max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                                  resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+        return {
+            "peak_rss_mb": round(peak_rss / (1024 * 1024), 1) if peak_rss else None,
+            "peak_rss_cumulative": cumulative,
+            "cpu_seconds": round(self._cpu_seconds() - self._cpu_start, 2) if resource else None
+        }
+
+
+class LoadTester:
+    """Run generate/convert jobs at increasing load and collect statistics."""
+
+    def __init__(self, target: str, base_url: str, executor: str = "subprocess",
+                 durasi: int = 8, input_json: str = SAMPLE_JSON):
+        """
+        Args:
+            target: "generate", "convert" or "pipeline" (generate then convert)
+            base_url: OpenAI-compatible base URL (mock backend)
+            executor: "subprocess" (one interpreter per job, like Express) or "inprocess"
+            durasi: Weeks per generated curriculum
+            input_json: Curriculum used for convert jobs
+        """
+        self.target = target
+        self.base_url = base_url
+        self.executor = executor
+        self.durasi = durasi
+        self.input_json = input_json
+        self.workdir = tempfile.mkdtemp(prefix="bootcamp_load_")
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    def _next_path(self, suffix: str) -> str:
+        with self._lock:
+            self._counter += 1
+            return os.path.join(self.workdir, f"job_{self._counter}{suffix}")
+
+    def _run_subprocess(self, args: List[str], timeout: float):
+        env = dict(os.environ, OPENAI_BASE_URL=self.base_url, OPENAI_API_KEY="mock",
+                   PYTHONIOENCODING="utf-8")
+        result = subprocess.run([sys.executable] + args, env=env, capture_output=True, timeout=timeout)
+        if result.returncode != 0:
+            raise RuntimeError(result.stdout.decode("utf-8", "replace")[-300:])
+
+    def _generate(self) -> str:
+        output = self._next_path(".json")
+        if self.executor == "subprocess":
+            self._run_subprocess([os.path.join(BASE_DIR, "ai_to_json.py"), "--name", "Load Test Bootcamp",
+                                  "--durasi", str(self.durasi), "--output", output], TIMEOUTS["generate"])
+        else:
+            from ai_to_json import BootcampAIGenerator
+            generator = BootcampAIGenerator(api_key="mock")
+            data = generator.generate_bootcamp_json("Load Test Bootcamp", durasi=self.durasi)
+            if not data:
+                raise RuntimeError("Generation failed")
+            data["identitas"] = {"nama": "Load Test Bootcamp", "kode": "LOAD-1", "durasi": self.durasi,
+                                 "tipe": "Hybrid", "level": "Beginner", "kapasitas": 25}
+            with open(output, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+        return output
+
+    def _convert(self, input_json: str):
+        output = self._next_path(".docx")
+        if self.executor == "subprocess":
+            self._run_subprocess([os.path.join(BASE_DIR, "json_to_docx.py"), "--input", input_json,
+                                  "--output", output], TIMEOUTS["convert"])
+        else:
+            from json_to_docx import BootcampToDocx
+            BootcampToDocx().convert(input_json, output)
+        os.remove(output)
+
+    def _with_identitas(self, path: str) -> str:
+        """Express adds identitas before conversion; do the same for generated files."""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if "identitas" not in data:
+            data["identitas"] = {"nama": "Load Test Bootcamp", "kode": "LOAD-1", "durasi": self.durasi,
+                                 "tipe": "Hybrid", "level": "Beginner", "kapasitas": 25}
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+        return path
+
+    def run_job(self) -> Dict[str, Any]:
+        """Run one job and return its latency and outcome."""
+        start = time.perf_counter()
+        error = None
+        try:
+            if self.target == "convert":
+                self._convert(self.input_json)
+            else:
+                generated = self._generate()
+                if self.target == "pipeline":
+                    self._convert(self._with_identitas(generated))
+                os.remove(generated)
+        except subprocess.TimeoutExpired:
+            error = "timeout"
+        except Exception as e:
+            error = str(e)[:200] or type(e).__name__
+        return {"latency": time.perf_counter() - start, "error": error}
+
+    def run_closed_loop(self, concurrency: int, total_requests: int) -> Dict[str, Any]:
+        """Keep `concurrency` jobs in flight until total_requests have finished."""
+        sampler = ResourceSampler()
+        sampler.start()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(lambda _: self.run_job(), range(total_requests)))
+        wall = time.perf_counter() - start
+        return self._summarize(results, wall, sampler.stop(), concurrency=concurrency)
+
+    def run_open_loop(self, rate: float, duration: float, max_in_flight: int = 256) -> Dict[str, Any]:
+        """Start jobs at a fixed arrival rate, independent of completions."""
+        sampler = ResourceSampler()
+        sampler.start()
+        results: List[Dict[str, Any]] = []
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+            futures = []
+            arrivals = int(rate * duration)
+            for i in range(arrivals):
+                delay = start + i / rate - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(pool.submit(self.run_job))
+            results = [f.result() for f in futures]
+        wall = time.perf_counter() - start
+        return self._summarize(results, wall, sampler.stop(), rate=rate)
+
+    @staticmethod
+    def _summarize(results: List[Dict[str, Any]], wall: float, resources: Dict[str, Any],
+                   **level) -> Dict[str, Any]:
+        ok = [r["latency"] for r in results if r["error"] is None]
+        errors = [r["error"] for r in results if r["error"] is not None]
+        summary = dict(level)
+        summary.update({
+            "requests": len(results),
+            "errors": len(errors),
+            "error_rate": round(len(errors) / len(results), 3) if results else 0.0,
+            "throughput_rps": round(len(ok) / wall, 3) if wall else 0.0,
+            "wall_seconds": round(wall, 2),
+            "p50": _round(percentile(ok, 0.5)),
+            "p90": _round(percentile(ok, 0.9)),
+            "p99": _round(percentile(ok, 0.99)),
+            "max": _round(max(ok) if ok else None),
+            "cpu_util": round(resources["cpu_seconds"] / wall, 2) if resources["cpu_seconds"] and wall else None,
+            "sample_errors": sorted(set(errors))[:3]
+        })
+        summary.update(resources)
+        return summary
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 3) if value is not None else None
+
+
+def format_table(levels: List[Dict[str, Any]]) -> str:
+    """Plain-text table of per-level statistics."""
+    key = "concurrency" if "concurrency" in levels[0] else "rate"
+    header = (f"{key.capitalize():>11} {'Req':>5} {'Err%':>6} {'Thru/s':>7} {'p50':>7} {'p90':>7} "
+              f"{'p99':>7} {'RSS MB':>8} {'CPU':>5}")
+    lines = [header, "-" * len(header)]
+    for lvl in levels:
+        lines.append(
+            f"{lvl[key]:>11} {lvl['requests']:>5} {lvl['error_rate'] * 100:>6.1f} {lvl['throughput_rps']:>7.2f} "
+            f"{_fmt(lvl['p50'])} {_fmt(lvl['p90'])} {_fmt(lvl['p99'])} "
+            f"{_fmt(lvl['peak_rss_mb'], 7, 1)}{'*' if lvl.get('peak_rss_cumulative') else ' '} "
+            f"{_fmt(lvl['cpu_util'], 5, 1)}"
+        )
+    return "\n".join(lines)
+
+
+def _fmt(value: Optional[float], width: int = 7, digits: int = 2) -> str:
+    return f"{value:>{width}.{digits}f}" if value is not None else f"{'-':>{width}}"
+
+
+def save_run(results_file: str, run: Dict[str, Any]):
+    os.makedirs(os.path.dirname(os.path.abspath(results_file)), exist_ok=True)
+    with open(results_file, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(run, ensure_ascii=False) + "\n")
+
+
+def compare_runs(results_file: str, target: str, mode: str, limit: int = 5) -> str:
+    """Compare the peak throughput and p99 of the most recent matching runs."""
+    if not os.path.exists(results_file):
+        return f"No previous runs in {results_file}"
+    runs = []
+    with open(results_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            run = json.loads(line)
+            if run["config"]["target"] == target and run["config"]["mode"] == mode:
+                runs.append(run)
+    lines = [f"{'Timestamp':<20} {'Executor':<11} {'Best thru/s':>11} {'p99 @best':>10} {'Max err%':>9}", "-" * 65]
+    for run in runs[-limit:]:
+        best = max(run["levels"], key=lambda lvl: lvl["throughput_rps"])
+        worst_err = max(lvl["error_rate"] for lvl in run["levels"])
+        lines.append(f"{run['timestamp'][:19]:<20} {run['config']['executor']:<11} "
+                     f"{best['throughput_rps']:>11.2f} {_fmt(best['p99'], 10)} {worst_err * 100:>9.1f}")
+    return "\n".join(lines)
+
+
+# Standalone usage
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Load test the bootcamp generate/convert path")
+    parser.add_argument("--target", default="pipeline", choices=["generate", "convert", "pipeline"],
+                        help="Entry point to drive")
+    parser.add_argument("--mode", default="closed", choices=["closed", "open"],
+                        help="closed = fixed concurrency, open = fixed arrival rate")
+    parser.add_argument("--concurrency", default="1,2,4,8", help="Concurrency levels (closed loop)")
+    parser.add_argument("--requests", type=int, default=16, help="Requests per level (closed loop)")
+    parser.add_argument("--rates", default="0.5,1,2", help="Arrival rates in req/s (open loop)")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds per level (open loop)")
+    parser.add_argument("--executor", default="subprocess", choices=["subprocess", "inprocess"],
+                        help="One interpreter per job (like Express) or threads in this process")
+    parser.add_argument("--durasi", type=int, default=8, help="Weeks per generated curriculum")
+    parser.add_argument("--input", default=SAMPLE_JSON, help="Curriculum JSON for convert jobs")
+    parser.add_argument("--base-url", default=None, help="Use this backend instead of starting a mock")
+    parser.add_argument("--mock-latency", type=float, default=2.0, help="Mock backend latency in seconds")
+    parser.add_argument("--mock-jitter", type=float, default=0.5, help="Mock backend latency jitter")
+    parser.add_argument("--mock-error-rate", type=float, default=0.0, help="Mock backend error rate")
+    parser.add_argument("--results", default=DEFAULT_RESULTS_FILE, help="JSONL file to append results to")
+    parser.add_argument("--compare", action="store_true", help="Show previous runs for this target/mode")
+
+    args = parser.parse_args()
+
+    print("📈 Bootcamp Load Test")
+    print("=" * 60)
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        from mock_openai_server import start_mock_server
+        server, base_url = start_mock_server(latency=args.mock_latency, jitter=args.mock_jitter,
+                                             error_rate=args.mock_error_rate)
+        print(f"🧪 Mock backend: {base_url} (latency {args.mock_latency}s ± {args.mock_jitter}s)")
+    if args.executor == "inprocess":
+        os.environ["OPENAI_BASE_URL"] = base_url
+    if psutil is None and not HAVE_PROC:
+        print("⚠️ psutil not installed - RSS MB is the largest single process since start "
+              "(cumulative, marked with *)")
+
+    tester = LoadTester(args.target, base_url, args.executor, args.durasi, args.input)
+    levels = []
+    try:
+        if args.mode == "closed":
+            for concurrency in [int(c) for c in args.concurrency.split(",")]:
+                print(f"\n▶️ Concurrency {concurrency}: {args.requests} requests...")
+                levels.append(tester.run_closed_loop(concurrency, args.requests))
+                print(format_table(levels[-1:]))
+        else:
+            for rate in [float(r) for r in args.rates.split(",")]:
+                print(f"\n▶️ Arrival rate {rate}/s for {args.duration}s...")
+                levels.append(tester.run_open_loop(rate, args.duration))
+                print(format_table(levels[-1:]))
+    finally:
+        if server:
+            server.shutdown()
+
+    print("\n📊 Summary")
+    print(format_table(levels))
+    for lvl in levels:
+        if lvl["sample_errors"]:
+            print(f"⚠️ Errors at {lvl.get('concurrency', lvl.get('rate'))}: {lvl['sample_errors']}")
+
+    run = {
+        "timestamp": datetime.now().isoformat(),
+        "config": {"target": args.target, "mode": args.mode, "executor": args.executor,
+                   "durasi": args.durasi, "mock_latency": None if args.base_url else args.mock_latency},
+        "levels": levels
+    }
+    save_run(args.results, run)
+    print(f"\n✅ Results appended to: {args.results}")
+
+    if args.compare:
+        print("\n🔁 Previous runs")
+        print(compare_runs(args.results, args.target, args.mode))
@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+"""
+Mock OpenAI-Compatible Server for Bootcamp Scripts
+===================================================
+Local stand-in for the OpenAI chat completions API. Answers generation
+prompts with a curriculum built from templates/bootcamp_schema.json (sized
+to the requested durasi) and section prompts with the matching section, with
+configurable latency and error rate. An output limit (--max-tokens or the
+request's max_tokens) cuts replies with finish_reason "length", and a
+continuation request gets the rest of the same reply. Prompt prefixes are remembered so
+usage reports cached input tokens like OpenAI prompt caching. The files and
+batches endpoints emulate the batch job lifecycle (validating ->
+in_progress -> finalizing -> completed) for bulk generation. Point the scripts at it with:
+
+    OPENAI_BASE_URL=http://127.0.0.1:8800/v1 OPENAI_API_KEY=mock python3 scripts/ai_to_json.py ...
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import hashlib
+import random
+import itertools
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+# Fix encoding for Windows
+if sys.stdout:
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+    except:
+        pass
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PARENT_DIR = os.path.dirname(BASE_DIR)
+TEMPLATE_FILE = os.path.join(PARENT_DIR, 'templates', 'bootcamp_schema.json')
+
+# Prompt caching emulation: prefixes are cached in blocks of this many
+# characters (~128 tokens) once a prompt reaches MIN_CACHED_CHARS (~1024 tokens)
+CACHE_BLOCK_CHARS = 512
+MIN_CACHED_CHARS = 4096
+
+# Completion tokens are counted as characters / CHARS_PER_TOKEN
+CHARS_PER_TOKEN = 4
+
+# Keys the generator adds itself (Express adds identitas/id/timestamps)
+_METADATA_KEYS = ["id", "createdAt", "updatedAt", "identitas"]
+
+
+def load_template() -> Dict[str, Any]:
+    with open(TEMPLATE_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def build_curriculum(template: Dict[str, Any], durasi: int) -> Dict[str, Any]:
+    """Build a generator-style response with exactly durasi weeks."""
+    data = {key: value for key, value in template.items() if key not in _METADATA_KEYS}
+    weeks = template["minggu"]
+    data["minggu"] = [
+        dict(weeks[i % len(weeks)], mingguKe=i + 1) for i in range(durasi)
+    ]
+    return data
+
+
+def build_reply(template: Dict[str, Any], prompt: str) -> str:
+    """Answer a generation, section or continuation prompt."""
+    week_match = re.search(r"SATU objek JSON untuk minggu ke-(\d+)", prompt)
+    if week_match:
+        week_num = int(week_match.group(1))
+        week = template["minggu"][(week_num - 1) % len(template["minggu"])]
+        return json.dumps(dict(week, mingguKe=week_num), ensure_ascii=False)
+
+    key_match = re.search(r'objek JSON dengan satu key "(\w+)"', prompt)
+    if key_match:
+        key = key_match.group(1)
+        return json.dumps({key: template.get(key)}, ensure_ascii=False)
+
+    durasi_match = re.search(r"Durasi: (\d+) minggu", prompt)
+    durasi = int(durasi_match.group(1)) if durasi_match else len(template["minggu"])
+    return json.dumps(build_curriculum(template, durasi), ensure_ascii=False, indent=2)
+
+
+def build_answer(template: Dict[str, Any], messages: List[Dict[str, Any]],
+                 max_tokens: Optional[int] = None) -> Tuple[str, str]:
+    """
+    Answer a conversation, honouring an output limit.
+    
+    A conversation ending in user -> assistant -> user is a continuation:
+    the reply to the earlier user prompt is rebuilt and the part after what
+    the assistant already wrote is returned.
+    
+    Returns:
+        (content, finish_reason) - "length" when max_tokens cut the reply
+    """
+    roles = [m.get("role") for m in messages]
+    written = ""
+    prompt = messages[-1]["content"] if messages else ""
+    if len(messages) >= 3 and roles[-2:] == ["assistant", "user"] and "user" in roles[:-2]:
+        written = messages[-2].get("content") or ""
+        prompt = messages[max(i for i, role in enumerate(roles[:-2]) if role == "user")]["content"]
+    full = build_reply(template, prompt)
+    content = full[len(written):] if full.startswith(written) else full
+    
+    if max_tokens is not None and len(content) > max_tokens * CHARS_PER_TOKEN:
+        return content[:max_tokens * CHARS_PER_TOKEN], "length"
+    return content, "stop"
+
+
+class MockState:
+    """Server configuration and counters shared by all handler threads."""
+
+    def __init__(self, latency: float = 0.5, jitter: float = 0.0, error_rate: float = 0.0,
+                 seed: Optional[int] = None, batch_duration: float = 5.0,
+                 max_tokens: Optional[int] = None):
+        self.latency = latency
+        self.max_tokens = max_tokens
+        self.batch_duration = batch_duration
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.template = load_template()
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.calls: Dict[str, int] = {}
+        self.prefix_cache = set()
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.batches: Dict[str, Dict[str, Any]] = {}
+        self._ids = itertools.count(1)
+    
+    def count_call(self, endpoint: str):
+        """Count a files/batches API call (e.g. "files.create") for resume checks."""
+        with self.lock:
+            self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+    
+    def new_id(self, prefix: str) -> str:
+        return f"{prefix}-mock{next(self._ids):06d}"
+    
+    def add_file(self, content: bytes, filename: str, purpose: str) -> Dict[str, Any]:
+        file_id = self.new_id("file")
+        with self.lock:
+            self.files[file_id] = {"id": file_id, "object": "file", "bytes": len(content),
+                                   "created_at": int(time.time()), "filename": filename,
+                                   "purpose": purpose, "content": content}
+        return self.files[file_id]
+
+    def next_delay_and_error(self) -> Tuple[float, bool]:
+        with self.lock:
+            self.requests += 1
+            delay = max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter))
+            fail = self.random.random() < self.error_rate
+            if fail:
+                self.errors += 1
+            return delay, fail
+
+    def output_limit(self, request: Dict[str, Any]) -> Optional[int]:
+        """Smaller of the server-wide and the request's max_tokens (None = unlimited)."""
+        limits = [n for n in (self.max_tokens, request.get("max_tokens"),
+                              request.get("max_completion_tokens")) if n is not None]
+        return min(limits) if limits else None
+
+    def cached_chars(self, prompt: str) -> int:
+        """Length of the longest previously seen block-aligned prefix; remember this prompt's."""
+        if len(prompt) < MIN_CACHED_CHARS:
+            return 0
+        ends = range(CACHE_BLOCK_CHARS, len(prompt) + 1, CACHE_BLOCK_CHARS)
+        keys = [(end, hashlib.sha1(prompt[:end].encode("utf-8")).hexdigest()) for end in ends]
+        with self.lock:
+            cached = max([end for end, key in keys if key in self.prefix_cache] or [0])
+            self.prefix_cache.update(key for _, key in keys)
+        return cached if cached >= MIN_CACHED_CHARS else 0
+
+
+def run_batch(state: MockState, batch: Dict[str, Any]):
+    """Walk a batch through its lifecycle and write the output/error files."""
+    lines = [line for line in state.files[batch["input_file_id"]]["content"].splitlines() if line.strip()]
+    time.sleep(state.batch_duration * 0.1)
+    batch.update(status="in_progress", in_progress_at=int(time.time()))
+    
+    outputs, errors = [], []
+    for line in lines:
+        time.sleep(state.batch_duration * 0.8 / max(1, len(lines)))
+        if batch["status"] == "cancelling":
+            break
+        request = json.loads(line)
+        _, fail = state.next_delay_and_error()
+        if fail:
+            errors.append({"id": state.new_id("batch_req"), "custom_id": request["custom_id"],
+                           "response": {"status_code": 500, "body": {"error": {
+                               "message": "Mock server error", "type": "server_error"}}},
+                           "error": None})
+            batch["request_counts"]["failed"] += 1
+            continue
+        messages = request["body"].get("messages", [])
+        content, finish_reason = build_answer(state.template, messages, state.output_limit(request["body"]))
+        body = completion_payload(request["body"].get("model", "mock"),
+                                  "\n".join(str(m.get("content", "")) for m in messages), content,
+                                  finish_reason=finish_reason)
+        outputs.append({"id": state.new_id("batch_req"), "custom_id": request["custom_id"],
+                        "response": {"status_code": 200, "request_id": state.new_id("req"), "body": body},
+                        "error": None})
+        batch["request_counts"]["completed"] += 1
+    
+    if batch["status"] == "cancelling":
+        batch.update(status="cancelled", cancelled_at=int(time.time()))
+        return
+    batch.update(status="finalizing", finalizing_at=int(time.time()))
+    time.sleep(state.batch_duration * 0.1)
+    for key, records in (("output_file_id", outputs), ("error_file_id", errors)):
+        if records:
+            content = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records).encode("utf-8")
+            batch[key] = state.add_file(content, f"{batch['id']}_{key}.jsonl", "batch_output")["id"]
+    batch.update(status="completed", completed_at=int(time.time()))
+
+
+def parse_multipart(body: bytes, content_type: str) -> Dict[str, Tuple[Optional[str], bytes]]:
+    """Split a multipart/form-data body into {field: (filename, content)}."""
+    boundary = content_type.split("boundary=", 1)[1].strip('"').encode("latin-1")
+    fields = {}
+    for part in body.split(b"--" + boundary):
+        if b"\r\n\r\n" not in part:
+            continue
+        head, content = part.split(b"\r\n\r\n", 1)
+        name = re.search(rb'name="([^"]*)"', head)
+        if not name:
+            continue
+        filename = re.search(rb'filename="([^"]*)"', head)
+        fields[name.group(1).decode()] = (filename.group(1).decode() if filename else None,
+                                          content[:-2] if content.endswith(b"\r\n") else content)
+    return fields
+
+
+class MockOpenAIHandler(BaseHTTPRequestHandler):
+    """Handle /v1/chat/completions, /v1/files, /v1/batches and /health."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def state(self) -> MockState:
+        return self.server.state
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+    
+    def _read_json(self) -> Dict[str, Any]:
+        return json.loads(self._read_body() or b"{}")
+
+    def _send_json(self, payload: Any, status: int = 200):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True  # Client cancelled the request
+
+    def _not_found(self):
+        self._send_json({"error": {"message": f"Unknown path {self.path}"}}, 404)
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path in ("/health", "/v1/health"):
+            self._send_json({"status": "ok", "requests": self.state.requests, "errors": self.state.errors,
+                             "calls": self.state.calls})
+            return
+        match = re.fullmatch(r"/v1/files/([\w-]+)(/content)?", path)
+        if match and match.group(1) in self.state.files:
+            record = self.state.files[match.group(1)]
+            self.state.count_call("files.content" if match.group(2) else "files.retrieve")
+            if match.group(2):
+                self.send_response(200)
+                self.send_header("Content-Type", "application/octet-stream")
+                self.send_header("Content-Length", str(len(record["content"])))
+                self.end_headers()
+                self.wfile.write(record["content"])
+            else:
+                self._send_json({k: v for k, v in record.items() if k != "content"})
+            return
+        match = re.fullmatch(r"/v1/batches/([\w-]+)", path)
+        if match and match.group(1) in self.state.batches:
+            self.state.count_call("batches.retrieve")
+            self._send_json(self.state.batches[match.group(1)])
+            return
+        self._not_found()
+
+    def do_POST(self):
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path == "/v1/files":
+            fields = parse_multipart(self._read_body(), self.headers.get("Content-Type", ""))
+            filename, content = fields.get("file", (None, b""))
+            purpose = fields.get("purpose", (None, b"batch"))[1].decode()
+            record = self.state.add_file(content, filename or "upload.jsonl", purpose)
+            self.state.count_call("files.create")
+            self._send_json({k: v for k, v in record.items() if k != "content"})
+            return
+        if path == "/v1/batches":
+            self.state.count_call("batches.create")
+            self._create_batch(self._read_json())
+            return
+        match = re.fullmatch(r"/v1/batches/([\w-]+)/cancel", path)
+        if match and match.group(1) in self.state.batches:
+            self._read_body()
+            batch = self.state.batches[match.group(1)]
+            if batch["status"] in ("validating", "in_progress"):
+                batch["status"] = "cancelling"
+            self._send_json(batch)
+            return
+        if path != "/v1/chat/completions":
+            self._not_found()
+            return
+
+        request = self._read_json()
+        delay, fail = self.state.next_delay_and_error()
+        time.sleep(delay)
+        if fail:
+            self._send_json({"error": {"message": "Mock server error", "type": "server_error"}}, 500)
+            return
+
+        messages = request.get("messages", [])
+        full_prompt = "\n".join(str(m.get("content", "")) for m in messages)
+        content, finish_reason = build_answer(self.state.template, messages, self.state.output_limit(request))
+        payload = completion_payload(request.get("model", "mock"), full_prompt, content,
+                                     self.state.cached_chars(full_prompt), finish_reason)
+        if request.get("stream"):
+            self._send_stream(request, content, payload["usage"], finish_reason)
+        else:
+            self._send_json(payload)
+
+    def _create_batch(self, request: Dict[str, Any]):
+        input_file_id = request.get("input_file_id")
+        if input_file_id not in self.state.files:
+            self._send_json({"error": {"message": f"No such file: {input_file_id}"}}, 400)
+            return
+        total = sum(1 for line in self.state.files[input_file_id]["content"].splitlines() if line.strip())
+        batch = {
+            "id": self.state.new_id("batch"), "object": "batch",
+            "endpoint": request.get("endpoint", "/v1/chat/completions"),
+            "input_file_id": input_file_id,
+            "completion_window": request.get("completion_window", "24h"),
+            "status": "validating", "output_file_id": None, "error_file_id": None,
+            "created_at": int(time.time()),
+            "request_counts": {"total": total, "completed": 0, "failed": 0},
+            "metadata": request.get("metadata")
+        }
+        self.state.batches[batch["id"]] = batch
+        threading.Thread(target=run_batch, args=(self.state, batch), daemon=True).start()
+        self._send_json(batch)
+
+    def _send_stream(self, request: Dict[str, Any], content: str, usage: Dict[str, Any],
+                     finish_reason: str = "stop", chunk_size: int = 400):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        model = request.get("model", "mock")
+        try:
+            for i in range(0, len(content), chunk_size):
+                chunk = {"id": "chatcmpl-mock", "object": "chat.completion.chunk", "created": int(time.time()),
+                         "model": model, "choices": [{"index": 0, "delta": {"content": content[i:i + chunk_size]},
+                                                      "finish_reason": None}]}
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            final = {"id": "chatcmpl-mock", "object": "chat.completion.chunk", "created": int(time.time()),
+                     "model": model, "choices": [{"index": 0, "delta": {}, "finish_reason": finish_reason}]}
+            self.wfile.write(f"data: {json.dumps(final)}\n\n".encode("utf-8"))
+            if (request.get("stream_options") or {}).get("include_usage"):
+                final = dict(final, choices=[], usage=usage)
+                self.wfile.write(f"data: {json.dumps(final)}\n\n".encode("utf-8"))
+            self.wfile.write(b"data: [DONE]\n\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Client cancelled the stream
+        self.close_connection = True
+
+
+def completion_payload(model: str, prompt: str, content: str, cached_chars: int = 0,
+                       finish_reason: str = "stop") -> Dict[str, Any]:
+    """Build a chat.completion response body."""
+    prompt_tokens = len(prompt) // CHARS_PER_TOKEN
+    completion_tokens = len(content) // CHARS_PER_TOKEN
+    return {
+        "id": "chatcmpl-mock",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content},
+                     "finish_reason": finish_reason}],
+        "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                  "total_tokens": prompt_tokens + completion_tokens,
+                  "prompt_tokens_details": {"cached_tokens": cached_chars // CHARS_PER_TOKEN}}
+    }
+
+
+def start_mock_server(host: str = "127.0.0.1", port: int = 0,
+                      **options) -> Tuple[ThreadingHTTPServer, str]:
+    """
+    Start the mock server in a background thread.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 = any free port)
+        **options: MockState options (latency, jitter, error_rate, seed, batch_duration, max_tokens)
+
+    Returns:
+        (server, base_url) - call server.shutdown() to stop it
+    """
+    server = ThreadingHTTPServer((host, port), MockOpenAIHandler)
+    server.daemon_threads = True
+    server.state = MockState(**options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/v1"
+
+
+# Standalone usage
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run a mock OpenAI-compatible server")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8800, help="Port to bind")
+    parser.add_argument("--latency", type=float, default=0.5, help="Response latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random latency jitter (+/- seconds)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 500")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    parser.add_argument("--batch-duration", type=float, default=5.0,
+                        help="Seconds a batch job takes from submission to completion")
+    parser.add_argument("--max-tokens", type=int, default=None,
+                        help="Cut every reply after this many tokens (~4 chars each) with "
+                             "finish_reason \"length\"; continuation requests get the rest")
+
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), MockOpenAIHandler)
+    server.daemon_threads = True
+    server.state = MockState(latency=args.latency, jitter=args.jitter,
+                             error_rate=args.error_rate, seed=args.seed,
+                             batch_duration=args.batch_duration, max_tokens=args.max_tokens)
+    print(f"🧪 Mock OpenAI server running on http://{args.host}:{args.port}/v1")
+    print(f"   Latency: {args.latency}s ± {args.jitter}s, error rate: {args.error_rate:.0%}")
+    if args.max_tokens:
+        print(f"   Output limit: {args.max_tokens} tokens per reply")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Mock server stopped")
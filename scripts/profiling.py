@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Profiling Helpers for Bootcamp Scripts
+=======================================
+Shared `--profile` support for ai_to_json.py and json_to_docx.py.
+Captures a function-level (cProfile) or sampling profile of a run plus
+wall time and allocated memory per section method.
+"""
+
+import os
+import sys
+import time
+import threading
+import tracemalloc
+import cProfile
+import pstats
+from collections import Counter
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional
+
+PROFILE_MODES = ["cprofile", "sample"]
+
+
+class SectionProfiler:
+    """Record wall time and allocated memory per section method."""
+
+    def __init__(self):
+        self.records: Dict[str, Dict[str, float]] = {}
+        self.peak_seen = 0
+        self._order: List[str] = []
+
+    def instrument(self, obj: Any, method_names: List[str]):
+        """
+        Wrap the given methods on an instance so every call is measured.
+
+        Args:
+            obj: Instance whose methods should be measured
+            method_names: Names of the (leaf) methods to wrap
+        """
+        for name in method_names:
+            method = getattr(obj, name, None)
+            if method is None:
+                continue
+            setattr(obj, name, self._wrap(name, method))
+
+    def _wrap(self, name: str, method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            tracing = tracemalloc.is_tracing()
+            if tracing:
+                # reset_peak() is global, so keep the run-wide peak before clearing it
+                self.peak_seen = max(self.peak_seen, tracemalloc.get_traced_memory()[1])
+                if hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+                    tracemalloc.reset_peak()
+                mem_before = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                allocated = peak = 0
+                if tracing:
+                    current, peak_now = tracemalloc.get_traced_memory()
+                    self.peak_seen = max(self.peak_seen, peak_now)
+                    allocated = current - mem_before
+                    peak = peak_now - mem_before
+                self._record(name, elapsed, allocated, peak)
+        return wrapper
+
+    def _record(self, name: str, elapsed: float, allocated: int, peak: int):
+        if name not in self.records:
+            self.records[name] = {"calls": 0, "wall": 0.0, "allocated": 0, "peak": 0}
+            self._order.append(name)
+        rec = self.records[name]
+        rec["calls"] += 1
+        rec["wall"] += elapsed
+        rec["allocated"] += allocated
+        rec["peak"] = max(rec["peak"], peak)
+
+    def summary_table(self) -> str:
+        """Return a plain-text table of per-section wall time and memory."""
+        total = sum(rec["wall"] for rec in self.records.values()) or 1.0
+        lines = [
+            f"{'Section':<28} {'Calls':>5} {'Wall (ms)':>10} {'%':>6} {'Alloc (KB)':>11} {'Peak (KB)':>10}",
+            "-" * 75,
+        ]
+        for name in self._order:
+            rec = self.records[name]
+            lines.append(
+                f"{name:<28} {rec['calls']:>5} {rec['wall'] * 1000:>10.1f} "
+                f"{rec['wall'] / total * 100:>6.1f} {rec['allocated'] / 1024:>11.1f} "
+                f"{rec['peak'] / 1024:>10.1f}"
+            )
+        return "\n".join(lines)
+
+
+class SamplingProfiler:
+    """
+    Low-overhead stack sampler for the calling thread.
+
+    Writes collapsed stacks ("frame;frame;frame count" per line), the input
+    format of flamegraph.pl and speedscope.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._target_id: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._target_id = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def dump(self, output_file: str):
+        with open(output_file, "w", encoding="utf-8") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+    def summary_table(self, limit: int = 20) -> str:
+        """Return the functions with the most samples on top of the stack."""
+        total = sum(self.samples.values()) or 1
+        self_counts: Counter = Counter()
+        for stack, count in self.samples.items():
+            self_counts[stack.rsplit(";", 1)[-1]] += count
+        lines = [f"{'Function':<60} {'Samples':>8} {'%':>6}", "-" * 76]
+        for func, count in self_counts.most_common(limit):
+            lines.append(f"{func:<60} {count:>8} {count / total * 100:>6.1f}")
+        return "\n".join(lines)
+
+
+def default_profile_output(output_file: str, mode: str) -> str:
+    """Derive the profile file name from the run's output file."""
+    base = os.path.splitext(output_file)[0]
+    return f"{base}.prof" if mode == "cprofile" else f"{base}.collapsed"
+
+
+def run_profiled(func: Callable, mode: str, output_file: str,
+                 target: Any = None, section_names: Optional[List[str]] = None,
+                 limit: int = 25) -> Any:
+    """
+    Run func under the requested profiler and print summary tables.
+
+    Args:
+        func: Zero-argument callable to profile
+        mode: "cprofile" (function-level) or "sample" (stack sampling)
+        output_file: Where to write the profile (.prof for cProfile, collapsed stacks for sample)
+        target: Optional instance whose section methods are timed
+        section_names: Method names on target to time individually
+        limit: Number of functions in the printed summary
+
+    Returns:
+        Whatever func returns
+    """
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Unknown profile mode: {mode}")
+
+    sections = SectionProfiler()
+    if target is not None and section_names:
+        sections.instrument(target, section_names)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            result = func()
+        finally:
+            profiler.disable()
+    else:
+        profiler = SamplingProfiler()
+        profiler.start()
+        try:
+            result = func()
+        finally:
+            profiler.stop()
+    wall = time.perf_counter() - start
+    peak = max(tracemalloc.get_traced_memory()[1], sections.peak_seen)
+    tracemalloc.stop()
+
+    print("\n⏱️ Profile Summary")
+    print("=" * 60)
+    print(f"Total wall time: {wall * 1000:.1f} ms, peak traced memory: {peak / 1024:.1f} KB")
+    if sections.records:
+        print()
+        print(sections.summary_table())
+    print()
+    if mode == "cprofile":
+        profiler.dump_stats(output_file)
+        pstats.Stats(profiler, stream=sys.stdout).sort_stats("cumulative").print_stats(limit)
+        print(f"✅ cProfile data saved to: {output_file} (open with snakeviz or pstats)")
+    else:
+        profiler.dump(output_file)
+        print(profiler.summary_table(limit))
+        print(f"\n✅ Collapsed stacks saved to: {output_file} (open with speedscope or flamegraph.pl)")
+
+    return result
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Synthetic Curriculum Generator
+===============================
+Build curricula of arbitrary size that follow templates/bootcamp_schema.json,
+for benchmarking the DOCX exporter beyond real-world file sizes: 1-104
+weeks, up to thousands of learning outcomes and bullets. Text is taken from
+the template (numbered to stay unique), so string lengths stay realistic.
+"""
+
+import os
+import sys
+import json
+import copy
+import random
+from typing import Any, Dict, List, Optional
+
+from ai_to_json import BootcampAIGenerator
+
+# Fix encoding for Windows
+if sys.stdout:
+    try:
+        sys.stdout.reconfigure(encoding="utf-8")
+    except:
+        pass
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PARENT_DIR = os.path.dirname(BASE_DIR)
+TEMPLATE_FILE = os.path.join(PARENT_DIR, 'templates', 'bootcamp_schema.json')
+
+# Named sizes: weeks, learning outcomes, assessment rows, bullets per list
+SIZES = {
+    "xs": {"weeks": 1, "learning_outcomes": 3, "assessments": 2, "bullets": 3},
+    "s": {"weeks": 8, "learning_outcomes": 8, "assessments": 5, "bullets": 5},
+    "m": {"weeks": 26, "learning_outcomes": 60, "assessments": 10, "bullets": 10},
+    "l": {"weeks": 52, "learning_outcomes": 300, "assessments": 25, "bullets": 20},
+    "xl": {"weeks": 104, "learning_outcomes": 2000, "assessments": 50, "bullets": 40},
+}
+
+
+def load_template(path: str = TEMPLATE_FILE) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _numbered(items: List[str], count: int, label: str = "") -> List[str]:
+    """Cycle through template strings, numbering repeats so every entry is unique."""
+    result = []
+    for i in range(count):
+        text = items[i % len(items)]
+        round_num = i // len(items)
+        result.append(f"{text} ({label}{round_num + 1})" if round_num else text)
+    return result
+
+
+def generate_curriculum(weeks: int = 8, learning_outcomes: Optional[int] = None,
+                        assessments: Optional[int] = None, bullets: int = 5,
+                        seed: int = 0, template: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Build a synthetic curriculum with the template's structure.
+
+    Args:
+        weeks: Number of minggu entries (mingguKe 1..weeks)
+        learning_outcomes: Number of LOs (default: weeks // 2 + 3)
+        assessments: Assessment rows (default: template count); bobot sums to 100
+        bullets: Entries per bullet list (materiPokok, kriteria, deliverables)
+        seed: Random seed for LO references
+        template: Schema template (default: templates/bootcamp_schema.json)
+
+    Returns:
+        Curriculum dict, ready for BootcampToDocx
+    """
+    template = template or load_template()
+    rng = random.Random(seed)
+    learning_outcomes = learning_outcomes or weeks // 2 + 3
+    assessments = assessments or len(template['assessment'])
+    data = copy.deepcopy(template)
+
+    data['identitas'] = dict(template['identitas'], kode=f"SYN-{weeks}W-{learning_outcomes}LO", durasi=weeks)
+
+    categories = [lo['kategori'] for lo in template['learningOutcomes']]
+    statements = [lo['pernyataan'] for lo in template['learningOutcomes']]
+    data['learningOutcomes'] = [
+        {"kode": f"LO-{i + 1}", "pernyataan": statement, "kategori": categories[i % len(categories)]}
+        for i, statement in enumerate(_numbered(statements, learning_outcomes, "varian "))
+    ]
+    codes = [lo['kode'] for lo in data['learningOutcomes']]
+
+    week_templates = template['minggu']
+    week_weights = BootcampAIGenerator.distribute_weights(
+        [w['penilaian']['bobot'] for w in (week_templates[i % len(week_templates)] for i in range(weeks))]
+    )
+    data['minggu'] = []
+    for i in range(weeks):
+        base = copy.deepcopy(week_templates[i % len(week_templates)])
+        # Spread the LOs over the weeks so every code is covered at least once
+        refs = codes[i::weeks] or [rng.choice(codes)]
+        week = dict(base, mingguKe=i + 1,
+                    learningOutcomes=list(dict.fromkeys(refs + rng.sample(codes, min(2, len(codes))))))
+        week['tema'] = f"{base['tema']} ({i + 1})" if i >= len(week_templates) else base['tema']
+        week['materiPokok'] = _numbered(base['materiPokok'], bullets)
+        week['penilaian'] = dict(base['penilaian'], bobot=week_weights[i])
+        if 'project' in base:
+            week['project'] = dict(base['project'], deliverables=_numbered(base['project']['deliverables'], bullets))
+        data['minggu'].append(week)
+
+    assessment_templates = template['assessment']
+    assessment_weights = BootcampAIGenerator.distribute_weights(
+        [assessment_templates[i % len(assessment_templates)]['bobot'] for i in range(assessments)]
+    )
+    data['assessment'] = []
+    for i in range(assessments):
+        base = assessment_templates[i % len(assessment_templates)]
+        name = base['nama'] if i < len(assessment_templates) else f"{base['nama']} ({i + 1})"
+        data['assessment'].append(dict(base, nama=name, bobot=assessment_weights[i],
+                                       learningOutcomes=rng.sample(codes, min(3, len(codes))),
+                                       kriteria=_numbered(base['kriteria'], bullets)))
+
+    data['referensi'] = _numbered(template['referensi'], max(bullets, len(template['referensi'])))
+    return data
+
+
+def generate_size(size: str, seed: int = 0, template: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Curriculum for a named size (see SIZES)."""
+    if size not in SIZES:
+        raise ValueError(f"Unknown size '{size}' (expected one of {', '.join(SIZES)})")
+    return generate_curriculum(seed=seed, template=template, **SIZES[size])
+
+
+# Standalone usage
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate a synthetic curriculum JSON")
+    parser.add_argument("--size", choices=list(SIZES), default=None,
+                        help="Named size (overrides --weeks/--los/--assessments/--bullets)")
+    parser.add_argument("--weeks", type=int, default=8, help="Number of weeks (1-104)")
+    parser.add_argument("--los", type=int, default=None, help="Number of learning outcomes")
+    parser.add_argument("--assessments", type=int, default=None, help="Number of assessment rows")
+    parser.add_argument("--bullets", type=int, default=5, help="Entries per bullet list")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", "-o", default="synthetic_curriculum.json", help="Output JSON file")
+
+    args = parser.parse_args()
+
+    if args.size:
+        data = generate_size(args.size, args.seed)
+    else:
+        data = generate_curriculum(args.weeks, args.los, args.assessments, args.bullets, args.seed)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    print(f"✅ Synthetic curriculum saved to: {args.output}")
+    print(f"   - Weeks: {len(data['minggu'])}, LOs: {len(data['learningOutcomes'])}, "
+          f"assessments: {len(data['assessment'])}, size: {os.path.getsize(args.output) / 1024:.0f} KB")